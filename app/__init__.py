@@ -1,5 +1,16 @@
-from flask import Flask
+import os
+
+import click
+from flask import Flask, current_app
+from flask.cli import with_appcontext
+from jinja2 import ChoiceLoader, FileSystemBytecodeCache, ModuleLoader
+
 from config import config_map
+from app.utils.cache import cache_dir
+from app.utils.calculations import format_currency, format_number, format_percent
+
+# Large report templates compiled at startup so the first request skips it
+_WARM_TEMPLATES = ("results.html", "financing.html", "report.html", "rus_201.html", "lpo_xvii.html")
 
 
 def create_app(config_name="development"):
@@ -16,4 +27,52 @@ def create_app(config_name="development"):
     app.register_blueprint(analysis_bp, url_prefix="/analysis")
     app.register_blueprint(report_bp, url_prefix="/report")
 
+    _configure_templates(app)
+    app.cli.add_command(compile_templates_command)
+
     return app
+
+
+def _configure_templates(app):
+    """
+    Persist compiled templates under the bankability cache root (see
+    app.utils.cache.cache_dir) so restarted workers skip parsing, then
+    compile the report templates up front.
+    """
+    app.add_template_filter(format_currency, "currency")
+    app.add_template_filter(format_percent, "percent")
+    app.add_template_filter(format_number, "number")
+
+    directory = cache_dir("jinja")
+    if directory is not None:
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            pass  # Unwritable cache root: compile in memory only
+        else:
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+
+    compiled = app.config.get("COMPILED_TEMPLATES_DIR")
+    if compiled and os.path.isdir(compiled):
+        # Templates missing from the compiled set still load from source
+        app.jinja_env.loader = ChoiceLoader([ModuleLoader(compiled), app.jinja_env.loader])
+
+    for name in _WARM_TEMPLATES:
+        app.jinja_env.get_template(name)
+
+
+@click.command("compile-templates")
+@click.argument("target", required=False)
+@with_appcontext
+def compile_templates_command(target):
+    """
+    Compile every template to a Python module under TARGET (default:
+    COMPILED_TEMPLATES_DIR). Rerun after editing templates.
+    """
+    target = target or current_app.config.get("COMPILED_TEMPLATES_DIR")
+    if not target:
+        raise click.UsageError("Pass a TARGET directory or set COMPILED_TEMPLATES_DIR.")
+    # Compile from the template sources even when a compiled set is loaded
+    env = current_app.jinja_env.overlay(loader=current_app.create_global_jinja_loader())
+    env.compile_templates(target, zip=None, ignore_errors=False)
+    click.echo(f"Compiled templates written to {target}")
@@ -1,11 +1,21 @@
 from app.analysis.techno_economic import TechnoEconomicAnalysis
-from app.analysis.bankability_score import run_bankability_assessment
+from app.analysis.bankability_score import (
+    ASSESSMENT_STAGES,
+    run_bankability_assessment,
+    run_bankability_assessment_from_dict,
+    run_bankability_assessment_from_params,
+    score_portfolio,
+)
 from app.analysis.sensitivity import SensitivityAnalysis
 from app.analysis.cash_flow import CashFlowAnalysis
 
 __all__ = [
     "TechnoEconomicAnalysis",
+    "ASSESSMENT_STAGES",
     "run_bankability_assessment",
+    "run_bankability_assessment_from_dict",
+    "run_bankability_assessment_from_params",
+    "score_portfolio",
     "SensitivityAnalysis",
     "CashFlowAnalysis",
 ]
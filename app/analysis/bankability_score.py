@@ -2,49 +2,152 @@
 Top-level convenience function to run a full bankability assessment.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from app.models.project import ProjectParameters
 from app.models.scoring import BankabilityScorer
 from app.analysis.techno_economic import TechnoEconomicAnalysis
 from app.analysis.sensitivity import SensitivityAnalysis
+from app.utils.calculations import format_label
+
+
+ASSESSMENT_STAGES = frozenset({"score", "techno_economic", "sensitivity"})
+
+_PARAMS_LOADERS = {
+    dict: ProjectParameters.from_dict,
+    ProjectParameters: lambda params: params,
+}
 
 
-def run_bankability_assessment(project_data):
+def run_bankability_assessment(project_data, include=ASSESSMENT_STAGES, executor=None):
     """
     Run a complete bankability assessment from a project data dictionary.
 
     Returns a dictionary containing the bankability score, financial model
     results, credit assessment, techno-economic analysis, and sensitivity
-    analysis.
+    analysis. Pass a subset of ASSESSMENT_STAGES as include to compute only
+    those stages; project_info is always returned. Pass a caller-owned
+    concurrent.futures executor to spread the stages and sensitivity cases
+    over it.
     """
-    if isinstance(project_data, dict):
-        params = ProjectParameters.from_dict(project_data)
-    elif isinstance(project_data, ProjectParameters):
-        params = project_data
-    else:
-        raise ValueError("project_data must be a dict or ProjectParameters instance")
+    loader = _PARAMS_LOADERS.get(type(project_data))
+    if loader is None:
+        # Subclasses of the supported types fall back to isinstance checks
+        if isinstance(project_data, dict):
+            loader = _PARAMS_LOADERS[dict]
+        elif isinstance(project_data, ProjectParameters):
+            loader = _PARAMS_LOADERS[ProjectParameters]
+        else:
+            raise ValueError("project_data must be a dict or ProjectParameters instance")
+    return run_bankability_assessment_from_params(loader(project_data), include, executor)
+
 
-    scorer = BankabilityScorer(params)
-    bankability_result = scorer.score()
+def run_bankability_assessment_from_dict(data, include=ASSESSMENT_STAGES):
+    """Run a complete bankability assessment from a project data dictionary."""
+    return run_bankability_assessment_from_params(ProjectParameters.from_dict(data), include)
 
-    techno_econ = TechnoEconomicAnalysis(params)
-    te_results = techno_econ.analyze()
 
-    sensitivity = SensitivityAnalysis(params)
-    sensitivity_results = sensitivity.run_standard_cases()
+def run_bankability_assessment_from_params(params, include=ASSESSMENT_STAGES, executor=None):
+    """
+    Run a complete bankability assessment on an already-built
+    ProjectParameters instance, skipping input type dispatch. Intended for
+    batch callers that construct parameters once and assess many times;
+    such callers can pass one long-lived executor, which then runs the
+    stages and the sensitivity cases side by side. Without one the stages
+    run one after another in this thread.
+    """
+    stages = [(name, stage) for name, stage in _STAGE_RUNNERS if name in include]
+    if executor is None:
+        results = {name: stage(params) for name, stage in stages}
+        if "sensitivity" in include:
+            results["sensitivity"] = _run_sensitivity_cases(params)
+    else:
+        # The stages only read params. Queue every task before waiting on
+        # any, and never from inside a task, so a small pool cannot deadlock.
+        futures = {name: executor.submit(stage, params) for name, stage in stages}
+        sensitivity = _run_sensitivity_cases(params, executor) if "sensitivity" in include else None
+        results = {name: future.result() for name, future in futures.items()}
+        if sensitivity is not None:
+            results["sensitivity"] = sensitivity
 
-    output = bankability_result.to_dict()
-    output["techno_economic"] = te_results
-    output["sensitivity"] = sensitivity_results
+    output = dict(results["score"].shallow_items()) if "score" in results else {}
+    if "techno_economic" in results:
+        output["techno_economic"] = results["techno_economic"]
+    if "sensitivity" in results:
+        output["sensitivity"] = results["sensitivity"]
+    p = params
+    t = p.technical
+    county = p.location_county
+    state = p.location_state
     output["project_info"] = {
-        "name": params.project_name,
-        "id": params.project_id,
-        "stage": params.project_stage,
-        "entity_type": params.entity_type,
-        "location": f"{params.location_county}, {params.location_state}" if params.location_county else params.location_state,
-        "technology": params.technical.technology_type.replace("_", " ").title(),
-        "capacity_mw": params.technical.nameplate_capacity_mw,
-        "total_cost": params.financial.total_project_cost,
-        "description": params.description,
+        "name": p.project_name,
+        "id": p.project_id,
+        "stage": p.project_stage,
+        "entity_type": p.entity_type,
+        "location": f"{county}, {state}" if county else state,
+        "technology": format_label(t.technology_type),
+        "capacity_mw": t.nameplate_capacity_mw,
+        "total_cost": p.financial.total_project_cost,
+        "description": p.description,
     }
 
     return output
+
+
+def score_portfolio(param_list, n_jobs=-1, detail="full"):
+    """
+    Serialized bankability scores for many projects, in input order. Pass
+    detail="summary" for screening views that only need scores and grades.
+
+    Projects are independent, so they are scored across worker processes;
+    n_jobs=-1 uses one worker per CPU and n_jobs=1 scores in this process.
+    Process start-up dominates for a handful of projects, so prefer n_jobs=1
+    (or BankabilityScorer.score_batch) for small portfolios.
+    """
+    param_list = list(param_list)
+    if n_jobs == 1 or len(param_list) <= 1:
+        return [_score_to_dict(params, detail) for params in param_list]
+
+    workers = (os.cpu_count() or 1) if n_jobs is None or n_jobs < 1 else n_jobs
+    workers = min(workers, len(param_list))
+    # Hand each worker a few chunks so pickling overhead stays amortized
+    chunksize = max(1, len(param_list) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            _score_to_dict, param_list, repeat(detail, len(param_list)), chunksize=chunksize,
+        ))
+
+
+def _score_to_dict(params, detail="full"):
+    return BankabilityScorer(params).score().to_dict(detail)
+
+
+def _score_stage(params):
+    return BankabilityScorer(params).score()
+
+
+def _techno_economic_stage(params):
+    return TechnoEconomicAnalysis(params).analyze()
+
+
+_STAGE_RUNNERS = (
+    ("score", _score_stage),
+    ("techno_economic", _techno_economic_stage),
+)
+
+
+def _run_sensitivity_cases(params, executor=None):
+    """
+    Evaluate the standard sensitivity cases. Each case is a vectorized sweep
+    that runs in milliseconds, so by default they run in this process; a
+    pool per call would cost more to start than the work itself. A
+    caller-owned executor is reused as given and never shut down here.
+    """
+    if executor is None:
+        return SensitivityAnalysis(params).run_standard_cases()
+
+    cases = SensitivityAnalysis.list_standard_cases()
+    results = executor.map(SensitivityAnalysis.evaluate_case, repeat(params, len(cases)), cases)
+    return {case[0]: result for case, result in zip(cases, results)}
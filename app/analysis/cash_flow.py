@@ -2,9 +2,57 @@
 Cash flow analysis and waterfall construction for energy infrastructure projects.
 """
 
+from operator import attrgetter
+
+import numpy as np
+
 from app.models.financial import FinancialModel
 
 
+# Whole-dollar columns of the annual summary table, in output order
+_SUMMARY_DOLLAR_FIELDS = attrgetter(
+    "revenue", "opex", "net_operating_income", "debt_service", "depreciation",
+    "tax_credit", "tax_expense", "net_income", "free_cash_flow_equity",
+    "cumulative_cash_flow",
+)
+
+
+# Waterfall steps from revenue to free cash flow, as (label, type)
+_WATERFALL_STEPS = (
+    ("Revenue", "positive"),
+    ("Operating Expenses", "negative"),
+    ("Net Operating Income", "subtotal"),
+    ("Interest", "negative"),
+    ("Principal", "negative"),
+    ("Cash After Debt Service", "subtotal"),
+    ("Tax Credit", "positive"),
+    ("Taxes", "negative"),
+    ("Free Cash Flow to Equity", "total"),
+)
+_TAXES_STEP = [label for label, _ in _WATERFALL_STEPS].index("Taxes")
+
+
+def _waterfall_amounts(cf):
+    """Signed amounts for _WATERFALL_STEPS except Taxes, in the same order."""
+    return (
+        cf.revenue, -cf.opex, cf.net_operating_income, -cf.interest_payment,
+        -cf.principal_payment, cf.cash_flow_after_debt, cf.tax_credit,
+        cf.free_cash_flow_equity,
+    )
+
+
+def _dscr_cell(dscr):
+    return round(dscr, 2) if dscr != float("inf") else 999.99
+
+
+def _round_dollars(rows):
+    """
+    Round a list of equal-length rows to whole dollars in one call; np.round
+    to 0 decimals matches round(x, 0).
+    """
+    return np.round(np.array(rows, dtype=np.float64), 0).tolist()
+
+
 class CashFlowAnalysis:
     """
     Provides detailed cash flow analysis with waterfall breakdowns,
@@ -14,27 +62,37 @@ class CashFlowAnalysis:
     def __init__(self, project_params):
         self.params = project_params
         self.model = FinancialModel(project_params)
+        self._pro_forma = None
+
+    def _get_pro_forma(self):
+        """The model's pro forma, built on first use and shared by every view."""
+        if self._pro_forma is None:
+            self._pro_forma = self.model.build_pro_forma()
+        return self._pro_forma
+
+    def invalidate(self):
+        """Discard the cached pro forma after changing the project parameters."""
+        self._pro_forma = None
 
     def generate_waterfall(self):
         """Build a cash flow waterfall showing each step from revenue to free cash flow."""
-        summary = self.model.build_pro_forma()
-        waterfall_years = []
-
-        for cf in summary.annual_cash_flows:
-            waterfall_years.append({
+        summary = self._get_pro_forma()
+        flows = summary.annual_cash_flows
+        dollars = _round_dollars([_waterfall_amounts(cf) for cf in flows])
+        for cf, amounts in zip(flows, dollars):
+            # Rounded on its own: a year with no tax keeps the integer 0 that
+            # max() returns, which an array would turn into 0.0
+            amounts.insert(_TAXES_STEP, round(-max(cf.tax_expense, 0), 0))
+        waterfall_years = [
+            {
                 "year": cf.year,
                 "steps": [
-                    {"label": "Revenue", "amount": round(cf.revenue, 0), "type": "positive"},
-                    {"label": "Operating Expenses", "amount": round(-cf.opex, 0), "type": "negative"},
-                    {"label": "Net Operating Income", "amount": round(cf.net_operating_income, 0), "type": "subtotal"},
-                    {"label": "Interest", "amount": round(-cf.interest_payment, 0), "type": "negative"},
-                    {"label": "Principal", "amount": round(-cf.principal_payment, 0), "type": "negative"},
-                    {"label": "Cash After Debt Service", "amount": round(cf.cash_flow_after_debt, 0), "type": "subtotal"},
-                    {"label": "Tax Credit", "amount": round(cf.tax_credit, 0), "type": "positive"},
-                    {"label": "Taxes", "amount": round(-max(cf.tax_expense, 0), 0), "type": "negative"},
-                    {"label": "Free Cash Flow to Equity", "amount": round(cf.free_cash_flow_equity, 0), "type": "total"},
+                    {"label": label, "amount": amount, "type": kind}
+                    for (label, kind), amount in zip(_WATERFALL_STEPS, amounts)
                 ],
-            })
+            }
+            for cf, amounts in zip(flows, dollars)
+        ]
 
         return {
             "waterfall": waterfall_years,
@@ -50,41 +108,49 @@ class CashFlowAnalysis:
 
     def debt_schedule(self):
         """Generate the full debt amortization schedule."""
-        summary = self.model.build_pro_forma()
-        schedule = []
-        for cf in summary.annual_cash_flows:
-            if cf.year <= self.params.financial.debt_tenor_years:
-                schedule.append({
-                    "year": cf.year,
-                    "beginning_balance": round(
-                        cf.outstanding_debt + cf.principal_payment, 0
-                    ),
-                    "interest": round(cf.interest_payment, 0),
-                    "principal": round(cf.principal_payment, 0),
-                    "total_payment": round(cf.debt_service, 0),
-                    "ending_balance": round(cf.outstanding_debt, 0),
-                    "dscr": round(cf.dscr, 2) if cf.dscr != float("inf") else 999.99,
-                })
+        summary = self._get_pro_forma()
+        tenor = self.params.financial.debt_tenor_years
+        flows = [cf for cf in summary.annual_cash_flows if cf.year <= tenor]
+        dollars = _round_dollars([
+            (cf.outstanding_debt + cf.principal_payment, cf.interest_payment,
+             cf.principal_payment, cf.debt_service, cf.outstanding_debt)
+            for cf in flows
+        ])
+        schedule = [
+            {
+                "year": cf.year,
+                "beginning_balance": beginning,
+                "interest": interest,
+                "principal": principal,
+                "total_payment": payment,
+                "ending_balance": ending,
+                "dscr": _dscr_cell(cf.dscr),
+            }
+            for cf, (beginning, interest, principal, payment, ending) in zip(flows, dollars)
+        ]
 
         return schedule
 
     def annual_summary_table(self):
         """Generate a comprehensive annual summary table."""
-        summary = self.model.build_pro_forma()
+        summary = self._get_pro_forma()
+        flows = summary.annual_cash_flows
+        dollars = _round_dollars([_SUMMARY_DOLLAR_FIELDS(cf) for cf in flows])
         table = []
-        for cf in summary.annual_cash_flows:
+        for cf, (revenue, opex, noi, debt_service, depreciation, tax_credit, tax_expense,
+                 net_income, fcfe, cumulative) in zip(flows, dollars):
             table.append({
                 "year": cf.year,
-                "revenue": round(cf.revenue, 0),
-                "opex": round(cf.opex, 0),
-                "noi": round(cf.net_operating_income, 0),
-                "debt_service": round(cf.debt_service, 0),
-                "dscr": round(cf.dscr, 2) if cf.dscr != float("inf") else 999.99,
-                "depreciation": round(cf.depreciation, 0),
-                "tax_credit": round(cf.tax_credit, 0),
-                "tax_expense": round(cf.tax_expense, 0),
-                "net_income": round(cf.net_income, 0),
-                "fcfe": round(cf.free_cash_flow_equity, 0),
-                "cumulative_cf": round(cf.cumulative_cash_flow, 0),
+                "revenue": revenue,
+                "opex": opex,
+                "noi": noi,
+                "debt_service": debt_service,
+                "dscr": _dscr_cell(cf.dscr),
+                "depreciation": depreciation,
+                "tax_credit": tax_credit,
+                "tax_expense": tax_expense,
+                "net_income": net_income,
+                "fcfe": fcfe,
+                "cumulative_cf": cumulative,
             })
         return table
@@ -4,6 +4,9 @@ Evaluates how key financial metrics respond to changes in critical assumptions.
 """
 
 import copy
+
+import numpy as np
+
 from app.models.financial import FinancialModel
 
 
@@ -49,60 +52,89 @@ class SensitivityAnalysis:
         },
     ]
 
+    # Inputs _sweep_metrics can vary as arrays; any other attribute is
+    # evaluated through FinancialModel.build_pro_forma() one variation at a time.
+    _VECTORIZED_INPUTS = frozenset({
+        ("financial", "total_project_cost"),
+        ("financial", "annual_revenue"),
+        ("financial", "annual_opex"),
+        ("financial", "interest_rate"),
+        ("technical", "annual_generation_mwh"),
+    })
+
     def __init__(self, project_params):
         self.base_params = project_params
 
     def run_standard_cases(self):
         """Run sensitivity analysis for all standard parameters."""
         results = {}
-        for param_config in self.SENSITIVITY_PARAMETERS:
-            results[param_config["name"]] = self._run_single_parameter(param_config)
+        for case in self.list_standard_cases():
+            results[case[0]] = self.evaluate_case(self.base_params, case)
         return results
 
-    def _run_single_parameter(self, param_config):
-        """Run sensitivity for one parameter across its variation range."""
-        variations = param_config.get("variations", self.DEFAULT_VARIATION_RANGE)
+    @classmethod
+    def list_standard_cases(cls):
+        """
+        List the standard sensitivity cases as (case_name, param_config, variations)
+        tuples. Each case is independent and can be evaluated in a separate process.
+        """
+        return [
+            (param_config["name"], param_config,
+             param_config.get("variations", cls.DEFAULT_VARIATION_RANGE))
+            for param_config in cls.SENSITIVITY_PARAMETERS
+        ]
+
+    @classmethod
+    def evaluate_case(cls, params, case):
+        """
+        Run sensitivity for one case across its variation range.
+
+        For the inputs in _VECTORIZED_INPUTS all variations are evaluated
+        together: the swept input becomes a NumPy array and the pro forma is
+        broadcast across it, so only the year-by-year debt amortization
+        remains a Python loop. Other inputs rebuild the full pro forma for
+        each variation.
+        """
+        _, param_config, variations = case
         section_name, attr_name = param_config["attribute_path"]
         unit = param_config["unit"]
 
-        section = getattr(self.base_params, section_name)
+        section = getattr(params, section_name)
         base_value = getattr(section, attr_name)
 
-        cases = []
+        labels = []
+        new_values = []
         for var in variations:
-            params_copy = copy.deepcopy(self.base_params)
-            section_copy = getattr(params_copy, section_name)
-
             if unit == "percent_change":
-                new_value = base_value * (1 + var)
-                label = f"{var:+.0%}"
+                new_values.append(base_value * (1 + var))
+                labels.append(f"{var:+.0%}")
             else:
-                new_value = base_value + var
+                new_values.append(base_value + var)
                 if "rate" in attr_name:
-                    label = f"{var * 100:+.1f}%"
+                    labels.append(f"{var * 100:+.1f}%")
                 else:
-                    label = f"{var:+.2f}"
+                    labels.append(f"{var:+.2f}")
 
-            setattr(section_copy, attr_name, new_value)
-
-            # Recalculate debt-related fields if capex changed
-            if attr_name == "total_project_cost":
-                section_copy.total_hard_costs = params_copy.financial.total_hard_costs * (1 + var)
-
-            model = FinancialModel(params_copy)
-            summary = model.build_pro_forma()
+        if (section_name, attr_name) in cls._VECTORIZED_INPUTS:
+            metrics = cls._sweep_metrics(params, section_name, attr_name, np.array(new_values, dtype=float))
+            metrics = {key: values.tolist() for key, values in metrics.items()}
+        else:
+            metrics = cls._pro_forma_metrics(params, section_name, attr_name, new_values)
 
+        cases = []
+        for i, var in enumerate(variations):
             cases.append({
                 "variation": var,
-                "label": label,
+                "label": labels[i],
                 "base_value": round(base_value, 2),
-                "adjusted_value": round(new_value, 2),
-                "min_dscr": round(summary.minimum_dscr, 3),
-                "avg_dscr": round(summary.average_dscr, 3),
-                "irr_project": round(summary.irr_project * 100, 2),
-                "npv_project": round(summary.npv_project, 0),
-                "lcoe": round(summary.lcoe, 2),
-                "payback_years": round(summary.payback_years, 1),
+                "adjusted_value": round(new_values[i], 2),
+                "min_dscr": round(metrics["minimum_dscr"][i], 3),
+                "avg_dscr": round(metrics["average_dscr"][i], 3),
+                "irr_project": round(metrics["irr_project"][i] * 100, 2),
+                "npv_project": round(metrics["npv_project"][i], 0),
+                "lcoe": round(metrics["lcoe"][i], 2),
+                "payback_years": (round(metrics["payback_years"][i], 1) if metrics["payback_found"][i]
+                                  else params.technical.expected_useful_life_years),
             })
 
         return {
@@ -112,6 +144,182 @@ class SensitivityAnalysis:
             "cases": cases,
         }
 
+    @staticmethod
+    def _pro_forma_metrics(params, section_name, attr_name, values):
+        """Per-variation metrics from FinancialModel, in _sweep_metrics' layout."""
+        metrics = {key: [] for key in (
+            "minimum_dscr", "average_dscr", "irr_project", "npv_project",
+            "lcoe", "payback_years", "payback_found",
+        )}
+        for value in values:
+            params_copy = copy.deepcopy(params)
+            section = getattr(params_copy, section_name)
+            setattr(section, attr_name, value)
+            section.invalidate()
+            summary = FinancialModel(params_copy).build_pro_forma()
+            metrics["minimum_dscr"].append(summary.minimum_dscr)
+            metrics["average_dscr"].append(summary.average_dscr)
+            metrics["irr_project"].append(summary.irr_project)
+            metrics["npv_project"].append(summary.npv_project)
+            metrics["lcoe"].append(summary.lcoe)
+            metrics["payback_years"].append(summary.payback_years)
+            metrics["payback_found"].append(True)
+        return metrics
+
+    @staticmethod
+    def _sweep_metrics(params, section_name, attr_name, values):
+        """
+        Vectorized equivalent of FinancialModel.build_pro_forma() for the
+        project-level metrics reported by a sensitivity case, with one
+        input replaced by an array of swept values. Rows are variations,
+        columns are project years.
+
+        Hard costs only feed depreciation and equity cash flows, which the
+        sensitivity cases do not report, so they are not swept with capex.
+        Raises ValueError for inputs outside _VECTORIZED_INPUTS.
+        """
+        if (section_name, attr_name) not in SensitivityAnalysis._VECTORIZED_INPUTS:
+            raise ValueError(f"Cannot sweep {section_name}.{attr_name} with the vectorized pro forma")
+
+        fp = params.financial
+        tp = params.technical
+        inputs = {
+            "financial": {
+                "total_project_cost": fp.total_project_cost,
+                "annual_revenue": fp.annual_revenue,
+                "annual_opex": fp.annual_opex,
+                "interest_rate": fp.interest_rate,
+            },
+            "technical": {
+                "annual_generation_mwh": tp.annual_generation_mwh,
+            },
+        }
+        inputs[section_name][attr_name] = values
+        n_cases = values.shape[0]
+
+        def column(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), (n_cases,))[:, None]
+
+        total_cost = column(inputs["financial"]["total_project_cost"])
+        revenue_base = column(inputs["financial"]["annual_revenue"])
+        opex_base = column(inputs["financial"]["annual_opex"])
+        rate = column(inputs["financial"]["interest_rate"])
+        generation = column(inputs["technical"]["annual_generation_mwh"])
+
+        life = tp.expected_useful_life_years
+        tenor = fp.debt_tenor_years
+        years = np.arange(1, life + 1, dtype=float)
+
+        # Debt sizing and level annual payment (FinancialParameters.annual_debt_service)
+        debt_amount = total_cost * fp.debt_percent
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth = (1 + rate) ** tenor
+            payment = debt_amount * (rate * growth) / (growth - 1)
+        payment = np.where(rate == 0, debt_amount / tenor if tenor > 0 else 0.0, payment)
+        payment = np.where((debt_amount <= 0) | (tenor <= 0), 0.0, payment)
+
+        degradation = (1 - tp.degradation_rate_annual) ** (years - 1)
+        revenue = revenue_base * (1 + fp.revenue_escalation) ** (years - 1) * degradation
+        opex = opex_base * (1 + fp.annual_opex_escalation) ** (years - 1)
+        noi = revenue - opex
+
+        # Amortization is sequential across years but vectorized across cases
+        debt_service = np.zeros((n_cases, life))
+        balance = debt_amount[:, 0].copy()
+        payment_col = payment[:, 0]
+        rate_col = rate[:, 0]
+        for idx in range(min(life, tenor)):
+            active = balance > 0
+            interest = balance * rate_col
+            principal = np.minimum(payment_col - interest, balance)
+            debt_service[:, idx] = np.where(active, interest + principal, 0.0)
+            balance = np.where(active, balance - principal, balance)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dscr = np.where(debt_service > 0, noi / debt_service,
+                            np.where(noi > 0, np.inf, 0.0))
+        valid = np.isfinite(dscr) & (dscr > 0)
+        has_valid = valid.any(axis=1)
+        valid_count = np.maximum(valid.sum(axis=1), 1)
+        average_dscr = np.where(has_valid, np.where(valid, dscr, 0.0).sum(axis=1) / valid_count, 0.0)
+        minimum_dscr = np.where(has_valid, np.where(valid, dscr, np.inf).min(axis=1), 0.0)
+
+        # Unlevered payback with fractional final year
+        cumulative = np.cumsum(noi, axis=1)
+        reached = cumulative >= total_cost
+        payback_found = reached.any(axis=1)
+        first = np.argmax(reached, axis=1)
+        rows = np.arange(n_cases)
+        first_noi = noi[rows, first]
+        overshoot = cumulative[rows, first] - total_cost[:, 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.where(first_noi > 0, 1.0 - overshoot / first_noi, 1.0)
+        payback_years = np.where(payback_found, first + fraction, float(life))
+
+        project_cfs = np.hstack([-total_cost, noi])
+        discount_rate = fp.discount_rate
+        if discount_rate < 0:
+            npv_project = np.zeros(n_cases)
+        else:
+            npv_project = (project_cfs / (1 + discount_rate) ** np.arange(life + 1)).sum(axis=1)
+
+        irr_project = SensitivityAnalysis._irr_batch(project_cfs)
+
+        # LCOE on discounted costs over discounted generation
+        discount = (1 + discount_rate) ** years
+        discounted_gen = (generation * degradation * (1 / discount)).sum(axis=1)
+        discounted_costs = total_cost[:, 0] + (opex / discount).sum(axis=1)
+        total_generation = (generation * degradation).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lcoe = np.where((total_generation > 0) & (discounted_gen > 0),
+                            discounted_costs / discounted_gen, 0.0)
+
+        return {
+            "minimum_dscr": minimum_dscr,
+            "average_dscr": average_dscr,
+            "irr_project": irr_project,
+            "npv_project": npv_project,
+            "lcoe": lcoe,
+            "payback_years": payback_years,
+            "payback_found": payback_found,
+        }
+
+    @staticmethod
+    def _irr_batch(cash_flows, max_iterations=200, tolerance=1e-7):
+        """Row-wise Newton-Raphson IRR matching FinancialModel._compute_irr."""
+        n_rows, n_periods = cash_flows.shape
+        result = np.zeros(n_rows)
+        if n_periods < 2:
+            return result
+
+        periods = np.arange(n_periods)
+        guess = np.full(n_rows, 0.10)
+        active = cash_flows.sum(axis=1) > 0
+        for _ in range(max_iterations):
+            if not active.any():
+                break
+            factor = (1 + guess[:, None]) ** periods
+            npv = (cash_flows / factor).sum(axis=1)
+            d_npv = -(periods[1:] * cash_flows[:, 1:] / (1 + guess[:, None]) ** (periods[1:] + 1)).sum(axis=1)
+
+            stalled = active & (np.abs(d_npv) < 1e-15)
+            result[stalled] = guess[stalled]
+            active &= ~stalled
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                new_guess = guess - npv / d_npv
+            new_guess = np.where(new_guess < -0.99, -0.5, new_guess)
+            new_guess = np.where(new_guess > 10.0, 5.0, new_guess)
+
+            converged = active & (np.abs(new_guess - guess) < tolerance)
+            result[converged] = new_guess[converged]
+            active &= ~converged
+
+            guess = np.where(active, new_guess, guess)
+
+        result[active] = guess[active]
+        return result
+
     def run_custom_scenario(self, overrides):
         """
         Run a custom scenario with multiple parameter overrides.
@@ -128,6 +336,7 @@ class SensitivityAnalysis:
                 section = getattr(params_copy, section_name, None)
                 if section and hasattr(section, attr_name):
                     setattr(section, attr_name, value)
+                    section.invalidate()
 
         model = FinancialModel(params_copy)
         summary = model.build_pro_forma()
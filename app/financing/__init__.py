@@ -1,9 +1,27 @@
-from app.financing.structures import FinancingStructureBuilder
-from app.financing.rus_form_201 import RUSForm201Generator
-from app.financing.doe_lpo_title_xvii import LPOTitleXVIIGenerator
-
-__all__ = [
-    "FinancingStructureBuilder",
-    "RUSForm201Generator",
-    "LPOTitleXVIIGenerator",
-]
+"""
+Financing structures and federal program application generators. Each
+export is imported on first access.
+"""
+
+import importlib
+
+_EXPORT_MODULES = {
+    "FinancingStructureBuilder": "app.financing.structures",
+    "RUSForm201Generator": "app.financing.rus_form_201",
+    "LPOTitleXVIIGenerator": "app.financing.doe_lpo_title_xvii",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+def __getattr__(name):
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    export = getattr(importlib.import_module(module), name)
+    globals()[name] = export
+    return export
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
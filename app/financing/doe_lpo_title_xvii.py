@@ -8,7 +8,8 @@ Reference: Energy Policy Act of 2005, Title XVII (42 U.S.C. 16511-16514)
            Innovative Technologies
 """
 
-from datetime import date
+from app.utils.calculations import format_label as _pretty, today_iso
+from app.utils.frozen import freeze
 
 
 ELIGIBLE_CATEGORIES = {
@@ -50,6 +51,283 @@ ELIGIBLE_CATEGORIES = {
     },
 }
 
+# Read-only snapshot of each category, shared by every report
+_FROZEN_CATEGORIES = {cat: freeze(entry) for cat, entry in ELIGIBLE_CATEGORIES.items()}
+
+# Technology type -> resolved frozen category entry
+_TECH_TO_CATEGORY = {
+    tech: _FROZEN_CATEGORIES[cat]
+    for tech, cat in {
+        "solar_pv": "renewable_energy",
+        "onshore_wind": "renewable_energy",
+        "offshore_wind": "renewable_energy",
+        "geothermal": "renewable_energy",
+        "hydro_small": "renewable_energy",
+        "biomass": "renewable_energy",
+        "battery_storage": "energy_storage",
+        "solar_plus_storage": "energy_storage",
+        "microgrids": "grid_modernization",
+        "grid_modernization": "grid_modernization",
+        "transmission_line": "grid_modernization",
+        "distribution_upgrade": "grid_modernization",
+        "substation": "grid_modernization",
+        "natural_gas_peaker": "fossil_energy",
+        "combined_cycle": "fossil_energy",
+    }.items()
+}
+
+
+# Technologies generally treated as innovative for Title XVII purposes
+_INNOVATIVE_TECHS = frozenset({
+    "battery_storage", "offshore_wind", "geothermal",
+    "solar_plus_storage", "microgrids", "grid_modernization",
+})
+
+# Static application sections. These do not depend on the project and are
+# shared across generator instances, so they are frozen and handed to every
+# report as read-only views.
+_PART_II_TEMPLATE = freeze({
+    "section_title": "Part II: Full Application",
+    "description": (
+        "The Part II application is a comprehensive submission required "
+        "after LPO invites the applicant to proceed. It includes detailed "
+        "technical, financial, legal, and environmental documentation."
+    ),
+    "required_elements": {
+        "detailed_project_description": {
+            "description": "Complete technical description of the project",
+            "status": "[To be prepared]",
+            "contents": [
+                "Engineering design documents and specifications",
+                "Equipment procurement strategy and supplier information",
+                "Construction plan and timeline",
+                "Site description and site control documentation",
+                "Interconnection studies and agreements",
+                "Technology performance data and warranties",
+            ],
+        },
+        "financial_model": {
+            "description": "Detailed financial model with assumptions",
+            "status": "[To be prepared]",
+            "contents": [
+                "Base case pro forma financial projections",
+                "Sensitivity analysis on key variables",
+                "Capital structure and sources/uses",
+                "Revenue projections and offtake agreements",
+                "Operating cost projections",
+                "Tax analysis including ITC/PTC/depreciation",
+                "Debt sizing and DSCR calculations",
+            ],
+        },
+        "credit_analysis": {
+            "description": "Credit assessment for the guarantee",
+            "status": "[To be prepared]",
+            "contents": [
+                "Borrower credit history and financial statements",
+                "Counterparty credit analysis",
+                "Collateral description and valuation",
+                "Insurance program description",
+                "Risk factor analysis and mitigants",
+            ],
+        },
+        "legal_documentation": {
+            "description": "Legal structure and documentation",
+            "status": "[To be prepared]",
+            "contents": [
+                "Corporate structure and organizational documents",
+                "Material project contracts (EPC, O&M, PPA)",
+                "Site control documents (lease/purchase agreements)",
+                "Permits and regulatory approvals",
+                "Title and survey reports",
+            ],
+        },
+        "independent_engineer_report": {
+            "description": "Third-party technical assessment",
+            "status": "[To be commissioned]",
+            "contents": [
+                "Technology assessment and risk evaluation",
+                "Construction cost and schedule review",
+                "Performance projections review",
+                "O&M plan assessment",
+                "Equipment supplier evaluation",
+            ],
+        },
+        "market_study": {
+            "description": "Independent market and resource assessment",
+            "status": "[To be commissioned]",
+            "contents": [
+                "Resource assessment (solar, wind, etc.)",
+                "Market price analysis",
+                "Competitive landscape assessment",
+                "Grid interconnection and curtailment analysis",
+            ],
+        },
+    },
+})
+
+
+_ENV_REQUIREMENTS = freeze({
+    "section_title": "Environmental Review Requirements",
+    "description": (
+        "DOE must complete a National Environmental Policy Act (NEPA) "
+        "review before issuing a loan guarantee. The applicant is "
+        "responsible for providing environmental data and supporting "
+        "the review process."
+    ),
+    "nepa_process": {
+        "categorical_exclusion": (
+            "May apply to small modifications to existing facilities "
+            "with minimal environmental impact."
+        ),
+        "environmental_assessment": (
+            "Required for most projects. Results in a Finding of No "
+            "Significant Impact (FONSI) or requirement for an EIS."
+        ),
+        "environmental_impact_statement": (
+            "Required for projects with potentially significant "
+            "environmental impacts."
+        ),
+    },
+    "required_environmental_data": [
+        "Biological resources survey (threatened/endangered species)",
+        "Cultural resources survey (Section 106 compliance)",
+        "Wetlands delineation",
+        "Phase I Environmental Site Assessment",
+        "Air quality impact analysis",
+        "Water resources assessment",
+        "Noise impact assessment",
+        "Visual impact assessment",
+        "Environmental justice analysis (Executive Order 12898)",
+        "Community engagement documentation",
+    ],
+})
+
+
+_COMPLIANCE_REQUIREMENTS = freeze({
+    "section_title": "Compliance Requirements",
+    "requirements": [
+        {
+            "requirement": "Davis-Bacon Act",
+            "description": ("Workers on the project must be paid prevailing wages "
+                            "as determined by the Department of Labor."),
+            "applicability": "All construction activities",
+        },
+        {
+            "requirement": "Buy America / Build America, Buy America Act",
+            "description": ("Iron, steel, manufactured products, and construction "
+                            "materials must be produced in the United States, subject "
+                            "to waivers."),
+            "applicability": "Procurement of materials and equipment",
+        },
+        {
+            "requirement": "National Environmental Policy Act (NEPA)",
+            "description": "Environmental review must be completed before financial close.",
+            "applicability": "Project-wide",
+        },
+        {
+            "requirement": "Section 106 (Historic Preservation)",
+            "description": ("Consultation with State Historic Preservation Officer "
+                            "regarding potential impacts to cultural resources."),
+            "applicability": "Project site and surrounding area",
+        },
+        {
+            "requirement": "Community Benefits Plan",
+            "description": ("DOE requires a plan addressing workforce development, "
+                            "community engagement, and equity considerations."),
+            "applicability": "Project-wide",
+        },
+        {
+            "requirement": "Reporting Requirements",
+            "description": ("Quarterly construction progress reports and annual "
+                            "operational reports to DOE during the guarantee term."),
+            "applicability": "Construction and operations phases",
+        },
+    ],
+})
+
+
+# Fixed fees on either side of the project-specific credit subsidy cost
+_APPLICATION_FEES = freeze((
+    {
+        "fee": "Application Fee (Part I)",
+        "amount": "$75,000",
+        "timing": "Due with Part I submission",
+        "refundable": False,
+    },
+    {
+        "fee": "Application Fee (Part II)",
+        "amount": "Up to $350,000",
+        "timing": "Due with Part II submission",
+        "refundable": False,
+    },
+))
+
+_GUARANTEE_TERM_FEES = freeze((
+    {
+        "fee": "Facility Fee",
+        "amount": "Negotiated (typically 25-100 bps annually on outstanding balance)",
+        "timing": "Ongoing during guarantee term",
+        "refundable": False,
+    },
+    {
+        "fee": "Maintenance Fee",
+        "amount": "Negotiated",
+        "timing": "Annual during guarantee term",
+        "refundable": False,
+    },
+))
+
+_FEE_SCHEDULE_NOTE = (
+    "Fees are subject to change. Applicants should confirm current "
+    "fee schedules with the LPO before submission."
+)
+
+_INNOVATION_NARRATIVES = {
+    "battery_storage": (
+        "The project deploys grid-scale energy storage technology that "
+        "provides critical grid balancing services and enables higher "
+        "penetration of variable renewable energy resources."
+    ),
+    "offshore_wind": (
+        "The project advances offshore wind energy deployment in U.S. waters, "
+        "employing technology and installation methods that have limited "
+        "commercial deployment domestically."
+    ),
+    "solar_plus_storage": (
+        "The project integrates solar generation with battery storage to "
+        "provide dispatchable renewable energy, addressing intermittency "
+        "challenges through innovative system design."
+    ),
+    "geothermal": (
+        "The project employs enhanced or advanced geothermal systems that "
+        "extend geothermal energy production beyond conventional "
+        "hydrothermal resource areas."
+    ),
+    "microgrids": (
+        "The project deploys an advanced microgrid system with islanding "
+        "capability, intelligent load management, and integration of "
+        "multiple distributed energy resources."
+    ),
+    "grid_modernization": (
+        "The project implements advanced grid technologies including "
+        "digital controls, sensors, and communications systems that "
+        "significantly improve grid reliability and resilience."
+    ),
+}
+
+_DEFAULT_INNOVATION_NARRATIVE = (
+    "[Describe how the project's technology represents a new or "
+    "significantly improved technology that is not yet in widespread "
+    "commercial use in the United States.]"
+)
+
+_DESC_TEMPLATE = (
+    "Proposed {capacity_str} {tech} project located in {location_str}. "
+    "The project will generate approximately {generation:,.0f} MWh "
+    "annually with an expected capacity factor of {capacity_factor_str}. "
+    "{description}"
+)
+
 
 class LPOTitleXVIIGenerator:
     """
@@ -58,63 +336,88 @@ class LPOTitleXVIIGenerator:
     (full application) requirements.
     """
 
+    __slots__ = (
+        "params", "fp", "tp", "financial_summary", "credit_assessment",
+        "_guarantee_amount", "_subsidy_low", "_subsidy_high", "_guarantee_amount_str",
+        "_format_cache", "_tech_pretty", "_application",
+    )
+
     def __init__(self, project_params, financial_summary=None, credit_assessment=None):
         self.params = project_params
         self.fp = project_params.financial
         self.tp = project_params.technical
         self.financial_summary = financial_summary
         self.credit_assessment = credit_assessment
+        self._application = None
 
-    def generate(self):
-        """Build the full LPO application data structure."""
-        return {
-            "application_metadata": self._metadata(),
-            "part_i_pre_application": self._part_i(),
-            "part_ii_full_application": self._part_ii(),
-            "credit_assessment_summary": self._credit_summary(),
-            "environmental_requirements": self._environmental_requirements(),
-            "compliance_requirements": self._compliance_requirements(),
-            "application_fees": self._fee_schedule(),
-            "eligibility_assessment": self._eligibility_assessment(),
+        # Guarantee covers 80% of project cost; credit subsidy runs 1-5% of it
+        self._guarantee_amount = self.fp.total_project_cost * 0.80
+        self._subsidy_low = self._guarantee_amount * 0.01
+        self._subsidy_high = self._guarantee_amount * 0.05
+        self._guarantee_amount_str = f"${self._guarantee_amount:,.0f}"
+        self._tech_pretty = _pretty(self.tp.technology_type)
+
+        # Display strings shared by Part I, the credit summary, the fee
+        # schedule, the project description and the eligibility assessment
+        self._format_cache = {
+            "total_cost_str": f"${self.fp.total_project_cost:,.0f}",
+            "debt_str": f"${self.fp.debt_amount:,.0f}",
+            "equity_str": f"${self.fp.equity_amount:,.0f}",
+            "leverage_str": f"{self.fp.leverage_ratio:.0%}",
+            "dscr_str": f"{self.fp.dscr:.2f}x",
+            "capacity_str": f"{self.tp.nameplate_capacity_mw:.1f} MW",
+            "capacity_factor_str": f"{self.tp.capacity_factor:.1%}",
+            "location_str": (f"{self.params.location_county or '[County]'}, "
+                             f"{self.params.location_state or '[State]'}"),
+            "subsidy_low_str": f"${self._subsidy_low:,.0f}",
+            "subsidy_high_str": f"${self._subsidy_high:,.0f}",
         }
+        if credit_assessment:
+            ca = credit_assessment
+            self._format_cache.update({
+                "pod_pct": f"{ca.probability_of_default:.2%}",
+                "lgd_pct": f"{ca.loss_given_default:.0%}",
+                "el_pct": f"{ca.expected_loss_rate:.2%}",
+                "spread_bps_str": f"{ca.credit_spread_bps} bps",
+            })
+
+    def generate(self):
+        """
+        Build the full LPO application data structure.
+
+        The application is assembled once per generator instance; repeated
+        calls return the same dict.
+        """
+        if self._application is None:
+            self._application = {
+                "application_metadata": self._metadata(),
+                "part_i_pre_application": self._part_i(),
+                "part_ii_full_application": self._part_ii(),
+                "credit_assessment_summary": self._credit_summary(),
+                "environmental_requirements": self._environmental_requirements(),
+                "compliance_requirements": self._compliance_requirements(),
+                "application_fees": self._fee_schedule(),
+                "eligibility_assessment": self._eligibility_assessment(),
+            }
+        return self._application
 
     def _metadata(self):
         return {
             "program": "DOE Loan Programs Office -- Title XVII Innovative Energy Loan Guarantee",
             "statutory_authority": "Energy Policy Act of 2005, Title XVII (42 U.S.C. 16511-16514)",
             "regulatory_reference": "10 CFR Part 609",
-            "date_prepared": date.today().isoformat(),
+            "date_prepared": today_iso(),
             "project_name": self.params.project_name or "[Project Name]",
-            "applicant": self.params.entity_type.replace("_", " ").title(),
+            "applicant": _pretty(self.params.entity_type),
             "technology_category": self._identify_category(),
         }
 
     def _identify_category(self):
-        tech = self.tp.technology_type
-        category_map = {
-            "solar_pv": "renewable_energy",
-            "onshore_wind": "renewable_energy",
-            "offshore_wind": "renewable_energy",
-            "geothermal": "renewable_energy",
-            "hydro_small": "renewable_energy",
-            "biomass": "renewable_energy",
-            "battery_storage": "energy_storage",
-            "solar_plus_storage": "energy_storage",
-            "microgrids": "grid_modernization",
-            "grid_modernization": "grid_modernization",
-            "transmission_line": "grid_modernization",
-            "distribution_upgrade": "grid_modernization",
-            "substation": "grid_modernization",
-            "natural_gas_peaker": "fossil_energy",
-            "combined_cycle": "fossil_energy",
-        }
-        cat_key = category_map.get(tech, "renewable_energy")
-        return ELIGIBLE_CATEGORIES.get(cat_key, ELIGIBLE_CATEGORIES["renewable_energy"])
+        return _TECH_TO_CATEGORY.get(self.tp.technology_type, _FROZEN_CATEGORIES["renewable_energy"])
 
     def _part_i(self):
         """Part I: Pre-Application (initial screening by LPO)."""
-        guarantee_amount = self.fp.total_project_cost * 0.80
-
+        fmt = self._format_cache
         return {
             "section_title": "Part I: Pre-Application",
             "description": (
@@ -127,31 +430,30 @@ class LPOTitleXVIIGenerator:
                     "project_name": self.params.project_name or "[Project Name]",
                     "project_description": self._project_description(),
                     "applicant_name": "[Legal Entity Name]",
-                    "applicant_type": self.params.entity_type.replace("_", " ").title(),
-                    "location": f"{self.params.location_county or '[County]'}, "
-                                f"{self.params.location_state or '[State]'}",
-                    "total_project_cost": f"${self.fp.total_project_cost:,.0f}",
-                    "guarantee_amount_requested": f"${guarantee_amount:,.0f}",
+                    "applicant_type": _pretty(self.params.entity_type),
+                    "location": fmt["location_str"],
+                    "total_project_cost": fmt["total_cost_str"],
+                    "guarantee_amount_requested": self._guarantee_amount_str,
                     "guarantee_percent": "80%",
                     "estimated_jobs_construction": "[Number]",
                     "estimated_jobs_permanent": "[Number]",
                 },
                 "technology_description": {
-                    "technology_type": self.tp.technology_type.replace("_", " ").title(),
-                    "capacity": f"{self.tp.nameplate_capacity_mw:.1f} MW",
+                    "technology_type": self._tech_pretty,
+                    "capacity": fmt["capacity_str"],
                     "innovation_narrative": self._innovation_narrative(),
                     "technology_readiness_level": self.tp.technology_readiness_level,
                     "prior_commercial_deployment": "[Description of prior deployments]",
-                    "performance_basis": f"Capacity factor: {self.tp.capacity_factor:.1%}",
+                    "performance_basis": f"Capacity factor: {fmt['capacity_factor_str']}",
                     "key_technology_risks": "[Identified technology-specific risks]",
                 },
                 "financial_overview": {
-                    "total_project_cost": f"${self.fp.total_project_cost:,.0f}",
-                    "debt_amount": f"${self.fp.debt_amount:,.0f}",
-                    "equity_amount": f"${self.fp.equity_amount:,.0f}",
-                    "leverage_ratio": f"{self.fp.leverage_ratio:.0%}",
-                    "projected_dscr": f"{self.fp.dscr:.2f}x",
-                    "revenue_source": self.params.credit.offtake_type.replace("_", " ").title(),
+                    "total_project_cost": fmt["total_cost_str"],
+                    "debt_amount": fmt["debt_str"],
+                    "equity_amount": fmt["equity_str"],
+                    "leverage_ratio": fmt["leverage_str"],
+                    "projected_dscr": fmt["dscr_str"],
+                    "revenue_source": _pretty(self.params.credit.offtake_type),
                     "offtake_agreement_status": "[Executed/In Negotiation/Planned]",
                     "equity_commitment_status": "[Committed/In Discussion/Uncommitted]",
                 },
@@ -167,87 +469,11 @@ class LPOTitleXVIIGenerator:
 
     def _part_ii(self):
         """Part II: Full Application (detailed due diligence package)."""
-        return {
-            "section_title": "Part II: Full Application",
-            "description": (
-                "The Part II application is a comprehensive submission required "
-                "after LPO invites the applicant to proceed. It includes detailed "
-                "technical, financial, legal, and environmental documentation."
-            ),
-            "required_elements": {
-                "detailed_project_description": {
-                    "description": "Complete technical description of the project",
-                    "status": "[To be prepared]",
-                    "contents": [
-                        "Engineering design documents and specifications",
-                        "Equipment procurement strategy and supplier information",
-                        "Construction plan and timeline",
-                        "Site description and site control documentation",
-                        "Interconnection studies and agreements",
-                        "Technology performance data and warranties",
-                    ],
-                },
-                "financial_model": {
-                    "description": "Detailed financial model with assumptions",
-                    "status": "[To be prepared]",
-                    "contents": [
-                        "Base case pro forma financial projections",
-                        "Sensitivity analysis on key variables",
-                        "Capital structure and sources/uses",
-                        "Revenue projections and offtake agreements",
-                        "Operating cost projections",
-                        "Tax analysis including ITC/PTC/depreciation",
-                        "Debt sizing and DSCR calculations",
-                    ],
-                },
-                "credit_analysis": {
-                    "description": "Credit assessment for the guarantee",
-                    "status": "[To be prepared]",
-                    "contents": [
-                        "Borrower credit history and financial statements",
-                        "Counterparty credit analysis",
-                        "Collateral description and valuation",
-                        "Insurance program description",
-                        "Risk factor analysis and mitigants",
-                    ],
-                },
-                "legal_documentation": {
-                    "description": "Legal structure and documentation",
-                    "status": "[To be prepared]",
-                    "contents": [
-                        "Corporate structure and organizational documents",
-                        "Material project contracts (EPC, O&M, PPA)",
-                        "Site control documents (lease/purchase agreements)",
-                        "Permits and regulatory approvals",
-                        "Title and survey reports",
-                    ],
-                },
-                "independent_engineer_report": {
-                    "description": "Third-party technical assessment",
-                    "status": "[To be commissioned]",
-                    "contents": [
-                        "Technology assessment and risk evaluation",
-                        "Construction cost and schedule review",
-                        "Performance projections review",
-                        "O&M plan assessment",
-                        "Equipment supplier evaluation",
-                    ],
-                },
-                "market_study": {
-                    "description": "Independent market and resource assessment",
-                    "status": "[To be commissioned]",
-                    "contents": [
-                        "Resource assessment (solar, wind, etc.)",
-                        "Market price analysis",
-                        "Competitive landscape assessment",
-                        "Grid interconnection and curtailment analysis",
-                    ],
-                },
-            },
-        }
+        return _PART_II_TEMPLATE
 
     def _credit_summary(self):
         """Format credit assessment data for LPO requirements."""
+        fmt = self._format_cache
         data = {
             "section_title": "Credit Assessment Summary",
             "credit_subsidy_estimation": {
@@ -258,10 +484,10 @@ class LPOTitleXVIIGenerator:
                     "perspective."
                 ),
                 "typical_range": "1% to 5% of the guarantee amount",
-                "estimated_guarantee_amount": f"${self.fp.total_project_cost * 0.80:,.0f}",
+                "estimated_guarantee_amount": self._guarantee_amount_str,
                 "estimated_subsidy_range": {
-                    "low": f"${self.fp.total_project_cost * 0.80 * 0.01:,.0f}",
-                    "high": f"${self.fp.total_project_cost * 0.80 * 0.05:,.0f}",
+                    "low": fmt["subsidy_low_str"],
+                    "high": fmt["subsidy_high_str"],
                 },
             },
         }
@@ -271,149 +497,43 @@ class LPOTitleXVIIGenerator:
             data["project_credit_metrics"] = {
                 "equivalent_rating": ca.credit_rating_equivalent,
                 "risk_category": ca.risk_category,
-                "probability_of_default": f"{ca.probability_of_default:.2%}",
-                "loss_given_default": f"{ca.loss_given_default:.0%}",
-                "expected_loss_rate": f"{ca.expected_loss_rate:.2%}",
-                "credit_spread": f"{ca.credit_spread_bps} bps",
+                "probability_of_default": fmt["pod_pct"],
+                "loss_given_default": fmt["lgd_pct"],
+                "expected_loss_rate": fmt["el_pct"],
+                "credit_spread": fmt["spread_bps_str"],
             }
 
         return data
 
     def _environmental_requirements(self):
-        return {
-            "section_title": "Environmental Review Requirements",
-            "description": (
-                "DOE must complete a National Environmental Policy Act (NEPA) "
-                "review before issuing a loan guarantee. The applicant is "
-                "responsible for providing environmental data and supporting "
-                "the review process."
-            ),
-            "nepa_process": {
-                "categorical_exclusion": (
-                    "May apply to small modifications to existing facilities "
-                    "with minimal environmental impact."
-                ),
-                "environmental_assessment": (
-                    "Required for most projects. Results in a Finding of No "
-                    "Significant Impact (FONSI) or requirement for an EIS."
-                ),
-                "environmental_impact_statement": (
-                    "Required for projects with potentially significant "
-                    "environmental impacts."
-                ),
-            },
-            "required_environmental_data": [
-                "Biological resources survey (threatened/endangered species)",
-                "Cultural resources survey (Section 106 compliance)",
-                "Wetlands delineation",
-                "Phase I Environmental Site Assessment",
-                "Air quality impact analysis",
-                "Water resources assessment",
-                "Noise impact assessment",
-                "Visual impact assessment",
-                "Environmental justice analysis (Executive Order 12898)",
-                "Community engagement documentation",
-            ],
-        }
+        return _ENV_REQUIREMENTS
 
     def _compliance_requirements(self):
-        return {
-            "section_title": "Compliance Requirements",
-            "requirements": [
-                {
-                    "requirement": "Davis-Bacon Act",
-                    "description": ("Workers on the project must be paid prevailing wages "
-                                    "as determined by the Department of Labor."),
-                    "applicability": "All construction activities",
-                },
-                {
-                    "requirement": "Buy America / Build America, Buy America Act",
-                    "description": ("Iron, steel, manufactured products, and construction "
-                                    "materials must be produced in the United States, subject "
-                                    "to waivers."),
-                    "applicability": "Procurement of materials and equipment",
-                },
-                {
-                    "requirement": "National Environmental Policy Act (NEPA)",
-                    "description": "Environmental review must be completed before financial close.",
-                    "applicability": "Project-wide",
-                },
-                {
-                    "requirement": "Section 106 (Historic Preservation)",
-                    "description": ("Consultation with State Historic Preservation Officer "
-                                    "regarding potential impacts to cultural resources."),
-                    "applicability": "Project site and surrounding area",
-                },
-                {
-                    "requirement": "Community Benefits Plan",
-                    "description": ("DOE requires a plan addressing workforce development, "
-                                    "community engagement, and equity considerations."),
-                    "applicability": "Project-wide",
-                },
-                {
-                    "requirement": "Reporting Requirements",
-                    "description": ("Quarterly construction progress reports and annual "
-                                    "operational reports to DOE during the guarantee term."),
-                    "applicability": "Construction and operations phases",
-                },
-            ],
-        }
+        return _COMPLIANCE_REQUIREMENTS
 
     def _fee_schedule(self):
-        guarantee_amount = self.fp.total_project_cost * 0.80
+        fmt = self._format_cache
+        credit_subsidy_fee = {
+            "fee": "Credit Subsidy Cost",
+            "amount": f"Estimated {fmt['subsidy_low_str']} to {fmt['subsidy_high_str']}",
+            "timing": "Due at financial close",
+            "refundable": False,
+        }
         return {
             "section_title": "Application and Facility Fees",
-            "fees": [
-                {
-                    "fee": "Application Fee (Part I)",
-                    "amount": "$75,000",
-                    "timing": "Due with Part I submission",
-                    "refundable": False,
-                },
-                {
-                    "fee": "Application Fee (Part II)",
-                    "amount": "Up to $350,000",
-                    "timing": "Due with Part II submission",
-                    "refundable": False,
-                },
-                {
-                    "fee": "Credit Subsidy Cost",
-                    "amount": f"Estimated ${guarantee_amount * 0.01:,.0f} to ${guarantee_amount * 0.05:,.0f}",
-                    "timing": "Due at financial close",
-                    "refundable": False,
-                },
-                {
-                    "fee": "Facility Fee",
-                    "amount": "Negotiated (typically 25-100 bps annually on outstanding balance)",
-                    "timing": "Ongoing during guarantee term",
-                    "refundable": False,
-                },
-                {
-                    "fee": "Maintenance Fee",
-                    "amount": "Negotiated",
-                    "timing": "Annual during guarantee term",
-                    "refundable": False,
-                },
-            ],
-            "note": (
-                "Fees are subject to change. Applicants should confirm current "
-                "fee schedules with the LPO before submission."
-            ),
+            "fees": [*_APPLICATION_FEES, credit_subsidy_fee, *_GUARANTEE_TERM_FEES],
+            "note": _FEE_SCHEDULE_NOTE,
         }
 
     def _eligibility_assessment(self):
         assessments = []
         tech = self.tp.technology_type
 
-        innovative_techs = [
-            "battery_storage", "offshore_wind", "geothermal",
-            "solar_plus_storage", "microgrids", "grid_modernization",
-        ]
-        if tech in innovative_techs:
+        if tech in _INNOVATIVE_TECHS:
             assessments.append({
                 "criterion": "Innovative Technology",
                 "status": "Likely Eligible",
-                "detail": (f"{tech.replace('_', ' ').title()} is generally considered to employ "
+                "detail": (f"{self._tech_pretty} is generally considered to employ "
                            f"new or significantly improved technology for Title XVII purposes."),
             })
         else:
@@ -430,7 +550,7 @@ class LPOTitleXVIIGenerator:
             assessments.append({
                 "criterion": "Project Scale",
                 "status": "Likely Sufficient",
-                "detail": f"Project cost of ${self.fp.total_project_cost:,.0f} exceeds typical minimum scale.",
+                "detail": f"Project cost of {self._format_cache['total_cost_str']} exceeds typical minimum scale.",
             })
         else:
             assessments.append({
@@ -444,7 +564,7 @@ class LPOTitleXVIIGenerator:
             assessments.append({
                 "criterion": "Reasonable Prospect of Repayment",
                 "status": "Supported",
-                "detail": f"DSCR of {self.fp.dscr:.2f}x indicates sufficient cash flow coverage.",
+                "detail": f"DSCR of {self._format_cache['dscr_str']} indicates sufficient cash flow coverage.",
             })
         else:
             assessments.append({
@@ -465,54 +585,15 @@ class LPOTitleXVIIGenerator:
         }
 
     def _project_description(self):
-        tech = self.tp.technology_type.replace("_", " ")
-        capacity = self.tp.nameplate_capacity_mw
-        return (
-            f"Proposed {capacity:.1f} MW {tech} project located in "
-            f"{self.params.location_county or '[County]'}, "
-            f"{self.params.location_state or '[State]'}. "
-            f"The project will generate approximately {self.tp.annual_generation_mwh:,.0f} MWh "
-            f"annually with an expected capacity factor of {self.tp.capacity_factor:.1%}. "
-            f"{self.params.description or ''}"
-        )
+        fmt = self._format_cache
+        return _DESC_TEMPLATE.format_map({
+            "capacity_str": fmt["capacity_str"],
+            "tech": self.tp.technology_type.replace("_", " "),
+            "location_str": fmt["location_str"],
+            "generation": self.tp.annual_generation_mwh,
+            "capacity_factor_str": fmt["capacity_factor_str"],
+            "description": self.params.description or "",
+        })
 
     def _innovation_narrative(self):
-        tech = self.tp.technology_type
-        narratives = {
-            "battery_storage": (
-                "The project deploys grid-scale energy storage technology that "
-                "provides critical grid balancing services and enables higher "
-                "penetration of variable renewable energy resources."
-            ),
-            "offshore_wind": (
-                "The project advances offshore wind energy deployment in U.S. waters, "
-                "employing technology and installation methods that have limited "
-                "commercial deployment domestically."
-            ),
-            "solar_plus_storage": (
-                "The project integrates solar generation with battery storage to "
-                "provide dispatchable renewable energy, addressing intermittency "
-                "challenges through innovative system design."
-            ),
-            "geothermal": (
-                "The project employs enhanced or advanced geothermal systems that "
-                "extend geothermal energy production beyond conventional "
-                "hydrothermal resource areas."
-            ),
-            "microgrids": (
-                "The project deploys an advanced microgrid system with islanding "
-                "capability, intelligent load management, and integration of "
-                "multiple distributed energy resources."
-            ),
-            "grid_modernization": (
-                "The project implements advanced grid technologies including "
-                "digital controls, sensors, and communications systems that "
-                "significantly improve grid reliability and resilience."
-            ),
-        }
-        return narratives.get(
-            tech,
-            "[Describe how the project's technology represents a new or "
-            "significantly improved technology that is not yet in widespread "
-            "commercial use in the United States.]"
-        )
+        return _INNOVATION_NARRATIVES.get(self.tp.technology_type, _DEFAULT_INNOVATION_NARRATIVE)
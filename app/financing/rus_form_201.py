@@ -7,7 +7,167 @@ Reference: 7 CFR Part 1710, USDA RUS Bulletin 1710-1
 Form: RUS Form 201 -- Loan Application
 """
 
-from datetime import date
+import json
+from collections.abc import Mapping
+
+from app.utils.calculations import format_label, today_iso
+from app.utils.export import DateEncoder
+from app.utils.frozen import freeze
+
+
+# Static form sections. These do not depend on the project and are shared
+# across generator instances, so they are frozen here. Sections merge their
+# project-specific values over the frozen templates into a fresh dict.
+
+# Placeholder values for every Section A field, in form order. The
+# project-specific fields are overlaid per generator.
+_SECTION_A_FIELDS = freeze({
+    "borrower_name": "[Borrower Legal Name]",
+    "borrower_type": "[Borrower Type]",
+    "state_of_incorporation": "[State]",
+    "principal_office_address": "[Street Address]",
+    "city": "[City]",
+    "state": "[State]",
+    "county": "[County]",
+    "zip_code": "[ZIP]",
+    "contact_name": "[Contact Name]",
+    "contact_title": "[Title]",
+    "contact_phone": "[Phone]",
+    "contact_email": "[Email]",
+    "fiscal_year_end": "December 31",
+    "number_of_consumers_served": "[Number]",
+    "miles_of_line": "[Miles]",
+    "kwh_sold_annually": "[kWh]",
+    "peak_demand_kw": "[kW]",
+})
+
+_SECTION_A_TEMPLATE = freeze({
+    "section_title": "Section A: Borrower Information",
+    "fields": _SECTION_A_FIELDS,
+    "instructions": (
+        "Complete all fields with current borrower information. "
+        "Attach copies of articles of incorporation, bylaws, and "
+        "most recent audited financial statements."
+    ),
+})
+
+_SECTION_G_FIELDS = freeze({
+    "nepa_classification": "[To be determined by RUS]",
+    "environmental_assessment_required": True,
+    "protected_species_review": "[Complete/Pending]",
+    "cultural_resources_review": "[Complete/Pending]",
+    "wetlands_assessment": "[Complete/Pending]",
+    "floodplain_assessment": "[Complete/Pending]",
+})
+
+_SECTION_G_TEMPLATE = freeze({
+    "section_title": "Section G: Environmental Review",
+    "fields": _SECTION_G_FIELDS,
+    "regulatory_reference": "7 CFR Part 1970 -- Environmental Policies and Procedures",
+    "instructions": (
+        "Environmental review must comply with 7 CFR Part 1970. "
+        "RUS will determine the appropriate level of environmental "
+        "review (categorical exclusion, environmental assessment, or EIS) "
+        "upon receipt of the application."
+    ),
+})
+
+_SECTION_H = freeze({
+    "section_title": "Section H: Certifications and Signatures",
+    "certifications": (
+        "The borrower certifies all information is true and complete.",
+        "The borrower is not delinquent on any federal debt.",
+        "The borrower is in compliance with all existing RUS loan covenants.",
+        "The borrower has not been debarred or suspended from federal programs.",
+        "The project serves consumers in an eligible rural area.",
+        "Equal opportunity and civil rights compliance is maintained.",
+    ),
+    "required_signatures": (
+        {"role": "General Manager / CEO", "name": "[Name]", "date": "[Date]"},
+        {"role": "Board President / Chair", "name": "[Name]", "date": "[Date]"},
+        {"role": "Board Secretary", "name": "[Name]", "date": "[Date]"},
+    ),
+    "board_resolution": (
+        "Board resolution authorizing the loan application must be "
+        "attached, including specific authorization for the amount "
+        "requested and designation of authorized signatories."
+    ),
+})
+
+_SUPPORTING_DOCUMENT_TITLES = (
+    "Board resolution authorizing loan application",
+    "Articles of incorporation and bylaws",
+    "Audited financial statements (3 years)",
+    "Current year interim financial statements",
+    "5-year financial forecast (CFC/NRECA format)",
+    "Load forecast and power requirements study",
+    "Engineering feasibility study",
+    "Cost estimates with supporting documentation",
+    "Environmental report (ER)",
+    "Maps showing project location and service area",
+    "Interconnection study/agreement",
+    "Power purchase agreement or rate schedules",
+    "Insurance certificates",
+    "Existing mortgage/loan agreements",
+    "Title search for real property",
+)
+
+_SUPPORTING_DOCUMENTS = freeze({
+    "section_title": "Required Supporting Documents",
+    "checklist": [
+        {"document": title, "status": "[Pending]"} for title in _SUPPORTING_DOCUMENT_TITLES
+    ],
+})
+
+_RUS_ELIGIBLE_ENTITIES = frozenset({
+    "cooperative", "municipal_utility", "tribal_utility", "state_authority",
+})
+
+_NOTE_NOT_RURAL = (
+    "IMPORTANT: RUS eligibility requires the project to serve consumers "
+    "in an eligible rural area as defined by USDA. Verify eligibility "
+    "using the USDA Rural Development eligibility maps before proceeding."
+)
+_NOTE_INELIGIBLE_ENTITY = (
+    "IMPORTANT: The borrower entity type may not be eligible for RUS "
+    "electric program loans. Eligible borrowers typically include "
+    "electric cooperatives, public utility districts, and tribal utilities."
+)
+_NOTE_LOW_DSCR = (
+    "WARNING: Current financial projections show a DSCR below 1.0x, "
+    "indicating insufficient cash flow to cover debt service. This "
+    "would not meet RUS lending standards."
+)
+_NOTE_DISCLAIMER = (
+    "This output is generated as a data template to assist in preparing "
+    "a RUS Form 201 application. It does not constitute a completed "
+    "application and should be reviewed by legal counsel and the borrower's "
+    "RUS General Field Representative before submission."
+)
+
+
+class _LazySections(Mapping):
+    """Read-only mapping that builds each form section on first access."""
+
+    __slots__ = ("_builders", "_built")
+
+    def __init__(self, builders):
+        self._builders = builders
+        self._built = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._built[key]
+        except KeyError:
+            pass
+        value = self._built[key] = self._builders[key]()
+        return value
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
 
 
 class RUSForm201Generator:
@@ -16,26 +176,76 @@ class RUSForm201Generator:
     loan application for rural electric infrastructure projects.
     """
 
+    __slots__ = (
+        "params", "fp", "tp", "financial_summary", "_format_cache", "_tech_name",
+        "_loan_type", "_loan_purpose",
+    )
+
     def __init__(self, project_params, financial_summary=None):
         self.params = project_params
         self.fp = project_params.financial
         self.tp = project_params.technical
         self.financial_summary = financial_summary
+        self._tech_name = self.tp.technology_type.replace("_", " ")
+
+        # Currency strings repeated across sections B, D, E and F
+        fp = self.fp
+        self._format_cache = {
+            "debt_str": f"${fp.debt_amount:,.0f}",
+            "total_cost_str": f"${fp.total_project_cost:,.0f}",
+            "revenue_str": f"${fp.annual_revenue:,.0f}",
+            "opex_str": f"${fp.annual_opex:,.0f}",
+            "noi_str": f"${fp.net_operating_income:,.0f}",
+        }
+
+        # Repeated across the metadata and sections B and C
+        self._loan_type = self._determine_loan_type()
+        self._loan_purpose = self._describe_loan_purpose()
 
     def generate(self):
-        """Build the full Form 201 data structure."""
+        """Build the Form 201 data structure."""
+        return {key: build() for key, build in self._section_builders().items()}
+
+    def sections(self):
+        """
+        Read-only view of the form whose sections are assembled on first
+        access, so callers that only read a few sections skip the rest.
+        """
+        return _LazySections(self._section_builders())
+
+    def to_json_bytes(self):
+        """Serialize the full form to UTF-8 encoded JSON."""
+        return json.dumps(self.generate(), cls=DateEncoder).encode("utf-8")
+
+    def write_json(self, fp):
+        """
+        Stream the form as JSON to a text file object. Each section is
+        built, written and released before the next, so only one section
+        is held in memory at a time. Output matches to_json_bytes().
+        """
+        encoder = DateEncoder()
+        fp.write("{")
+        for i, (key, build) in enumerate(self._section_builders().items()):
+            if i:
+                fp.write(", ")
+            fp.write(f"{encoder.encode(key)}: ")
+            for chunk in encoder.iterencode(build()):
+                fp.write(chunk)
+        fp.write("}")
+
+    def _section_builders(self):
         return {
-            "form_metadata": self._form_metadata(),
-            "section_a_borrower_info": self._section_a(),
-            "section_b_loan_request": self._section_b(),
-            "section_c_project_description": self._section_c(),
-            "section_d_cost_estimates": self._section_d(),
-            "section_e_financial_information": self._section_e(),
-            "section_f_economic_feasibility": self._section_f(),
-            "section_g_environmental": self._section_g(),
-            "section_h_certifications": self._section_h(),
-            "supporting_documents": self._supporting_documents(),
-            "eligibility_notes": self._eligibility_notes(),
+            "form_metadata": self._form_metadata,
+            "section_a_borrower_info": self._section_a,
+            "section_b_loan_request": self._section_b,
+            "section_c_project_description": self._section_c,
+            "section_d_cost_estimates": self._section_d,
+            "section_e_financial_information": self._section_e,
+            "section_f_economic_feasibility": self._section_f,
+            "section_g_environmental": self._section_g,
+            "section_h_certifications": self._section_h,
+            "supporting_documents": self._supporting_documents,
+            "eligibility_notes": self._eligibility_notes,
         }
 
     def _form_metadata(self):
@@ -44,9 +254,9 @@ class RUSForm201Generator:
             "form_title": "Loan Application",
             "program": "USDA Rural Utilities Service -- Electric Program",
             "regulation_reference": "7 CFR Part 1710",
-            "date_prepared": date.today().isoformat(),
+            "date_prepared": today_iso(),
             "application_type": "New Loan",
-            "loan_type": self._determine_loan_type(),
+            "loan_type": self._loan_type,
         }
 
     def _determine_loan_type(self):
@@ -59,47 +269,31 @@ class RUSForm201Generator:
             return "Hardship Rate Loan" if self.params.is_rural else "Standard Rate Loan"
 
     def _section_a(self):
-        return {
-            "section_title": "Section A: Borrower Information",
-            "fields": {
-                "borrower_name": self.params.project_name or "[Borrower Legal Name]",
-                "borrower_type": self.params.entity_type.replace("_", " ").title(),
-                "state_of_incorporation": self.params.location_state or "[State]",
-                "principal_office_address": "[Street Address]",
-                "city": "[City]",
-                "state": self.params.location_state or "[State]",
-                "county": self.params.location_county or "[County]",
-                "zip_code": "[ZIP]",
-                "contact_name": "[Contact Name]",
-                "contact_title": "[Title]",
-                "contact_phone": "[Phone]",
-                "contact_email": "[Email]",
-                "fiscal_year_end": "December 31",
-                "number_of_consumers_served": "[Number]",
-                "miles_of_line": "[Miles]",
-                "kwh_sold_annually": "[kWh]",
-                "peak_demand_kw": "[kW]",
+        p = self.params
+        state = p.location_state or "[State]"
+        return _SECTION_A_TEMPLATE | {
+            "fields": _SECTION_A_FIELDS | {
+                "borrower_name": p.project_name or "[Borrower Legal Name]",
+                "borrower_type": format_label(p.entity_type),
+                "state_of_incorporation": state,
+                "state": state,
+                "county": p.location_county or "[County]",
             },
-            "instructions": (
-                "Complete all fields with current borrower information. "
-                "Attach copies of articles of incorporation, bylaws, and "
-                "most recent audited financial statements."
-            ),
         }
 
     def _section_b(self):
-        loan_amount = self.fp.debt_amount
+        fp = self.fp
         return {
             "section_title": "Section B: Loan Request",
             "fields": {
-                "loan_amount_requested": f"${loan_amount:,.0f}",
-                "loan_amount_numeric": loan_amount,
-                "loan_purpose": self._describe_loan_purpose(),
-                "loan_term_requested_years": min(self.fp.debt_tenor_years, 35),
-                "construction_period_months": self.fp.construction_period_months,
+                "loan_amount_requested": self._format_cache["debt_str"],
+                "loan_amount_numeric": fp.debt_amount,
+                "loan_purpose": self._loan_purpose,
+                "loan_term_requested_years": min(fp.debt_tenor_years, 35),
+                "construction_period_months": fp.construction_period_months,
                 "estimated_first_advance_date": "[Date]",
                 "estimated_completion_date": self.params.cod_target or "[Date]",
-                "interest_rate_preference": self._determine_loan_type(),
+                "interest_rate_preference": self._loan_type,
             },
             "instructions": (
                 "Specify the total loan amount requested and detailed purpose. "
@@ -109,10 +303,9 @@ class RUSForm201Generator:
         }
 
     def _describe_loan_purpose(self):
-        tech = self.tp.technology_type.replace("_", " ")
         capacity = self.tp.nameplate_capacity_mw
         parts = [
-            f"Construction of a {capacity:.1f} MW {tech} facility",
+            f"Construction of a {capacity:.1f} MW {self._tech_name} facility",
             f"located in {self.params.location_county or '[County]'}, "
             f"{self.params.location_state or '[State]'}.",
         ]
@@ -125,8 +318,8 @@ class RUSForm201Generator:
             "section_title": "Section C: Description of Proposed Facilities",
             "fields": {
                 "project_name": self.params.project_name or "[Project Name]",
-                "project_description": self._describe_loan_purpose(),
-                "technology_type": self.tp.technology_type.replace("_", " ").title(),
+                "project_description": self._loan_purpose,
+                "technology_type": format_label(self.tp.technology_type),
                 "nameplate_capacity_mw": self.tp.nameplate_capacity_mw,
                 "expected_annual_generation_mwh": self.tp.annual_generation_mwh,
                 "capacity_factor": f"{self.tp.capacity_factor:.1%}",
@@ -155,41 +348,49 @@ class RUSForm201Generator:
         }
 
     def _section_d(self):
+        fp = self.fp
+        fmt = self._format_cache
+        total_cost = fp.total_project_cost
+        hard_costs = fp.total_hard_costs
+        soft_costs = fp.total_soft_costs
+        contingency_pct = fp.contingency_percent
+        contingency = total_cost * contingency_pct
+        cost_per_kw = total_cost / max(self.tp.nameplate_capacity_mw * 1000, 1)
         return {
             "section_title": "Section D: Cost Estimates",
             "fields": {
-                "total_project_cost": f"${self.fp.total_project_cost:,.0f}",
-                "total_project_cost_numeric": self.fp.total_project_cost,
+                "total_project_cost": fmt["total_cost_str"],
+                "total_project_cost_numeric": total_cost,
                 "cost_breakdown": {
                     "hard_costs": {
                         "label": "Hard Costs (Equipment, Materials, Installation)",
-                        "amount": f"${self.fp.total_hard_costs:,.0f}",
-                        "amount_numeric": self.fp.total_hard_costs,
+                        "amount": f"${hard_costs:,.0f}",
+                        "amount_numeric": hard_costs,
                     },
                     "soft_costs": {
                         "label": "Soft Costs (Engineering, Permitting, Legal)",
-                        "amount": f"${self.fp.total_soft_costs:,.0f}",
-                        "amount_numeric": self.fp.total_soft_costs,
+                        "amount": f"${soft_costs:,.0f}",
+                        "amount_numeric": soft_costs,
                     },
                     "contingency": {
-                        "label": f"Contingency ({self.fp.contingency_percent:.0%})",
-                        "amount": f"${self.fp.total_project_cost * self.fp.contingency_percent:,.0f}",
-                        "amount_numeric": self.fp.total_project_cost * self.fp.contingency_percent,
+                        "label": f"Contingency ({contingency_pct:.0%})",
+                        "amount": f"${contingency:,.0f}",
+                        "amount_numeric": contingency,
                     },
                 },
                 "funding_sources": {
                     "rus_loan": {
                         "label": "RUS Loan Proceeds",
-                        "amount": f"${self.fp.debt_amount:,.0f}",
-                        "percent": f"{self.fp.debt_percent:.0%}",
+                        "amount": fmt["debt_str"],
+                        "percent": f"{fp.debt_percent:.0%}",
                     },
                     "borrower_equity": {
                         "label": "Borrower Equity Contribution",
-                        "amount": f"${self.fp.equity_amount:,.0f}",
-                        "percent": f"{self.fp.equity_percent:.0%}",
+                        "amount": f"${fp.equity_amount:,.0f}",
+                        "percent": f"{fp.equity_percent:.0%}",
                     },
                 },
-                "cost_per_kw": f"${self.fp.total_project_cost / max(self.tp.nameplate_capacity_mw * 1000, 1):,.0f}",
+                "cost_per_kw": f"${cost_per_kw:,.0f}",
             },
             "instructions": (
                 "Provide itemized cost estimates supported by engineering "
@@ -199,23 +400,26 @@ class RUSForm201Generator:
         }
 
     def _section_e(self):
+        fp = self.fp
+        fmt = self._format_cache
+        credit = self.params.credit
+        interest_rate = fp.interest_rate
+        times_interest_earned = fp.net_operating_income / max(fp.debt_amount * interest_rate, 1)
         return {
             "section_title": "Section E: Financial Information",
             "fields": {
-                "annual_revenue_projection": f"${self.fp.annual_revenue:,.0f}",
-                "annual_operating_expenses": f"${self.fp.annual_opex:,.0f}",
-                "net_operating_income": f"${self.fp.net_operating_income:,.0f}",
-                "annual_debt_service": f"${self.fp.annual_debt_service:,.0f}",
-                "debt_service_coverage_ratio": f"{self.fp.dscr:.2f}x",
-                "interest_rate_assumed": f"{self.fp.interest_rate:.2%}",
-                "loan_term_years": self.fp.debt_tenor_years,
-                "revenue_source": self.params.credit.offtake_type.replace("_", " ").title(),
-                "offtake_contract_term": f"{self.params.credit.offtake_tenor_years} years",
+                "annual_revenue_projection": fmt["revenue_str"],
+                "annual_operating_expenses": fmt["opex_str"],
+                "net_operating_income": fmt["noi_str"],
+                "annual_debt_service": f"${fp.annual_debt_service:,.0f}",
+                "debt_service_coverage_ratio": f"{fp.dscr:.2f}x",
+                "interest_rate_assumed": f"{interest_rate:.2%}",
+                "loan_term_years": fp.debt_tenor_years,
+                "revenue_source": format_label(credit.offtake_type),
+                "offtake_contract_term": f"{credit.offtake_tenor_years} years",
                 "rate_schedule_basis": "[Attach current rate schedules]",
-                "current_equity_ratio": f"{1 - self.fp.leverage_ratio:.1%}",
-                "times_interest_earned_ratio": (
-                    f"{self.fp.net_operating_income / max(self.fp.debt_amount * self.fp.interest_rate, 1):.2f}x"
-                ),
+                "current_equity_ratio": f"{1 - fp.leverage_ratio:.1%}",
+                "times_interest_earned_ratio": f"{times_interest_earned:.2f}x",
             },
             "required_attachments": [
                 "Audited financial statements for the past 3 fiscal years",
@@ -233,21 +437,25 @@ class RUSForm201Generator:
         }
 
     def _section_f(self):
+        fp = self.fp
+        tp = self.tp
+        fmt = self._format_cache
+        simple_payback = fp.total_project_cost / max(fp.net_operating_income, 1)
         data = {
             "section_title": "Section F: Economic Feasibility Study",
             "fields": {
                 "cost_benefit_summary": {
-                    "total_project_cost": f"${self.fp.total_project_cost:,.0f}",
-                    "annual_revenue": f"${self.fp.annual_revenue:,.0f}",
-                    "annual_expenses": f"${self.fp.annual_opex:,.0f}",
-                    "annual_net_benefit": f"${self.fp.net_operating_income:,.0f}",
-                    "simple_payback_years": f"{self.fp.total_project_cost / max(self.fp.net_operating_income, 1):.1f}",
+                    "total_project_cost": fmt["total_cost_str"],
+                    "annual_revenue": fmt["revenue_str"],
+                    "annual_expenses": fmt["opex_str"],
+                    "annual_net_benefit": fmt["noi_str"],
+                    "simple_payback_years": f"{simple_payback:.1f}",
                 },
                 "rate_impact_analysis": "[To be completed -- projected impact on consumer rates]",
                 "alternatives_considered": "[Description of alternatives evaluated]",
                 "economic_justification": (
-                    f"The proposed {self.tp.technology_type.replace('_', ' ')} project "
-                    f"provides {self.tp.annual_generation_mwh:,.0f} MWh of annual generation "
+                    f"The proposed {self._tech_name} project "
+                    f"provides {tp.annual_generation_mwh:,.0f} MWh of annual generation "
                     f"at a projected cost that supports continued affordable service to "
                     f"the borrower's membership/customer base."
                 ),
@@ -265,103 +473,30 @@ class RUSForm201Generator:
                 "npv": f"${fs.npv_project:,.0f}",
                 "irr": f"{fs.irr_project:.1%}",
                 "lcoe": f"${fs.lcoe:.2f}/MWh",
-                "lifetime_generation": f"{sum(cf.revenue for cf in fs.annual_cash_flows):,.0f} (total revenue)",
+                "lifetime_generation": f"{fs.total_revenue:,.0f} (total revenue)",
             }
 
         return data
 
     def _section_g(self):
-        return {
-            "section_title": "Section G: Environmental Review",
-            "fields": {
-                "environmental_review_status": (
-                    "Complete" if self.tp.environmental_permits_secured else "Pending"
-                ),
-                "nepa_classification": "[To be determined by RUS]",
-                "environmental_assessment_required": True,
-                "protected_species_review": "[Complete/Pending]",
-                "cultural_resources_review": "[Complete/Pending]",
-                "wetlands_assessment": "[Complete/Pending]",
-                "floodplain_assessment": "[Complete/Pending]",
-            },
-            "regulatory_reference": "7 CFR Part 1970 -- Environmental Policies and Procedures",
-            "instructions": (
-                "Environmental review must comply with 7 CFR Part 1970. "
-                "RUS will determine the appropriate level of environmental "
-                "review (categorical exclusion, environmental assessment, or EIS) "
-                "upon receipt of the application."
-            ),
+        status = "Complete" if self.tp.environmental_permits_secured else "Pending"
+        return _SECTION_G_TEMPLATE | {
+            "fields": {"environmental_review_status": status, **_SECTION_G_FIELDS},
         }
 
     def _section_h(self):
-        return {
-            "section_title": "Section H: Certifications and Signatures",
-            "certifications": [
-                "The borrower certifies all information is true and complete.",
-                "The borrower is not delinquent on any federal debt.",
-                "The borrower is in compliance with all existing RUS loan covenants.",
-                "The borrower has not been debarred or suspended from federal programs.",
-                "The project serves consumers in an eligible rural area.",
-                "Equal opportunity and civil rights compliance is maintained.",
-            ],
-            "required_signatures": [
-                {"role": "General Manager / CEO", "name": "[Name]", "date": "[Date]"},
-                {"role": "Board President / Chair", "name": "[Name]", "date": "[Date]"},
-                {"role": "Board Secretary", "name": "[Name]", "date": "[Date]"},
-            ],
-            "board_resolution": (
-                "Board resolution authorizing the loan application must be "
-                "attached, including specific authorization for the amount "
-                "requested and designation of authorized signatories."
-            ),
-        }
+        return _SECTION_H
 
     def _supporting_documents(self):
-        return {
-            "section_title": "Required Supporting Documents",
-            "checklist": [
-                {"document": "Board resolution authorizing loan application", "status": "[Pending]"},
-                {"document": "Articles of incorporation and bylaws", "status": "[Pending]"},
-                {"document": "Audited financial statements (3 years)", "status": "[Pending]"},
-                {"document": "Current year interim financial statements", "status": "[Pending]"},
-                {"document": "5-year financial forecast (CFC/NRECA format)", "status": "[Pending]"},
-                {"document": "Load forecast and power requirements study", "status": "[Pending]"},
-                {"document": "Engineering feasibility study", "status": "[Pending]"},
-                {"document": "Cost estimates with supporting documentation", "status": "[Pending]"},
-                {"document": "Environmental report (ER)", "status": "[Pending]"},
-                {"document": "Maps showing project location and service area", "status": "[Pending]"},
-                {"document": "Interconnection study/agreement", "status": "[Pending]"},
-                {"document": "Power purchase agreement or rate schedules", "status": "[Pending]"},
-                {"document": "Insurance certificates", "status": "[Pending]"},
-                {"document": "Existing mortgage/loan agreements", "status": "[Pending]"},
-                {"document": "Title search for real property", "status": "[Pending]"},
-            ],
-        }
+        return _SUPPORTING_DOCUMENTS
 
     def _eligibility_notes(self):
         notes = []
         if not self.params.is_rural:
-            notes.append(
-                "IMPORTANT: RUS eligibility requires the project to serve consumers "
-                "in an eligible rural area as defined by USDA. Verify eligibility "
-                "using the USDA Rural Development eligibility maps before proceeding."
-            )
-        if self.params.entity_type not in ("cooperative", "municipal_utility", "tribal_utility", "state_authority"):
-            notes.append(
-                "IMPORTANT: The borrower entity type may not be eligible for RUS "
-                "electric program loans. Eligible borrowers typically include "
-                "electric cooperatives, public utility districts, and tribal utilities."
-            )
+            notes.append(_NOTE_NOT_RURAL)
+        if self.params.entity_type not in _RUS_ELIGIBLE_ENTITIES:
+            notes.append(_NOTE_INELIGIBLE_ENTITY)
         if self.fp.dscr < 1.0:
-            notes.append(
-                "WARNING: Current financial projections show a DSCR below 1.0x, "
-                "indicating insufficient cash flow to cover debt service. This "
-                "would not meet RUS lending standards."
-            )
-        notes.append(
-            "This output is generated as a data template to assist in preparing "
-            "a RUS Form 201 application. It does not constitute a completed "
-            "application and should be reviewed by legal counsel and the borrower's "
-            "RUS General Field Representative before submission."
-        )
+            notes.append(_NOTE_LOW_DSCR)
+        notes.append(_NOTE_DISCLAIMER)
         return notes
@@ -200,6 +200,11 @@ class FinancingStructureBuilder:
         return min(score, 100)
 
     def _generate_term_sheet(self, key, template):
+        """
+        Indicative term sheet. "security" is always a single description
+        string; "conditions_precedent", "covenants" and
+        "reserve_requirements" are always lists of strings.
+        """
         fp = self.params.financial
         debt_amount = fp.total_project_cost * template["typical_leverage"]
 
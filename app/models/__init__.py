@@ -1,11 +1,29 @@
-from app.models.project import ProjectParameters
-from app.models.financial import FinancialModel
-from app.models.credit_risk import CreditRiskModel
-from app.models.scoring import BankabilityScorer
-
-__all__ = [
-    "ProjectParameters",
-    "FinancialModel",
-    "CreditRiskModel",
-    "BankabilityScorer",
-]
+"""
+Project, financial, credit and scoring models. Each export is imported on
+first access, so loading ProjectParameters does not pull in the scorer.
+"""
+
+import importlib
+
+_EXPORT_MODULES = {
+    "ProjectParameters": "app.models.project",
+    "ProjectBatch": "app.models.portfolio",
+    "FinancialModel": "app.models.financial",
+    "CreditRiskModel": "app.models.credit_risk",
+    "BankabilityScorer": "app.models.scoring",
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+def __getattr__(name):
+    module = _EXPORT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    export = getattr(importlib.import_module(module), name)
+    globals()[name] = export
+    return export
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -8,6 +8,8 @@ import numpy as np
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+from app.utils.calculations import compound_factors
+
 
 @dataclass
 class AnnualCashFlow:
@@ -77,15 +79,17 @@ class FinancialModel:
 
         itc_value = self.fp.total_project_cost * self.fp.itc_percent if self.fp.itc_percent > 0 else 0.0
 
+        degradation_factors = compound_factors(-self.tp.degradation_rate_annual, project_life)
+        revenue_escalations = compound_factors(self.fp.revenue_escalation, project_life)
+        opex_escalations = compound_factors(self.fp.annual_opex_escalation, project_life)
+
         for year in range(1, project_life + 1):
             cf = AnnualCashFlow(year=year)
 
-            degradation_factor = (1 - self.tp.degradation_rate_annual) ** (year - 1)
-            revenue_escalation = (1 + self.fp.revenue_escalation) ** (year - 1)
-            cf.revenue = self.fp.annual_revenue * revenue_escalation * degradation_factor
+            degradation_factor = degradation_factors[year - 1]
+            cf.revenue = self.fp.annual_revenue * revenue_escalations[year - 1] * degradation_factor
 
-            opex_escalation = (1 + self.fp.annual_opex_escalation) ** (year - 1)
-            cf.opex = self.fp.annual_opex * opex_escalation
+            cf.opex = self.fp.annual_opex * opex_escalations[year - 1]
 
             cf.net_operating_income = cf.revenue - cf.opex
 
@@ -193,20 +197,21 @@ class FinancialModel:
             summary.average_dscr = 0.0
             summary.minimum_dscr = 0.0
 
+        life = self.tp.expected_useful_life_years
+        degradation_factors = compound_factors(-self.tp.degradation_rate_annual, life)
         total_generation = sum(
-            self.tp.annual_generation_mwh * (1 - self.tp.degradation_rate_annual) ** (y - 1)
-            for y in range(1, self.tp.expected_useful_life_years + 1)
+            self.tp.annual_generation_mwh * factor for factor in degradation_factors
         )
         if total_generation > 0:
             total_costs = self.fp.total_project_cost + summary.total_opex
-            discount_factors = [1 / (1 + self.fp.discount_rate) ** y
-                                for y in range(1, self.tp.expected_useful_life_years + 1)]
+            discount_growth = compound_factors(self.fp.discount_rate, life + 1)
+            discount_factors = [1 / discount_growth[y] for y in range(1, life + 1)]
             discounted_gen = sum(
-                self.tp.annual_generation_mwh * (1 - self.tp.degradation_rate_annual) ** (y - 1) * df
-                for y, df in zip(range(1, self.tp.expected_useful_life_years + 1), discount_factors)
+                self.tp.annual_generation_mwh * factor * df
+                for factor, df in zip(degradation_factors, discount_factors)
             )
             discounted_costs = self.fp.total_project_cost + sum(
-                cf.opex / (1 + self.fp.discount_rate) ** cf.year for cf in annual_flows
+                cf.opex / discount_growth[cf.year] for cf in annual_flows
             )
             summary.lcoe = discounted_costs / discounted_gen if discounted_gen > 0 else 0.0
         else:
@@ -231,8 +236,8 @@ class FinancialModel:
         if not cash_flows or rate < 0:
             return 0.0
         npv = 0.0
-        for i, cf in enumerate(cash_flows):
-            npv += cf / (1 + rate) ** i
+        for cf, growth in zip(cash_flows, compound_factors(rate, len(cash_flows))):
+            npv += cf / growth
         return npv
 
     @staticmethod
@@ -339,3 +344,43 @@ class FinancialModel:
             score += 3
 
         return min(score, 100.0)
+
+    @staticmethod
+    def financial_strength_score_batch(minimum_dscr, irr_project, npv_project, total_project_cost,
+                                       payback_years, useful_life_years, leverage_ratio, debt_yield):
+        """
+        Vectorized financial_strength_score for scenario sweeps. Takes the
+        summary metrics (and the project cost, useful life and leverage the
+        scalar method reads from the parameters) as arrays that broadcast
+        together, and returns the scores as a float64 array.
+        """
+        dscr = np.asarray(minimum_dscr, dtype=np.float64)
+        irr = np.asarray(irr_project, dtype=np.float64)
+        npv = np.asarray(npv_project, dtype=np.float64)
+        cost = np.asarray(total_project_cost, dtype=np.float64)
+        payback = np.asarray(payback_years, dtype=np.float64)
+        life = np.asarray(useful_life_years, dtype=np.float64)
+        leverage = np.asarray(leverage_ratio, dtype=np.float64)
+        dy = np.asarray(debt_yield, dtype=np.float64)
+
+        # Each np.select mirrors one if/elif ladder of the scalar method
+        score = np.select(
+            [dscr >= 1.60, dscr >= 1.40, dscr >= 1.25, dscr >= 1.10, dscr >= 1.0],
+            [30, 25, 18, 10, 5], 0,
+        ).astype(np.float64)
+        score += np.select([irr >= 0.15, irr >= 0.10, irr >= 0.08, irr >= 0.05], [20, 15, 10, 5], 0)
+        score += np.select([npv > 0, npv > -cost * 0.05], [15, 5], 0)
+        score += np.select(
+            [payback <= life * 0.3, payback <= life * 0.5, payback <= life * 0.7], [15, 10, 5], 0,
+        )
+        score += np.select(
+            [
+                (0.50 <= leverage) & (leverage <= 0.75),
+                (0.40 <= leverage) & (leverage <= 0.80),
+                leverage < 0.40,
+                leverage <= 0.90,
+            ],
+            [10, 7, 8, 3], 0,
+        )
+        score += np.select([dy >= 0.12, dy >= 0.10, dy >= 0.08, dy >= 0.06], [10, 8, 5, 3], 0)
+        return np.minimum(score, 100.0)
@@ -0,0 +1,397 @@
+"""
+Column-oriented batch scoring for portfolios of projects.
+
+ProjectBatch stores the inputs of the four section scorers as one NumPy
+array per field (struct-of-arrays), so a portfolio or scenario set of N
+projects is scored with a handful of array operations instead of N
+Python-level method calls. Batches hold float32 by default; with
+precision="fp64" results match the per-project scorers in
+app.models.project exactly.
+"""
+
+import json
+from dataclasses import dataclass
+from operator import attrgetter
+
+import numpy as np
+
+from app.models.project import (
+    ProjectParameters,
+    TECHNOLOGY_CODES, PROJECT_STAGE_CODES, OFFTAKE_TYPE_CODES, ENTITY_TYPE_CODES,
+    _CF_BENCHMARKS, _CF_BENCHMARK_DEFAULT,
+    _RATING_SCORES, _RATING_DEFAULT,
+    _OFFTAKE_SCORES, _OFFTAKE_DEFAULT,
+    _STABILITY_SCORES, _STABILITY_DEFAULT,
+    _EPC_SCORES, _EPC_DEFAULT,
+    _EPC_EXPERIENCE_SCORES, _EPC_EXPERIENCE_DEFAULT,
+    _INSURANCE_SCORES, _INSURANCE_DEFAULT,
+    _RESOURCE_QUALITY_SCORES, _RESOURCE_QUALITY_DEFAULT,
+    _CONFIDENCE_SCORES, _CONFIDENCE_DEFAULT,
+    _INTERCONNECTION_SCORES, _INTERCONNECTION_DEFAULT,
+    _CONGESTION_SCORES, _CONGESTION_DEFAULT,
+)
+
+
+def _encode_table(table, default, codes=None):
+    """
+    Turn a scorer lookup table into (codes, lut): codes maps each value to
+    an integer index and lut[index] holds its score. Pass codes to index by
+    an existing vocabulary instead of the table's own keys. Values without
+    a code get the extra last index, whose lut entry is the table default.
+    """
+    if codes is None:
+        codes = {key: i for i, key in enumerate(table)}
+    lut = np.array([*(table.get(key, default) for key in codes), default], dtype=np.float64)
+    return codes, lut
+
+
+_TECHNOLOGY_CODES, _CF_BENCHMARK_LUT = _encode_table(
+    _CF_BENCHMARKS, _CF_BENCHMARK_DEFAULT, TECHNOLOGY_CODES)
+_RATING_CODES, _RATING_LUT = _encode_table(_RATING_SCORES, _RATING_DEFAULT)
+_OFFTAKE_CODES, _OFFTAKE_LUT = _encode_table(_OFFTAKE_SCORES, _OFFTAKE_DEFAULT, OFFTAKE_TYPE_CODES)
+_STABILITY_CODES, _STABILITY_LUT = _encode_table(_STABILITY_SCORES, _STABILITY_DEFAULT)
+_EPC_CODES, _EPC_LUT = _encode_table(_EPC_SCORES, _EPC_DEFAULT)
+_EPC_EXPERIENCE_CODES, _EPC_EXPERIENCE_LUT = _encode_table(
+    _EPC_EXPERIENCE_SCORES, _EPC_EXPERIENCE_DEFAULT)
+_INSURANCE_CODES, _INSURANCE_LUT = _encode_table(_INSURANCE_SCORES, _INSURANCE_DEFAULT)
+_RESOURCE_QUALITY_CODES, _RESOURCE_QUALITY_LUT = _encode_table(
+    _RESOURCE_QUALITY_SCORES, _RESOURCE_QUALITY_DEFAULT)
+_CONFIDENCE_CODES, _CONFIDENCE_LUT = _encode_table(_CONFIDENCE_SCORES, _CONFIDENCE_DEFAULT)
+_INTERCONNECTION_CODES, _INTERCONNECTION_LUT = _encode_table(
+    _INTERCONNECTION_SCORES, _INTERCONNECTION_DEFAULT)
+_CONGESTION_CODES, _CONGESTION_LUT = _encode_table(_CONGESTION_SCORES, _CONGESTION_DEFAULT)
+
+
+# Scores are 0-100 built from inputs with a few significant digits, so
+# batches default to float32; "fp64" reproduces the scalar scorers exactly.
+_PRECISIONS = {"fp32": np.float32, "fp64": np.float64}
+
+# Every code table has fewer than 127 entries, so codes fit in one byte
+_CODE_DTYPE = np.int8
+
+
+def _float_dtype(precision):
+    try:
+        return _PRECISIONS[precision]
+    except KeyError:
+        raise ValueError(f"Unknown precision {precision!r}; expected one of {sorted(_PRECISIONS)}")
+
+
+def _column(values, dtype):
+    return np.array(values, dtype=dtype)
+
+
+def _flags(values, dtype):
+    return np.array([bool(v) for v in values], dtype=dtype)
+
+
+def _encode(values, codes):
+    unknown = len(codes)
+    return np.array([codes.get(v, unknown) for v in values], dtype=_CODE_DTYPE)
+
+
+def _flag_column(values, dtype):
+    values = np.asarray(values)
+    if values.dtype.kind not in "biuf":
+        # Truthiness per element, as bool() does in from_dict
+        values = values.astype(object)
+    return values.astype(bool).astype(dtype)
+
+
+def _sorted_vocabulary(codes):
+    """Sorted keys of a code table and their codes, for _encode_column."""
+    keys = sorted(codes)
+    return np.array(keys, dtype=str), np.array([codes[k] for k in keys], dtype=_CODE_DTYPE)
+
+
+def _encode_column(values, keys, key_codes):
+    # Binary-search every value against the sorted vocabulary in one pass;
+    # positions whose key does not match are unknown values
+    values = np.asarray(values, dtype=str).reshape(-1)
+    idx = np.searchsorted(keys, values)
+    np.minimum(idx, len(keys) - 1, out=idx)
+    return np.where(keys[idx] == values, key_codes[idx], len(keys)).astype(_CODE_DTYPE)
+
+
+def _gather(lut, codes, dtype):
+    return lut.astype(dtype, copy=False)[codes]
+
+
+# Batch field -> (source path, converter). The path is both the attribute
+# path on ProjectParameters and the column name accepted by from_columns
+# (the dotted names pandas.json_normalize gives ProjectParameters.to_dict()).
+# Converters are float for numeric fields, bool for flags, or a code table.
+_BATCH_FIELDS = {
+    "project_stage_code": ("project_stage", PROJECT_STAGE_CODES),
+    "entity_type_code": ("entity_type", ENTITY_TYPE_CODES),
+
+    "technology_code": ("technical.technology_type", _TECHNOLOGY_CODES),
+    "capacity_factor": ("technical.capacity_factor", float),
+    "technology_readiness_level": ("technical.technology_readiness_level", float),
+    "availability_factor": ("technical.availability_factor", float),
+    "environmental_permits_secured": ("technical.environmental_permits_secured", bool),
+    "site_control_secured": ("technical.site_control_secured", bool),
+
+    "rating_code": ("credit.offtaker_credit_rating", _RATING_CODES),
+    "offtake_tenor_years": ("credit.offtake_tenor_years", float),
+    "offtake_code": ("credit.offtake_type", _OFFTAKE_CODES),
+    "revenue_concentration_percent": ("credit.revenue_concentration_percent", float),
+    "counterparty_count": ("credit.counterparty_count", float),
+    "stability_code": ("credit.regulatory_stability_rating", _STABILITY_CODES),
+    "has_credit_support": ("credit.has_credit_support", bool),
+
+    "epc_code": ("structure.epc_contract_type", _EPC_CODES),
+    "epc_experience_code": ("structure.epc_contractor_experience", _EPC_EXPERIENCE_CODES),
+    "performance_guarantee": ("structure.performance_guarantee", bool),
+    "performance_guarantee_level": ("structure.performance_guarantee_level", float),
+    "completion_guarantee": ("structure.completion_guarantee", bool),
+    "reserve_accounts_funded": ("structure.reserve_accounts_funded", bool),
+    "debt_service_reserve_months": ("structure.debt_service_reserve_months", float),
+    "major_maintenance_reserve": ("structure.major_maintenance_reserve", bool),
+    "insurance_code": ("structure.insurance_coverage", _INSURANCE_CODES),
+    "step_in_rights": ("structure.step_in_rights", bool),
+    "assignment_provisions": ("structure.assignment_provisions", bool),
+    "change_of_control_provisions": ("structure.change_of_control_provisions", bool),
+
+    "resource_quality_code": ("market.resource_quality", _RESOURCE_QUALITY_CODES),
+    "confidence_code": ("market.resource_assessment_confidence", _CONFIDENCE_CODES),
+    "independent_resource_assessment": ("market.independent_resource_assessment", bool),
+    "curtailment_history_percent": ("market.curtailment_history_percent", float),
+    "interconnection_code": ("market.interconnection_certainty", _INTERCONNECTION_CODES),
+    "congestion_code": ("market.grid_congestion_risk", _CONGESTION_CODES),
+    "land_lease_secured": ("market.land_lease_secured", bool),
+}
+
+_SORTED_VOCABULARIES = {
+    name: _sorted_vocabulary(convert)
+    for name, (_, convert) in _BATCH_FIELDS.items()
+    if isinstance(convert, dict)
+}
+
+_DEFAULT_PROJECT = ProjectParameters()
+
+
+@dataclass
+class ProjectBatch:
+    """
+    Scorer inputs for N projects, one array of length N per field.
+    Categorical fields are stored as integer codes into the module LUTs.
+    """
+
+    # Project
+    project_stage_code: np.ndarray
+    entity_type_code: np.ndarray
+
+    # Technical
+    technology_code: np.ndarray
+    capacity_factor: np.ndarray
+    technology_readiness_level: np.ndarray
+    availability_factor: np.ndarray
+    environmental_permits_secured: np.ndarray
+    site_control_secured: np.ndarray
+
+    # Credit
+    rating_code: np.ndarray
+    offtake_tenor_years: np.ndarray
+    offtake_code: np.ndarray
+    revenue_concentration_percent: np.ndarray
+    counterparty_count: np.ndarray
+    stability_code: np.ndarray
+    has_credit_support: np.ndarray
+
+    # Structure
+    epc_code: np.ndarray
+    epc_experience_code: np.ndarray
+    performance_guarantee: np.ndarray
+    performance_guarantee_level: np.ndarray
+    completion_guarantee: np.ndarray
+    reserve_accounts_funded: np.ndarray
+    debt_service_reserve_months: np.ndarray
+    major_maintenance_reserve: np.ndarray
+    insurance_code: np.ndarray
+    step_in_rights: np.ndarray
+    assignment_provisions: np.ndarray
+    change_of_control_provisions: np.ndarray
+
+    # Market
+    resource_quality_code: np.ndarray
+    confidence_code: np.ndarray
+    independent_resource_assessment: np.ndarray
+    curtailment_history_percent: np.ndarray
+    interconnection_code: np.ndarray
+    congestion_code: np.ndarray
+    land_lease_secured: np.ndarray
+
+    @classmethod
+    def from_projects(cls, projects, precision="fp32"):
+        """Build a batch from a sequence of ProjectParameters."""
+        dtype = _float_dtype(precision)
+        arrays = {}
+        for name, (path, convert) in _BATCH_FIELDS.items():
+            values = list(map(attrgetter(path), projects))
+            if convert is float:
+                arrays[name] = _column(values, dtype)
+            elif convert is bool:
+                arrays[name] = _flags(values, dtype)
+            else:
+                arrays[name] = _encode(values, convert)
+        return cls(**arrays)
+
+    @classmethod
+    def from_columns(cls, columns, precision="fp32"):
+        """
+        Build a batch straight from tabular data without creating a
+        ProjectParameters per row. columns maps names such as "project_stage"
+        or "technical.capacity_factor" to equal-length sequences; a pandas
+        DataFrame, a dict of lists or of NumPy arrays all work. Missing
+        columns take the ProjectParameters defaults.
+        """
+        present = [path for path, _ in _BATCH_FIELDS.values() if path in columns]
+        if not present:
+            raise ValueError("No recognised project columns")
+        n = len(columns[present[0]])
+        dtype = _float_dtype(precision)
+
+        arrays = {}
+        for name, (path, convert) in _BATCH_FIELDS.items():
+            if path in columns:
+                values = columns[path]
+            else:
+                values = [attrgetter(path)(_DEFAULT_PROJECT)] * n
+            if convert is float:
+                arrays[name] = np.asarray(values, dtype=dtype)
+            elif convert is bool:
+                arrays[name] = _flag_column(values, dtype)
+            else:
+                arrays[name] = _encode_column(values, *_SORTED_VOCABULARIES[name])
+            if len(arrays[name]) != n:
+                raise ValueError(f"Column {path!r} has {len(arrays[name])} rows, expected {n}")
+        return cls(**arrays)
+
+    def __len__(self):
+        return len(self.capacity_factor)
+
+    @property
+    def dtype(self):
+        """Floating-point dtype of the numeric columns (and of the scores)."""
+        return self.capacity_factor.dtype
+
+
+def efficiency_score_batch(batch):
+    """Vectorized TechnicalParameters.efficiency_score over a batch."""
+    cf = batch.capacity_factor
+    cf_ratio = np.minimum(cf / _gather(_CF_BENCHMARK_LUT, batch.technology_code, batch.dtype), 1.5)
+    score = np.where(cf > 0, cf_ratio * 30, 0.0)
+    score += np.minimum(batch.technology_readiness_level / 9.0, 1.0) * 25
+    score += batch.availability_factor * 20
+    score += batch.environmental_permits_secured * 12.5
+    score += batch.site_control_secured * 12.5
+    return np.minimum(score, 100.0)
+
+
+def credit_quality_score_batch(batch):
+    """Vectorized CreditParameters.credit_quality_score over a batch."""
+    dtype = batch.dtype
+    score = _gather(_RATING_LUT, batch.rating_code, dtype) * 0.35
+    score += np.minimum(batch.offtake_tenor_years / 25.0, 1.0) * 100 * 0.20
+    score += _gather(_OFFTAKE_LUT, batch.offtake_code, dtype) * 0.20
+
+    concentration = np.maximum(0, 100 - batch.revenue_concentration_percent * 80)
+    count = batch.counterparty_count
+    concentration = np.where(count > 1, np.minimum(100, concentration + count * 5), concentration)
+    score += concentration * 0.10
+
+    score += _gather(_STABILITY_LUT, batch.stability_code, dtype) * 0.10
+    score += batch.has_credit_support * 5.0
+    return np.minimum(score, 100.0)
+
+
+def structure_score_batch(batch):
+    """Vectorized ProjectStructureParameters.structure_score over a batch."""
+    dtype = batch.dtype
+    score = _gather(_EPC_LUT, batch.epc_code, dtype)
+    score += _gather(_EPC_EXPERIENCE_LUT, batch.epc_experience_code, dtype)
+    score += batch.performance_guarantee * np.minimum(batch.performance_guarantee_level * 10, 10)
+    score += batch.completion_guarantee * 8
+
+    reserves = batch.reserve_accounts_funded
+    score += reserves * 5
+    score += reserves * (np.minimum(batch.debt_service_reserve_months / 6.0, 1.0) * 7)
+
+    score += batch.major_maintenance_reserve * 5
+    score += _gather(_INSURANCE_LUT, batch.insurance_code, dtype)
+    score += batch.step_in_rights * 3
+    score += batch.assignment_provisions * 3
+    score += batch.change_of_control_provisions * 2
+    return np.minimum(score, 100.0)
+
+
+def market_score_batch(batch):
+    """Vectorized MarketParameters.market_score over a batch."""
+    dtype = batch.dtype
+    score = _gather(_RESOURCE_QUALITY_LUT, batch.resource_quality_code, dtype)
+    score += _gather(_CONFIDENCE_LUT, batch.confidence_code, dtype)
+    score += batch.independent_resource_assessment * 5
+
+    curtailment_penalty = np.minimum(batch.curtailment_history_percent * 200, 15)
+    score += np.maximum(0, 15 - curtailment_penalty)
+
+    score += _gather(_INTERCONNECTION_LUT, batch.interconnection_code, dtype)
+    score += _gather(_CONGESTION_LUT, batch.congestion_code, dtype)
+    score += batch.land_lease_secured * 5
+    return np.minimum(score, 100.0)
+
+
+# Column order of the score_all matrix
+SCORE_COLUMNS = ("technical", "credit", "structure", "market")
+
+
+def encode_portfolio(projects, precision="fp32"):
+    """Encode a sequence of ProjectParameters as a ProjectBatch."""
+    return ProjectBatch.from_projects(projects, precision)
+
+
+def serialize_portfolio(projects):
+    """
+    Serialize many ProjectParameters to compact JSON bytes in a single
+    encoder call, as a list of to_dict() payloads.
+    """
+    return json.dumps([p.to_dict() for p in projects], separators=(",", ":")).encode("utf-8")
+
+
+def projects_from_columns(columns):
+    """
+    Materialize one ProjectParameters per row of tabular data, for the cases
+    that need full instances. Uses the same column names as
+    ProjectBatch.from_columns and the same coercion as from_dict.
+    """
+    names = list(columns.keys())
+    rows = zip(*(list(columns[name]) for name in names))
+    split = [name.split(".", 1) for name in names]
+
+    projects = []
+    for row in rows:
+        data = {}
+        for parts, value in zip(split, row):
+            if len(parts) == 2:
+                data.setdefault(parts[0], {})[parts[1]] = value
+            else:
+                data[parts[0]] = value
+        projects.append(ProjectParameters.from_dict(data))
+    return projects
+
+
+def score_all(batch, out=None):
+    """
+    Score every section for every project in one call. Returns an (N, 4)
+    array of the batch's dtype whose columns follow SCORE_COLUMNS; pass out
+    to reuse a buffer across repeated runs (e.g. Monte Carlo draws of the
+    same size).
+    """
+    if out is None:
+        out = np.empty((len(batch), len(SCORE_COLUMNS)), dtype=batch.dtype)
+    out[:, 0] = efficiency_score_batch(batch)
+    out[:, 1] = credit_quality_score_batch(batch)
+    out[:, 2] = structure_score_batch(batch)
+    out[:, 3] = market_score_batch(batch)
+    return out
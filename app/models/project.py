@@ -4,10 +4,18 @@ Captures all inputs needed to evaluate a grid project across technical,
 financial, and structural dimensions.
 """
 
-from dataclasses import dataclass, field
-from typing import Optional
+import sys
+from dataclasses import dataclass, field, fields
+from functools import wraps
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, get_type_hints
 from datetime import date
 
+import numpy as np
+
+from app.utils.calculations import annuity_payment, annuity_payment_array
+
 
 TECHNOLOGY_TYPES = [
     "solar_pv",
@@ -56,9 +64,121 @@ ENTITY_TYPES = [
     "state_authority",
 ]
 
-
-@dataclass
-class TechnicalParameters:
+# Integer codes for the categorical vocabularies above, used when projects
+# are stored column-wise (see app.models.portfolio). Values outside a
+# vocabulary encode as len(vocabulary).
+TECHNOLOGY_CODES = {name: i for i, name in enumerate(TECHNOLOGY_TYPES)}
+PROJECT_STAGE_CODES = {name: i for i, name in enumerate(PROJECT_STAGES)}
+OFFTAKE_TYPE_CODES = {name: i for i, name in enumerate(OFFTAKE_TYPES)}
+ENTITY_TYPE_CODES = {name: i for i, name in enumerate(ENTITY_TYPES)}
+
+# Categorical fields whose values from_dict interns, so lookups in
+# the score and code tables hit the identity fast path even for strings
+# that arrive from JSON or form input
+_INTERNED_FIELDS = frozenset({
+    "project_stage", "entity_type", "technology_type",
+    "offtake_type", "offtaker_credit_rating", "offtaker_entity_type",
+    "regulatory_stability_rating", "epc_contract_type", "epc_contractor_experience",
+    "insurance_coverage", "resource_quality", "resource_assessment_confidence",
+    "interconnection_certainty", "grid_congestion_risk",
+})
+
+# Lookup tables for the section scorers, shared by the per-project methods
+# below and the batch scorers in app.models.portfolio. Each table has a
+# default score for values it does not list. The tables are read-only
+# views, since the batch LUTs are built from them once at import.
+_CF_BENCHMARKS = MappingProxyType({
+    "solar_pv": 0.25, "onshore_wind": 0.35, "offshore_wind": 0.45,
+    "battery_storage": 0.85, "hydro_small": 0.45, "geothermal": 0.90,
+    "biomass": 0.80, "natural_gas_peaker": 0.15,
+    "combined_cycle": 0.55, "transmission_line": 0.95,
+    "distribution_upgrade": 0.95, "substation": 0.95,
+})
+_CF_BENCHMARK_DEFAULT = 0.30
+
+_RATING_SCORES = MappingProxyType({
+    "AAA": 100, "AA+": 95, "AA": 90, "AA-": 85,
+    "A+": 80, "A": 75, "A-": 70,
+    "BBB+": 65, "BBB": 60, "BBB-": 55,
+    "BB+": 45, "BB": 40, "BB-": 35,
+    "B+": 30, "B": 25, "B-": 20,
+    "CCC": 10, "CC": 5, "C": 2, "D": 0,
+    "unrated": 30,
+})
+_RATING_DEFAULT = 30
+
+_OFFTAKE_SCORES = MappingProxyType({
+    "ppa_fixed": 90, "ppa_indexed": 75, "regulated_rate": 85,
+    "tolling_agreement": 70, "capacity_contract": 65,
+    "bundled_rate": 80, "merchant": 20,
+})
+_OFFTAKE_DEFAULT = 40
+
+_STABILITY_SCORES = MappingProxyType({"stable": 100, "positive": 90, "uncertain": 50, "negative": 20})
+_STABILITY_DEFAULT = 50
+
+_EPC_SCORES = MappingProxyType({
+    "fixed_price_turnkey": 30,
+    "fixed_price_epc": 25,
+    "cost_plus_gmp": 15,
+    "cost_plus": 5,
+    "self_build": 10,
+})
+_EPC_DEFAULT = 10
+
+_EPC_EXPERIENCE_SCORES = MappingProxyType({
+    "established": 15, "experienced": 12, "moderate": 8, "limited": 3,
+})
+_EPC_EXPERIENCE_DEFAULT = 5
+
+_INSURANCE_SCORES = MappingProxyType({"comprehensive": 10, "standard": 7, "basic": 3, "none": 0})
+_INSURANCE_DEFAULT = 3
+
+_RESOURCE_QUALITY_SCORES = MappingProxyType({
+    "excellent": 25, "good": 20, "average": 12, "below_average": 5, "poor": 0,
+})
+_RESOURCE_QUALITY_DEFAULT = 10
+
+_CONFIDENCE_SCORES = MappingProxyType({"p90": 20, "p75": 15, "p50": 10, "p99": 25})
+_CONFIDENCE_DEFAULT = 10
+
+_INTERCONNECTION_SCORES = MappingProxyType({
+    "secured": 20, "high": 15, "moderate": 8, "low": 3, "speculative": 0,
+})
+_INTERCONNECTION_DEFAULT = 5
+
+_CONGESTION_SCORES = MappingProxyType({"none": 10, "low": 8, "moderate": 5, "high": 2, "severe": 0})
+_CONGESTION_DEFAULT = 3
+
+
+class _ScoreCache:
+    """
+    Mixin for parameter sections with a memoized score. The score is kept
+    until invalidate() is called, so code that edits fields of a section it
+    has already scored must invalidate it.
+    """
+
+    __slots__ = ()
+
+    def invalidate(self):
+        """Drop the memoized score after fields were edited in place."""
+        self._score_cache = None
+
+
+def _cached_score(method):
+    """Memoize a section's score in its _score_cache slot."""
+    @wraps(method)
+    def wrapper(self):
+        score = self._score_cache
+        if score is None:
+            score = method(self)
+            object.__setattr__(self, "_score_cache", score)
+        return score
+    return wrapper
+
+
+@dataclass(slots=True)
+class TechnicalParameters(_ScoreCache):
     technology_type: str = "solar_pv"
     nameplate_capacity_mw: float = 0.0
     annual_generation_mwh: float = 0.0
@@ -71,23 +191,21 @@ class TechnicalParameters:
     interconnection_status: str = "planned"
     environmental_permits_secured: bool = False
     site_control_secured: bool = False
+    _score_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
+    @_cached_score
     def efficiency_score(self):
         """Rate technical efficiency on a 0-100 scale."""
         score = 0.0
         if self.capacity_factor > 0:
-            cf_benchmarks = {
-                "solar_pv": 0.25, "onshore_wind": 0.35, "offshore_wind": 0.45,
-                "battery_storage": 0.85, "hydro_small": 0.45, "geothermal": 0.90,
-                "biomass": 0.80, "natural_gas_peaker": 0.15,
-                "combined_cycle": 0.55, "transmission_line": 0.95,
-                "distribution_upgrade": 0.95, "substation": 0.95,
-            }
-            benchmark = cf_benchmarks.get(self.technology_type, 0.30)
-            cf_ratio = min(self.capacity_factor / benchmark, 1.5)
+            benchmark = _CF_BENCHMARKS.get(self.technology_type, _CF_BENCHMARK_DEFAULT)
+            cf_ratio = self.capacity_factor / benchmark
+            if cf_ratio > 1.5:
+                cf_ratio = 1.5
             score += cf_ratio * 30
 
-        trl_score = min(self.technology_readiness_level / 9.0, 1.0) * 25
+        trl_ratio = self.technology_readiness_level / 9.0
+        trl_score = (1.0 if trl_ratio > 1.0 else trl_ratio) * 25
         score += trl_score
 
         score += self.availability_factor * 20
@@ -97,10 +215,10 @@ class TechnicalParameters:
         if self.site_control_secured:
             score += 12.5
 
-        return min(score, 100.0)
+        return 100.0 if score > 100.0 else score
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialParameters:
     total_project_cost: float = 0.0
     total_hard_costs: float = 0.0
@@ -122,45 +240,70 @@ class FinancialParameters:
     depreciation_schedule: str = "macrs_5"
     discount_rate: float = 0.08
 
+    # (debt, equity, debt service, NOI, DSCR, leverage), built on first read
+    # and kept until invalidate()
+    _derived: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def invalidate(self):
+        """Drop the derived debt metrics after inputs were edited in place."""
+        self._derived = None
+
+    def _derive(self):
+        """Compute the derived debt metrics once per set of inputs."""
+        cost = self.total_project_cost
+        debt = cost * self.debt_percent
+        equity = cost * self.equity_percent
+
+        if debt <= 0 or self.debt_tenor_years <= 0:
+            ads = 0.0
+        else:
+            ads = annuity_payment(debt, self.interest_rate, self.debt_tenor_years)
+
+        noi = self.annual_revenue - self.annual_opex
+        dscr = float("inf") if ads <= 0 else noi / ads
+        leverage = 0.0 if cost <= 0 else debt / cost
+
+        derived = self._derived = (debt, equity, ads, noi, dscr, leverage)
+        return derived
+
     @property
     def debt_amount(self):
-        return self.total_project_cost * self.debt_percent
+        return (self._derived or self._derive())[0]
 
     @property
     def equity_amount(self):
-        return self.total_project_cost * self.equity_percent
+        return (self._derived or self._derive())[1]
 
     @property
     def annual_debt_service(self):
-        if self.debt_amount <= 0 or self.debt_tenor_years <= 0:
-            return 0.0
-        r = self.interest_rate
-        n = self.debt_tenor_years
-        if r == 0:
-            return self.debt_amount / n
-        payment = self.debt_amount * (r * (1 + r) ** n) / ((1 + r) ** n - 1)
-        return payment
+        return (self._derived or self._derive())[2]
 
     @property
     def net_operating_income(self):
-        return self.annual_revenue - self.annual_opex
+        return (self._derived or self._derive())[3]
 
     @property
     def dscr(self):
-        ads = self.annual_debt_service
-        if ads <= 0:
-            return float("inf")
-        return self.net_operating_income / ads
+        return (self._derived or self._derive())[4]
 
     @property
     def leverage_ratio(self):
-        if self.total_project_cost <= 0:
-            return 0.0
-        return self.debt_amount / self.total_project_cost
-
-
-@dataclass
-class CreditParameters:
+        return (self._derived or self._derive())[5]
+
+    @staticmethod
+    def dscr_batch(net_operating_incomes, debt_amounts, interest_rates, tenors):
+        """
+        DSCR for many debt scenarios at once, e.g. a rate/tenor sweep.
+        Arguments broadcast together; scenarios with no debt service give inf.
+        """
+        debt_service = annuity_payment_array(debt_amounts, interest_rates, tenors)
+        noi = np.broadcast_to(np.asarray(net_operating_incomes, dtype=np.float64), debt_service.shape)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(debt_service > 0, noi / debt_service, np.inf)
+
+
+@dataclass(slots=True)
+class CreditParameters(_ScoreCache):
     offtake_type: str = "ppa_fixed"
     offtake_tenor_years: int = 20
     offtaker_credit_rating: str = "BBB"
@@ -174,46 +317,38 @@ class CreditParameters:
     has_credit_support: bool = False
     credit_support_type: str = ""
     sovereign_risk_rating: str = "AAA"
+    _score_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
+    @_cached_score
     def credit_quality_score(self):
         """Rate overall credit quality on 0-100 scale."""
-        rating_scores = {
-            "AAA": 100, "AA+": 95, "AA": 90, "AA-": 85,
-            "A+": 80, "A": 75, "A-": 70,
-            "BBB+": 65, "BBB": 60, "BBB-": 55,
-            "BB+": 45, "BB": 40, "BB-": 35,
-            "B+": 30, "B": 25, "B-": 20,
-            "CCC": 10, "CC": 5, "C": 2, "D": 0,
-            "unrated": 30,
-        }
-        score = rating_scores.get(self.offtaker_credit_rating, 30) * 0.35
+        score = _RATING_SCORES.get(self.offtaker_credit_rating, _RATING_DEFAULT) * 0.35
 
-        tenor_score = min(self.offtake_tenor_years / 25.0, 1.0) * 100
+        tenor_ratio = self.offtake_tenor_years / 25.0
+        tenor_score = (1.0 if tenor_ratio > 1.0 else tenor_ratio) * 100
         score += tenor_score * 0.20
 
-        offtake_scores = {
-            "ppa_fixed": 90, "ppa_indexed": 75, "regulated_rate": 85,
-            "tolling_agreement": 70, "capacity_contract": 65,
-            "bundled_rate": 80, "merchant": 20,
-        }
-        score += offtake_scores.get(self.offtake_type, 40) * 0.20
+        score += _OFFTAKE_SCORES.get(self.offtake_type, _OFFTAKE_DEFAULT) * 0.20
 
-        concentration_score = max(0, 100 - (self.revenue_concentration_percent * 80))
+        concentration_score = 100 - (self.revenue_concentration_percent * 80)
+        if concentration_score < 0:
+            concentration_score = 0
         if self.counterparty_count > 1:
-            concentration_score = min(100, concentration_score + self.counterparty_count * 5)
+            concentration_score += self.counterparty_count * 5
+            if concentration_score > 100:
+                concentration_score = 100
         score += concentration_score * 0.10
 
-        stability_scores = {"stable": 100, "positive": 90, "uncertain": 50, "negative": 20}
-        score += stability_scores.get(self.regulatory_stability_rating, 50) * 0.10
+        score += _STABILITY_SCORES.get(self.regulatory_stability_rating, _STABILITY_DEFAULT) * 0.10
 
         if self.has_credit_support:
             score += 5.0
 
-        return min(score, 100.0)
+        return 100.0 if score > 100.0 else score
 
 
-@dataclass
-class ProjectStructureParameters:
+@dataclass(slots=True)
+class ProjectStructureParameters(_ScoreCache):
     epc_contract_type: str = "fixed_price_turnkey"
     epc_contractor_experience: str = "established"
     epc_warranty_years: int = 2
@@ -231,38 +366,32 @@ class ProjectStructureParameters:
     change_of_control_provisions: bool = True
     dispute_resolution: str = "arbitration"
     governing_law: str = "US"
+    _score_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
+    @_cached_score
     def structure_score(self):
         """Rate project structure on 0-100 scale."""
         score = 0.0
 
-        epc_scores = {
-            "fixed_price_turnkey": 30,
-            "fixed_price_epc": 25,
-            "cost_plus_gmp": 15,
-            "cost_plus": 5,
-            "self_build": 10,
-        }
-        score += epc_scores.get(self.epc_contract_type, 10)
-
-        exp_scores = {"established": 15, "experienced": 12, "moderate": 8, "limited": 3}
-        score += exp_scores.get(self.epc_contractor_experience, 5)
+        score += _EPC_SCORES.get(self.epc_contract_type, _EPC_DEFAULT)
+        score += _EPC_EXPERIENCE_SCORES.get(self.epc_contractor_experience, _EPC_EXPERIENCE_DEFAULT)
 
         if self.performance_guarantee:
-            score += min(self.performance_guarantee_level * 10, 10)
+            guarantee_score = self.performance_guarantee_level * 10
+            score += 10 if guarantee_score > 10 else guarantee_score
         if self.completion_guarantee:
             score += 8
 
         if self.reserve_accounts_funded:
             score += 5
-            reserve_score = min(self.debt_service_reserve_months / 6.0, 1.0) * 7
+            reserve_ratio = self.debt_service_reserve_months / 6.0
+            reserve_score = (1.0 if reserve_ratio > 1.0 else reserve_ratio) * 7
             score += reserve_score
 
         if self.major_maintenance_reserve:
             score += 5
 
-        insurance_scores = {"comprehensive": 10, "standard": 7, "basic": 3, "none": 0}
-        score += insurance_scores.get(self.insurance_coverage, 3)
+        score += _INSURANCE_SCORES.get(self.insurance_coverage, _INSURANCE_DEFAULT)
 
         if self.step_in_rights:
             score += 3
@@ -271,11 +400,11 @@ class ProjectStructureParameters:
         if self.change_of_control_provisions:
             score += 2
 
-        return min(score, 100.0)
+        return 100.0 if score > 100.0 else score
 
 
-@dataclass
-class MarketParameters:
+@dataclass(slots=True)
+class MarketParameters(_ScoreCache):
     resource_quality: str = "good"
     resource_assessment_confidence: str = "p50"
     independent_resource_assessment: bool = False
@@ -288,35 +417,32 @@ class MarketParameters:
     community_support: str = "supportive"
     land_lease_secured: bool = False
     land_lease_term_years: int = 30
+    _score_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
 
+    @_cached_score
     def market_score(self):
         """Rate market conditions on 0-100 scale."""
         score = 0.0
 
-        quality_scores = {"excellent": 25, "good": 20, "average": 12, "below_average": 5, "poor": 0}
-        score += quality_scores.get(self.resource_quality, 10)
-
-        confidence_scores = {"p90": 20, "p75": 15, "p50": 10, "p99": 25}
-        score += confidence_scores.get(self.resource_assessment_confidence, 10)
+        score += _RESOURCE_QUALITY_SCORES.get(self.resource_quality, _RESOURCE_QUALITY_DEFAULT)
+        score += _CONFIDENCE_SCORES.get(self.resource_assessment_confidence, _CONFIDENCE_DEFAULT)
         if self.independent_resource_assessment:
             score += 5
 
-        curtailment_penalty = min(self.curtailment_history_percent * 200, 15)
-        score += max(0, 15 - curtailment_penalty)
+        curtailment_penalty = self.curtailment_history_percent * 200
+        if curtailment_penalty < 15:
+            score += 15 - curtailment_penalty
 
-        interconnection_scores = {"secured": 20, "high": 15, "moderate": 8, "low": 3, "speculative": 0}
-        score += interconnection_scores.get(self.interconnection_certainty, 5)
-
-        congestion_scores = {"none": 10, "low": 8, "moderate": 5, "high": 2, "severe": 0}
-        score += congestion_scores.get(self.grid_congestion_risk, 3)
+        score += _INTERCONNECTION_SCORES.get(self.interconnection_certainty, _INTERCONNECTION_DEFAULT)
+        score += _CONGESTION_SCORES.get(self.grid_congestion_risk, _CONGESTION_DEFAULT)
 
         if self.land_lease_secured:
             score += 5
 
-        return min(score, 100.0)
+        return 100.0 if score > 100.0 else score
 
 
-@dataclass
+@dataclass(slots=True)
 class ProjectParameters:
     """Top-level container for all project parameters."""
     project_name: str = ""
@@ -335,41 +461,40 @@ class ProjectParameters:
     structure: ProjectStructureParameters = field(default_factory=ProjectStructureParameters)
     market: MarketParameters = field(default_factory=MarketParameters)
 
+    def invalidate(self):
+        """Drop every section's memoized results after fields were edited in place."""
+        for section in _SECTION_GETTER(self):
+            section.invalidate()
+
+    @staticmethod
+    def score_portfolio(projects, out=None, precision="fp32"):
+        """
+        Section scores for many projects as an (N, 4) array, computed column-
+        wise by app.models.portfolio (columns follow SCORE_COLUMNS). Pass
+        precision="fp64" to match the per-project scorers exactly.
+        """
+        from app.models.portfolio import encode_portfolio, score_all
+        return score_all(encode_portfolio(projects, precision), out=out)
+
     def to_dict(self):
         """Serialize all parameters to a dictionary."""
-        result = {
-            "project_name": self.project_name,
-            "project_id": self.project_id,
-            "project_stage": self.project_stage,
-            "entity_type": self.entity_type,
-            "location_state": self.location_state,
-            "location_county": self.location_county,
-            "is_rural": self.is_rural,
-            "cod_target": self.cod_target,
-            "description": self.description,
-        }
+        result = dict(zip(_PROJECT_FIELD_NAMES, _PROJECT_FIELD_GETTER(self)))
 
-        for section_name in ["technical", "financial", "credit", "structure", "market"]:
-            section = getattr(self, section_name)
-            section_dict = {}
-            for attr_name in vars(section):
-                if not attr_name.startswith("_"):
-                    section_dict[attr_name] = getattr(section, attr_name)
-            result[section_name] = section_dict
+        for section_name, section in zip(_SECTION_NAMES, _SECTION_GETTER(self)):
+            cls = type(section)
+            result[section_name] = dict(zip(_FIELD_NAMES[cls], _FIELD_GETTERS[cls](section)))
 
         return result
 
     @classmethod
     def from_dict(cls, data):
-        """Build ProjectParameters from a dictionary."""
+        """Build ProjectParameters from a dictionary. Categorical values are interned."""
         params = cls()
-        simple_fields = [
-            "project_name", "project_id", "project_stage", "entity_type",
-            "location_state", "location_county", "is_rural", "cod_target", "description",
-        ]
-        for f in simple_fields:
-            if f in data:
-                setattr(params, f, data[f])
+        for f in _SIMPLE_FIELDS.intersection(data):
+            value = data[f]
+            if f in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(params, f, value)
 
         section_map = {
             "technical": TechnicalParameters,
@@ -382,13 +507,54 @@ class ProjectParameters:
         for section_name, section_cls in section_map.items():
             if section_name in data and isinstance(data[section_name], dict):
                 section = section_cls()
+                field_types = _FIELD_TYPES[section_cls]
                 for k, v in data[section_name].items():
-                    if hasattr(section, k):
-                        expected_type = type(getattr(section, k))
-                        try:
-                            setattr(section, k, expected_type(v))
-                        except (ValueError, TypeError):
-                            setattr(section, k, v)
+                    expected_type = field_types.get(k)
+                    if expected_type is None:
+                        continue
+                    try:
+                        v = expected_type(v)
+                    except (ValueError, TypeError):
+                        pass
+                    if k in _INTERNED_FIELDS and type(v) is str:
+                        v = sys.intern(v)
+                    setattr(section, k, v)
                 setattr(params, section_name, section)
 
         return params
+
+
+# Top-level (non-section) fields accepted by from_dict
+_SIMPLE_FIELDS = frozenset({
+    "project_name", "project_id", "project_stage", "entity_type",
+    "location_state", "location_county", "is_rural", "cod_target", "description",
+})
+
+_SECTION_NAMES = ("technical", "financial", "credit", "structure", "market")
+_SECTION_GETTER = attrgetter(*_SECTION_NAMES)
+
+# Top-level fields in to_dict order
+_PROJECT_FIELD_NAMES = (
+    "project_name", "project_id", "project_stage", "entity_type",
+    "location_state", "location_county", "is_rural", "cod_target", "description",
+)
+_PROJECT_FIELD_GETTER = attrgetter(*_PROJECT_FIELD_NAMES)
+
+# Public field names per section class, in declaration order
+_FIELD_NAMES = {
+    cls: tuple(f.name for f in fields(cls) if not f.name.startswith("_"))
+    for cls in (
+        TechnicalParameters, FinancialParameters, CreditParameters,
+        ProjectStructureParameters, MarketParameters,
+    )
+}
+
+# Reads all public fields of a section as one tuple, in _FIELD_NAMES order
+_FIELD_GETTERS = {cls: attrgetter(*names) for cls, names in _FIELD_NAMES.items()}
+
+# Declared type of each public section field, used to coerce from_dict input
+_FIELD_TYPES = {
+    cls: {name: hints[name] for name in names}
+    for cls, names in _FIELD_NAMES.items()
+    for hints in (get_type_hints(cls),)
+}
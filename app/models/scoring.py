@@ -5,10 +5,14 @@ sub-scores across five assessment dimensions: Technology, Financial,
 Credit Risk, Project Structure, and Market/Resource.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from typing import List, Dict
-from app.models.financial import FinancialModel
-from app.models.credit_risk import CreditRiskModel
+from operator import attrgetter
+from typing import List, Dict, Optional
+
+import numpy as np
+
+from app.utils.calculations import format_label
 
 
 SCORE_THRESHOLDS = {
@@ -19,8 +23,78 @@ SCORE_THRESHOLDS = {
     "Pre-Bankable": {"min": 0, "color": "#b22222", "label": "Not ready for financing"},
 }
 
+# SCORE_THRESHOLDS in ascending order of cutoff, for bisect lookups
+_GRADE_ORDER = sorted(SCORE_THRESHOLDS.items(), key=lambda item: item[1]["min"])
+_GRADE_CUTOFFS = tuple(info["min"] for _, info in _GRADE_ORDER)
+_GRADE_INFO = tuple((grade, info["label"], info["color"]) for grade, info in _GRADE_ORDER)
+
+
+def _frozen_array(values):
+    """Read-only float64 array for module and class constants."""
+    array = np.array(values, dtype=np.float64)
+    array.setflags(write=False)
+    return array
+
+
+# Array form of the cutoffs for vectorized grade lookups
+_GRADE_CUTOFF_ARRAY = _frozen_array(_GRADE_CUTOFFS)
+
+
+# Cash-flow fields rounded to whole dollars in the serialized result
+_CASH_FLOW_DOLLAR_COLUMNS = (
+    "revenue", "opex", "net_operating_income", "debt_service",
+    "free_cash_flow_equity", "cumulative_cash_flow",
+)
+_CASH_FLOW_DOLLAR_FIELDS = attrgetter(*_CASH_FLOW_DOLLAR_COLUMNS)
+
+
+# Borrower types RUS typically finances
+_RUS_ELIGIBLE_ENTITIES = frozenset({
+    "cooperative", "municipal_utility", "tribal_utility", "state_authority",
+})
+
+# Technologies generally treated as innovative for Title XVII purposes
+_LPO_INNOVATIVE_TECHS = frozenset({
+    "battery_storage", "offshore_wind", "geothermal",
+    "solar_plus_storage", "microgrids", "grid_modernization",
+})
+
+# Levels accepted by BankabilityResult.to_dict(detail=...)
+_DETAIL_LEVELS = frozenset({"full", "summary"})
 
-@dataclass
+
+def _yes_no(flag):
+    return "Yes" if flag else "No"
+
+
+def _as_is(value):
+    return value
+
+
+def _format_components(template, source):
+    """Render a component template of (name, attribute, formatter) rows against source."""
+    return [
+        {"name": name, "value": formatter(getattr(source, attribute))}
+        for name, attribute, formatter in template
+    ]
+
+
+def _grade_info(score):
+    """(grade, label, color) for an overall score; blanks below the lowest cutoff."""
+    if not score >= _GRADE_CUTOFFS[0]:
+        return "", "", ""
+    return _GRADE_INFO[bisect_right(_GRADE_CUTOFFS, score) - 1]
+
+
+def _threshold_text(ladder, score):
+    """Text for the highest cutoff reached by score; the lowest band below all cutoffs."""
+    cutoffs, texts = ladder
+    if not score >= cutoffs[0]:
+        return texts[0]
+    return texts[bisect_right(cutoffs, score)]
+
+
+@dataclass(frozen=True, slots=True)
 class SubScore:
     category: str
     score: float
@@ -30,7 +104,7 @@ class SubScore:
     commentary: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BankabilityResult:
     overall_score: float = 0.0
     grade: str = ""
@@ -45,34 +119,63 @@ class BankabilityResult:
     rus_eligibility: Dict = field(default_factory=dict)
     lpo_eligibility: Dict = field(default_factory=dict)
 
-    def to_dict(self):
-        result = {
-            "overall_score": round(self.overall_score, 1),
-            "grade": self.grade,
-            "grade_label": self.grade_label,
-            "grade_color": self.grade_color,
-            "sub_scores": [],
-            "strengths": self.strengths,
-            "weaknesses": self.weaknesses,
-            "recommendations": self.recommendations,
-            "rus_eligibility": self.rus_eligibility,
-            "lpo_eligibility": self.lpo_eligibility,
-        }
-        for ss in self.sub_scores:
-            result["sub_scores"].append({
+    # to_dict() output, cleared whenever a field is reassigned
+    _serialized: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_serialized":
+            object.__setattr__(self, "_serialized", None)
+
+    def shallow_items(self, detail="full"):
+        """
+        Yield the top-level (key, value) pairs of the serialized result.
+
+        Rounded metrics are built fresh; list and dict fields such as
+        strengths or eligibility are passed through by reference. With
+        detail="summary" only the score, grade and sub-score keys are yielded.
+        """
+        if detail not in _DETAIL_LEVELS:
+            raise ValueError(f"detail must be one of {sorted(_DETAIL_LEVELS)}, got {detail!r}")
+        yield "overall_score", round(self.overall_score, 1)
+        yield "grade", self.grade
+        yield "grade_label", self.grade_label
+        yield "grade_color", self.grade_color
+        yield "sub_scores", [
+            {
                 "category": ss.category,
                 "score": round(ss.score, 1),
                 "weight": ss.weight,
                 "weighted_score": round(ss.weighted_score, 1),
                 "commentary": ss.commentary,
                 "components": ss.components,
-            })
+            }
+            for ss in self.sub_scores
+        ]
+        if detail == "summary":
+            return
+        yield "strengths", self.strengths
+        yield "weaknesses", self.weaknesses
+        yield "recommendations", self.recommendations
+        yield "rus_eligibility", self.rus_eligibility
+        yield "lpo_eligibility", self.lpo_eligibility
 
         if self.financial_summary:
             fs = self.financial_summary
-            result["financial_metrics"] = {
-                "npv_project": round(fs.npv_project, 0),
-                "npv_equity": round(fs.npv_equity, 0),
+            # Round every whole-dollar value (the two NPVs, then six columns
+            # per cash-flow year) in one call; np.round to 0 decimals matches
+            # round(x, 0). Values kept at 1-2 decimals stay on round(), which
+            # np.round does not reproduce exactly.
+            flows = fs.annual_cash_flows
+            whole_dollars = [fs.npv_project, fs.npv_equity]
+            for cf in flows:
+                whole_dollars.extend(_CASH_FLOW_DOLLAR_FIELDS(cf))
+            whole_dollars = np.round(np.array(whole_dollars, dtype=np.float64), 0)
+            npv_project, npv_equity = whole_dollars[:2].tolist()
+            dollars = whole_dollars[2:].reshape(-1, len(_CASH_FLOW_DOLLAR_COLUMNS)).tolist()
+            yield "financial_metrics", {
+                "npv_project": npv_project,
+                "npv_equity": npv_equity,
                 "irr_project": round(fs.irr_project * 100, 2),
                 "irr_equity": round(fs.irr_equity * 100, 2),
                 "lcoe": round(fs.lcoe, 2),
@@ -82,22 +185,23 @@ class BankabilityResult:
                 "debt_yield": round(fs.debt_yield * 100, 2),
                 "equity_multiple": round(fs.equity_multiple, 2),
             }
-            result["cash_flows"] = []
-            for cf in fs.annual_cash_flows:
-                result["cash_flows"].append({
+            yield "cash_flows", [
+                {
                     "year": cf.year,
-                    "revenue": round(cf.revenue, 0),
-                    "opex": round(cf.opex, 0),
-                    "noi": round(cf.net_operating_income, 0),
-                    "debt_service": round(cf.debt_service, 0),
+                    "revenue": revenue,
+                    "opex": opex,
+                    "noi": noi,
+                    "debt_service": debt_service,
                     "dscr": round(cf.dscr, 2) if cf.dscr != float("inf") else 999.99,
-                    "free_cash_flow": round(cf.free_cash_flow_equity, 0),
-                    "cumulative_cf": round(cf.cumulative_cash_flow, 0),
-                })
+                    "free_cash_flow": fcfe,
+                    "cumulative_cf": cumulative,
+                }
+                for cf, (revenue, opex, noi, debt_service, fcfe, cumulative) in zip(flows, dollars)
+            ]
 
         if self.credit_assessment:
             ca = self.credit_assessment
-            result["credit_metrics"] = {
+            yield "credit_metrics", {
                 "probability_of_default": round(ca.probability_of_default * 10000, 1),
                 "loss_given_default": round(ca.loss_given_default * 100, 1),
                 "expected_loss": round(ca.expected_loss, 0),
@@ -110,7 +214,73 @@ class BankabilityResult:
                 "mitigants": ca.mitigants,
             }
 
-        return result
+    def to_dict(self, detail="full"):
+        """
+        Serialize the result. The rounded payload is built once and reused
+        until a field is reassigned. Each call returns new copies of the
+        containers built here (sub-scores, metrics and cash-flow rows);
+        list and dict fields are passed through by reference as in
+        shallow_items(). In-place edits to those fields do not refresh the
+        cache.
+
+        detail="summary" returns only the overall score, grade and
+        sub-scores, skipping the narrative, eligibility and metric sections.
+        """
+        if detail != "full":
+            return dict(self.shallow_items(detail))
+        if self._serialized is None:
+            object.__setattr__(self, "_serialized", dict(self.shallow_items()))
+        payload = dict(self._serialized)
+        payload["sub_scores"] = [dict(ss) for ss in payload["sub_scores"]]
+        for key in ("financial_metrics", "credit_metrics"):
+            if key in payload:
+                payload[key] = dict(payload[key])
+        if "cash_flows" in payload:
+            payload["cash_flows"] = [dict(row) for row in payload["cash_flows"]]
+        return payload
+
+
+# Recommendation triggers, each called with (params, result)
+def _dscr_below_comfort(params, result):
+    fs = result.financial_summary
+    return bool(fs) and fs.minimum_dscr < 1.40
+
+
+def _reserves_unfunded(params, result):
+    return not params.structure.reserve_accounts_funded
+
+
+def _permits_outstanding(params, result):
+    return not params.technical.environmental_permits_secured
+
+
+def _interconnection_uncertain(params, result):
+    return params.market.interconnection_certainty in ("low", "speculative")
+
+
+def _no_independent_resource_assessment(params, result):
+    return not params.market.independent_resource_assessment
+
+
+def _merchant_offtake(params, result):
+    return params.credit.offtake_type == "merchant"
+
+
+def _default_risk_elevated(params, result):
+    ca = result.credit_assessment
+    return bool(ca) and ca.probability_of_default > 0.01
+
+
+def _epc_not_turnkey(params, result):
+    return params.structure.epc_contract_type != "fixed_price_turnkey"
+
+
+def _rus_eligible(params, result):
+    return params.is_rural and result.rus_eligibility.get("eligible")
+
+
+def _lpo_eligible(params, result):
+    return result.lpo_eligibility.get("potentially_eligible")
 
 
 class BankabilityScorer:
@@ -128,13 +298,190 @@ class BankabilityScorer:
         "Market & Resource": 0.15,
     }
 
+    # Sub-score order used throughout score(), and the matching weights
+    _CATEGORIES = tuple(WEIGHTS)
+    _WEIGHTS = tuple(WEIGHTS.values())
+    _WEIGHTS_VEC = _frozen_array(_WEIGHTS)
+
+    # Component tables shown under each sub-score: (name, attribute, formatter)
+    _TECHNOLOGY_COMPONENTS = (
+        ("Technology Type", "technology_type", format_label),
+        ("Capacity", "nameplate_capacity_mw", "{:.1f} MW".format),
+        ("Capacity Factor", "capacity_factor", "{:.1%}".format),
+        ("TRL", "technology_readiness_level", "{}/9".format),
+        ("Availability", "availability_factor", "{:.1%}".format),
+        ("Permits Secured", "environmental_permits_secured", _yes_no),
+        ("Site Control", "site_control_secured", _yes_no),
+    )
+    _FINANCIAL_COMPONENTS = (
+        ("Project IRR", "irr_project", "{:.1%}".format),
+        ("Equity IRR", "irr_equity", "{:.1%}".format),
+        ("NPV (Project)", "npv_project", "${:,.0f}".format),
+        ("Min DSCR", "minimum_dscr", "{:.2f}x".format),
+        ("Avg DSCR", "average_dscr", "{:.2f}x".format),
+        ("LCOE", "lcoe", "${:.2f}/MWh".format),
+        ("Payback", "payback_years", "{:.1f} years".format),
+        ("Debt Yield", "debt_yield", "{:.1%}".format),
+        ("Equity Multiple", "equity_multiple", "{:.2f}x".format),
+    )
+    _CREDIT_COMPONENTS = (
+        ("Equivalent Rating", "credit_rating_equivalent", _as_is),
+        ("Risk Category", "risk_category", _as_is),
+        ("PD", "probability_of_default", "{:.2%}".format),
+        ("LGD", "loss_given_default", "{:.0%}".format),
+        ("Expected Loss", "expected_loss", "${:,.0f}".format),
+        ("Credit Spread", "credit_spread_bps", "{} bps".format),
+    )
+    _STRUCTURE_COMPONENTS = (
+        ("EPC Type", "epc_contract_type", format_label),
+        ("Contractor", "epc_contractor_experience", str.title),
+        ("Performance Guarantee", "performance_guarantee", _yes_no),
+        ("Completion Guarantee", "completion_guarantee", _yes_no),
+        ("Insurance", "insurance_coverage", str.title),
+        ("DSRA Funded", "reserve_accounts_funded", _yes_no),
+        ("DSRA Months", "debt_service_reserve_months", str),
+    )
+    _MARKET_COMPONENTS = (
+        ("Resource Quality", "resource_quality", str.title),
+        ("Assessment Basis", "resource_assessment_confidence", str.upper),
+        ("Independent Assessment", "independent_resource_assessment", _yes_no),
+        ("Interconnection", "interconnection_certainty", str.title),
+        ("Grid Congestion", "grid_congestion_risk", str.title),
+        ("Curtailment History", "curtailment_history_percent", "{:.1%}".format),
+    )
+
+    # Commentary ladders: (ascending cutoffs, texts from lowest band to highest)
+    _TECHNOLOGY_COMMENTARY = (
+        (40, 60, 80),
+        (
+            ("Technology readiness is below the threshold for conventional project finance. "
+             "Significant development milestones remain before bankability is achievable."),
+            ("Technology profile presents moderate risk. Additional performance data, "
+             "permitting progress, or site control would improve the assessment."),
+            ("Technology assessment is adequate for financing consideration. Some areas "
+             "could be strengthened to improve lender confidence."),
+            ("Technology profile is well-suited for project finance. Mature technology with "
+             "strong performance track record reduces execution risk."),
+        ),
+    )
+
+    _STRUCTURE_COMMENTARY = (
+        (35, 55, 75),
+        (
+            ("Structural framework requires substantial development before the project "
+             "is ready for lender due diligence."),
+            ("Project structure has notable gaps that would need to be addressed during "
+             "financing negotiations."),
+            ("Structural elements are broadly adequate but would benefit from additional "
+             "protections such as funded reserves or enhanced guarantees."),
+            ("Project structure includes strong contractual protections and risk allocation "
+             "appropriate for project finance."),
+        ),
+    )
+
+    _MARKET_COMMENTARY = (
+        (35, 55, 75),
+        (
+            ("Market and resource fundamentals are weak. Substantial de-risking is needed "
+             "before lenders will consider the project bankable."),
+            ("Market conditions present material risk. Resource quality, interconnection "
+             "certainty, or curtailment exposure may limit financing options."),
+            ("Market environment is adequate for project viability. An independent resource "
+             "assessment and interconnection progress would strengthen the profile."),
+            ("Market and resource conditions are favorable, with strong resource assessment, "
+             "clear interconnection path, and manageable congestion risk."),
+        ),
+    )
+
+    # Recommendations in output order: (trigger, text)
+    _RECOMMENDATIONS = (
+        (_dscr_below_comfort,
+         "Consider restructuring the capital stack to improve DSCR -- options include "
+         "increasing equity contribution, extending debt tenor, or reducing operating costs."),
+        (_reserves_unfunded,
+         "Fund a debt service reserve account (minimum 6 months of debt service) to "
+         "provide liquidity cushion and satisfy standard lender requirements."),
+        (_permits_outstanding,
+         "Secure all required environmental permits before approaching lenders to "
+         "eliminate permitting risk from the financing discussion."),
+        (_interconnection_uncertain,
+         "Advance interconnection studies and secure an interconnection agreement "
+         "to de-risk the grid connection timeline."),
+        (_no_independent_resource_assessment,
+         "Commission an independent resource assessment to provide lenders with "
+         "third-party validation of expected energy production."),
+        (_merchant_offtake,
+         "Secure a long-term offtake agreement (PPA or tolling) to provide "
+         "contracted revenue certainty required for project finance."),
+        (_default_risk_elevated,
+         "Explore credit enhancement mechanisms such as letters of credit, "
+         "guarantees, or credit wraps to improve the credit profile."),
+        (_epc_not_turnkey,
+         "Negotiate a fixed-price turnkey EPC contract to transfer construction "
+         "cost and schedule risk to an experienced contractor."),
+        (_rus_eligible,
+         "Project appears eligible for USDA RUS financing. Consider preparing "
+         "a Form 201 application to access below-market interest rates."),
+        (_lpo_eligible,
+         "Project may qualify for DOE LPO Title XVII loan guarantee. "
+         "Evaluate whether the technology meets the innovation threshold."),
+    )
+
     def __init__(self, project_params):
+        # Imported here so loading the scoring tables does not pull in the
+        # models; after the first call this is a sys.modules lookup.
+        from app.models.financial import FinancialModel
+        from app.models.credit_risk import CreditRiskModel
+
         self.params = project_params
         self.financial_model = FinancialModel(project_params)
         self.credit_model = CreditRiskModel(project_params)
 
     def score(self):
         """Run the complete bankability assessment."""
+        result, raws = self._evaluate()
+
+        weighted = np.array(raws, dtype=np.float64) * self._WEIGHTS_VEC
+        result.overall_score = float(weighted.sum())
+        self._attach_sub_scores(result, raws, weighted.tolist())
+        result.grade, result.grade_label, result.grade_color = _grade_info(result.overall_score)
+        self._finish(result)
+
+        return result
+
+    @classmethod
+    def score_batch(cls, param_list):
+        """
+        Score many projects, returning one BankabilityResult per project.
+        The models and narratives still run per project, but the weighted
+        composites and grades are computed for the whole batch at once.
+        """
+        scorers = [cls(params) for params in param_list]
+        evaluated = [scorer._evaluate() for scorer in scorers]
+        if not evaluated:
+            return []
+
+        raws = np.array([raw for _, raw in evaluated], dtype=np.float64)
+        weighted = raws * cls._WEIGHTS_VEC
+        overall = weighted.sum(axis=1)
+        graded = overall >= _GRADE_CUTOFF_ARRAY[0]
+        grade_index = np.searchsorted(_GRADE_CUTOFF_ARRAY, overall, side="right") - 1
+
+        results = []
+        for scorer, (result, raw), row, score, has_grade, index in zip(
+            scorers, evaluated, weighted.tolist(), overall.tolist(),
+            graded.tolist(), grade_index.tolist(),
+        ):
+            result.overall_score = score
+            scorer._attach_sub_scores(result, raw, row)
+            if has_grade:
+                result.grade, result.grade_label, result.grade_color = _GRADE_INFO[index]
+            scorer._finish(result)
+            results.append(result)
+        return results
+
+    def _evaluate(self):
+        """Run the financial and credit models; return (result, raw sub-scores)."""
         result = BankabilityResult()
 
         financial_summary = self.financial_model.build_pro_forma()
@@ -143,154 +490,67 @@ class BankabilityScorer:
         result.financial_summary = financial_summary
         result.credit_assessment = credit_assessment
 
-        # Technology score
-        tech_raw = self.params.technical.efficiency_score()
-        tech_sub = SubScore(
-            category="Technology & Performance",
-            score=tech_raw,
-            weight=self.WEIGHTS["Technology & Performance"],
-            weighted_score=tech_raw * self.WEIGHTS["Technology & Performance"],
+        params = self.params
+        raws = (
+            params.technical.efficiency_score(),
+            self.financial_model.financial_strength_score(financial_summary),
+            credit_assessment.overall_credit_score,
+            params.structure.structure_score(),
+            params.market.market_score(),
         )
-        tech_sub.components = self._technology_components()
-        tech_sub.commentary = self._technology_commentary(tech_raw)
-        result.sub_scores.append(tech_sub)
-
-        # Financial score
-        fin_raw = self.financial_model.financial_strength_score(financial_summary)
-        fin_sub = SubScore(
-            category="Financial Strength",
-            score=fin_raw,
-            weight=self.WEIGHTS["Financial Strength"],
-            weighted_score=fin_raw * self.WEIGHTS["Financial Strength"],
+        return result, raws
+
+    def _attach_sub_scores(self, result, raws, weighted):
+        """Build the SubScore list from raw and weighted sub-scores."""
+        financial_summary = result.financial_summary
+        credit_assessment = result.credit_assessment
+        tech_raw, fin_raw, credit_raw, struct_raw, market_raw = raws
+
+        components = (
+            self._technology_components(),
+            self._financial_components(financial_summary),
+            self._credit_components(credit_assessment),
+            self._structure_components(),
+            self._market_components(),
         )
-        fin_sub.components = self._financial_components(financial_summary)
-        fin_sub.commentary = self._financial_commentary(financial_summary, fin_raw)
-        result.sub_scores.append(fin_sub)
-
-        # Credit score
-        credit_raw = credit_assessment.overall_credit_score
-        credit_sub = SubScore(
-            category="Credit & Counterparty",
-            score=credit_raw,
-            weight=self.WEIGHTS["Credit & Counterparty"],
-            weighted_score=credit_raw * self.WEIGHTS["Credit & Counterparty"],
+        commentary = (
+            self._technology_commentary(tech_raw),
+            self._financial_commentary(financial_summary, fin_raw),
+            self._credit_commentary(credit_assessment, credit_raw),
+            self._structure_commentary(struct_raw),
+            self._market_commentary(market_raw),
         )
-        credit_sub.components = self._credit_components(credit_assessment)
-        credit_sub.commentary = self._credit_commentary(credit_assessment, credit_raw)
-        result.sub_scores.append(credit_sub)
-
-        # Structure score
-        struct_raw = self.params.structure.structure_score()
-        struct_sub = SubScore(
-            category="Project Structure",
-            score=struct_raw,
-            weight=self.WEIGHTS["Project Structure"],
-            weighted_score=struct_raw * self.WEIGHTS["Project Structure"],
-        )
-        struct_sub.components = self._structure_components()
-        struct_sub.commentary = self._structure_commentary(struct_raw)
-        result.sub_scores.append(struct_sub)
-
-        # Market score
-        market_raw = self.params.market.market_score()
-        market_sub = SubScore(
-            category="Market & Resource",
-            score=market_raw,
-            weight=self.WEIGHTS["Market & Resource"],
-            weighted_score=market_raw * self.WEIGHTS["Market & Resource"],
-        )
-        market_sub.components = self._market_components()
-        market_sub.commentary = self._market_commentary(market_raw)
-        result.sub_scores.append(market_sub)
-
-        result.overall_score = sum(ss.weighted_score for ss in result.sub_scores)
-
-        for grade, info in SCORE_THRESHOLDS.items():
-            if result.overall_score >= info["min"]:
-                result.grade = grade
-                result.grade_label = info["label"]
-                result.grade_color = info["color"]
-                break
-
-        result.strengths = self._identify_strengths(result)
-        result.weaknesses = self._identify_weaknesses(result)
-        result.recommendations = self._generate_recommendations(result)
+        result.sub_scores = [
+            SubScore(category, raw, weight, weighted_score, comps, text)
+            for category, raw, weight, weighted_score, comps, text in zip(
+                self._CATEGORIES, raws, self._WEIGHTS, weighted,
+                components, commentary,
+            )
+        ]
+
+    def _finish(self, result):
+        """Add the narrative and program eligibility to a graded result."""
+        result.strengths, result.weaknesses, result.recommendations = self._build_narrative(result)
         result.rus_eligibility = self._check_rus_eligibility()
         result.lpo_eligibility = self._check_lpo_eligibility()
 
-        return result
-
     def _technology_components(self):
-        tp = self.params.technical
-        return [
-            {"name": "Technology Type", "value": tp.technology_type.replace("_", " ").title()},
-            {"name": "Capacity", "value": f"{tp.nameplate_capacity_mw:.1f} MW"},
-            {"name": "Capacity Factor", "value": f"{tp.capacity_factor:.1%}"},
-            {"name": "TRL", "value": f"{tp.technology_readiness_level}/9"},
-            {"name": "Availability", "value": f"{tp.availability_factor:.1%}"},
-            {"name": "Permits Secured", "value": "Yes" if tp.environmental_permits_secured else "No"},
-            {"name": "Site Control", "value": "Yes" if tp.site_control_secured else "No"},
-        ]
+        return _format_components(self._TECHNOLOGY_COMPONENTS, self.params.technical)
 
     def _financial_components(self, fs):
-        return [
-            {"name": "Project IRR", "value": f"{fs.irr_project:.1%}"},
-            {"name": "Equity IRR", "value": f"{fs.irr_equity:.1%}"},
-            {"name": "NPV (Project)", "value": f"${fs.npv_project:,.0f}"},
-            {"name": "Min DSCR", "value": f"{fs.minimum_dscr:.2f}x"},
-            {"name": "Avg DSCR", "value": f"{fs.average_dscr:.2f}x"},
-            {"name": "LCOE", "value": f"${fs.lcoe:.2f}/MWh"},
-            {"name": "Payback", "value": f"{fs.payback_years:.1f} years"},
-            {"name": "Debt Yield", "value": f"{fs.debt_yield:.1%}"},
-            {"name": "Equity Multiple", "value": f"{fs.equity_multiple:.2f}x"},
-        ]
+        return _format_components(self._FINANCIAL_COMPONENTS, fs)
 
     def _credit_components(self, ca):
-        return [
-            {"name": "Equivalent Rating", "value": ca.credit_rating_equivalent},
-            {"name": "Risk Category", "value": ca.risk_category},
-            {"name": "PD", "value": f"{ca.probability_of_default:.2%}"},
-            {"name": "LGD", "value": f"{ca.loss_given_default:.0%}"},
-            {"name": "Expected Loss", "value": f"${ca.expected_loss:,.0f}"},
-            {"name": "Credit Spread", "value": f"{ca.credit_spread_bps} bps"},
-        ]
+        return _format_components(self._CREDIT_COMPONENTS, ca)
 
     def _structure_components(self):
-        sp = self.params.structure
-        return [
-            {"name": "EPC Type", "value": sp.epc_contract_type.replace("_", " ").title()},
-            {"name": "Contractor", "value": sp.epc_contractor_experience.title()},
-            {"name": "Performance Guarantee", "value": "Yes" if sp.performance_guarantee else "No"},
-            {"name": "Completion Guarantee", "value": "Yes" if sp.completion_guarantee else "No"},
-            {"name": "Insurance", "value": sp.insurance_coverage.title()},
-            {"name": "DSRA Funded", "value": "Yes" if sp.reserve_accounts_funded else "No"},
-            {"name": "DSRA Months", "value": str(sp.debt_service_reserve_months)},
-        ]
+        return _format_components(self._STRUCTURE_COMPONENTS, self.params.structure)
 
     def _market_components(self):
-        mp = self.params.market
-        return [
-            {"name": "Resource Quality", "value": mp.resource_quality.title()},
-            {"name": "Assessment Basis", "value": mp.resource_assessment_confidence.upper()},
-            {"name": "Independent Assessment", "value": "Yes" if mp.independent_resource_assessment else "No"},
-            {"name": "Interconnection", "value": mp.interconnection_certainty.title()},
-            {"name": "Grid Congestion", "value": mp.grid_congestion_risk.title()},
-            {"name": "Curtailment History", "value": f"{mp.curtailment_history_percent:.1%}"},
-        ]
+        return _format_components(self._MARKET_COMPONENTS, self.params.market)
 
     def _technology_commentary(self, score):
-        if score >= 80:
-            return ("Technology profile is well-suited for project finance. Mature technology with "
-                    "strong performance track record reduces execution risk.")
-        elif score >= 60:
-            return ("Technology assessment is adequate for financing consideration. Some areas "
-                    "could be strengthened to improve lender confidence.")
-        elif score >= 40:
-            return ("Technology profile presents moderate risk. Additional performance data, "
-                    "permitting progress, or site control would improve the assessment.")
-        else:
-            return ("Technology readiness is below the threshold for conventional project finance. "
-                    "Significant development milestones remain before bankability is achievable.")
+        return _threshold_text(self._TECHNOLOGY_COMMENTARY, score)
 
     def _financial_commentary(self, fs, score):
         parts = []
@@ -335,119 +595,60 @@ class BankabilityScorer:
         return " ".join(parts)
 
     def _structure_commentary(self, score):
-        if score >= 75:
-            return ("Project structure includes strong contractual protections and risk allocation "
-                    "appropriate for project finance.")
-        elif score >= 55:
-            return ("Structural elements are broadly adequate but would benefit from additional "
-                    "protections such as funded reserves or enhanced guarantees.")
-        elif score >= 35:
-            return ("Project structure has notable gaps that would need to be addressed during "
-                    "financing negotiations.")
-        else:
-            return ("Structural framework requires substantial development before the project "
-                    "is ready for lender due diligence.")
+        return _threshold_text(self._STRUCTURE_COMMENTARY, score)
 
     def _market_commentary(self, score):
-        if score >= 75:
-            return ("Market and resource conditions are favorable, with strong resource assessment, "
-                    "clear interconnection path, and manageable congestion risk.")
-        elif score >= 55:
-            return ("Market environment is adequate for project viability. An independent resource "
-                    "assessment and interconnection progress would strengthen the profile.")
-        elif score >= 35:
-            return ("Market conditions present material risk. Resource quality, interconnection "
-                    "certainty, or curtailment exposure may limit financing options.")
-        else:
-            return ("Market and resource fundamentals are weak. Substantial de-risking is needed "
-                    "before lenders will consider the project bankable.")
+        return _threshold_text(self._MARKET_COMMENTARY, score)
 
-    def _identify_strengths(self, result):
+    def _build_narrative(self, result):
+        """Derive strengths, weaknesses and recommendations in a single pass."""
         strengths = []
-        for ss in result.sub_scores:
-            if ss.score >= 75:
-                strengths.append(f"Strong {ss.category.lower()} profile (score: {ss.score:.0f}/100).")
+        weaknesses = []
         fs = result.financial_summary
-        if fs and fs.minimum_dscr >= 1.40:
-            strengths.append(f"Debt coverage of {fs.minimum_dscr:.2f}x exceeds typical lender minimums.")
-        if fs and fs.irr_project >= 0.10:
-            strengths.append(f"Project returns ({fs.irr_project:.1%} IRR) support equity investment.")
-        if self.params.technical.environmental_permits_secured and self.params.technical.site_control_secured:
-            strengths.append("Key development milestones (permits, site control) have been achieved.")
-        if self.params.credit.offtake_type in ("ppa_fixed", "regulated_rate"):
-            strengths.append("Contracted revenue provides cash flow predictability.")
-        return strengths
+        ca = result.credit_assessment
+        params = self.params
+        tp = params.technical
+        offtake_type = params.credit.offtake_type
 
-    def _identify_weaknesses(self, result):
-        weaknesses = []
         for ss in result.sub_scores:
-            if ss.score < 50:
+            if ss.score >= 75:
+                strengths.append(f"Strong {ss.category.lower()} profile (score: {ss.score:.0f}/100).")
+            elif ss.score < 50:
                 weaknesses.append(f"Weak {ss.category.lower()} profile (score: {ss.score:.0f}/100) "
                                   f"requires attention.")
-        fs = result.financial_summary
-        if fs and fs.minimum_dscr < 1.20:
-            weaknesses.append(f"DSCR of {fs.minimum_dscr:.2f}x is below the 1.20x minimum for most lenders.")
-        if fs and fs.irr_project < 0.06:
-            weaknesses.append(f"Project IRR of {fs.irr_project:.1%} may not attract equity capital.")
-        ca = result.credit_assessment
+
+        if fs:
+            min_dscr = fs.minimum_dscr
+            irr = fs.irr_project
+            if min_dscr >= 1.40:
+                strengths.append(f"Debt coverage of {min_dscr:.2f}x exceeds typical lender minimums.")
+            elif min_dscr < 1.20:
+                weaknesses.append(f"DSCR of {min_dscr:.2f}x is below the 1.20x minimum for most lenders.")
+            if irr >= 0.10:
+                strengths.append(f"Project returns ({irr:.1%} IRR) support equity investment.")
+            elif irr < 0.06:
+                weaknesses.append(f"Project IRR of {irr:.1%} may not attract equity capital.")
+        if tp.environmental_permits_secured and tp.site_control_secured:
+            strengths.append("Key development milestones (permits, site control) have been achieved.")
+        if offtake_type in ("ppa_fixed", "regulated_rate"):
+            strengths.append("Contracted revenue provides cash flow predictability.")
         if ca and ca.risk_category in ("High", "Very High"):
             weaknesses.append(f"Credit risk category of '{ca.risk_category}' limits access to "
                               f"low-cost financing.")
-        return weaknesses
-
-    def _generate_recommendations(self, result):
-        recs = []
-        fs = result.financial_summary
-        ca = result.credit_assessment
-
-        if fs and fs.minimum_dscr < 1.40:
-            recs.append("Consider restructuring the capital stack to improve DSCR -- options include "
-                        "increasing equity contribution, extending debt tenor, or reducing operating costs.")
-
-        if not self.params.structure.reserve_accounts_funded:
-            recs.append("Fund a debt service reserve account (minimum 6 months of debt service) to "
-                        "provide liquidity cushion and satisfy standard lender requirements.")
-
-        if not self.params.technical.environmental_permits_secured:
-            recs.append("Secure all required environmental permits before approaching lenders to "
-                        "eliminate permitting risk from the financing discussion.")
-
-        if self.params.market.interconnection_certainty in ("low", "speculative"):
-            recs.append("Advance interconnection studies and secure an interconnection agreement "
-                        "to de-risk the grid connection timeline.")
 
-        if not self.params.market.independent_resource_assessment:
-            recs.append("Commission an independent resource assessment to provide lenders with "
-                        "third-party validation of expected energy production.")
+        recs = [text for applies, text in self._RECOMMENDATIONS if applies(params, result)]
 
-        if self.params.credit.offtake_type == "merchant":
-            recs.append("Secure a long-term offtake agreement (PPA or tolling) to provide "
-                        "contracted revenue certainty required for project finance.")
-
-        if ca and ca.probability_of_default > 0.01:
-            recs.append("Explore credit enhancement mechanisms such as letters of credit, "
-                        "guarantees, or credit wraps to improve the credit profile.")
-
-        if self.params.structure.epc_contract_type != "fixed_price_turnkey":
-            recs.append("Negotiate a fixed-price turnkey EPC contract to transfer construction "
-                        "cost and schedule risk to an experienced contractor.")
-
-        if self.params.is_rural and result.rus_eligibility.get("eligible"):
-            recs.append("Project appears eligible for USDA RUS financing. Consider preparing "
-                        "a Form 201 application to access below-market interest rates.")
-
-        if result.lpo_eligibility.get("potentially_eligible"):
-            recs.append("Project may qualify for DOE LPO Title XVII loan guarantee. "
-                        "Evaluate whether the technology meets the innovation threshold.")
-
-        return recs
+        return strengths, weaknesses, recs
 
     def _check_rus_eligibility(self):
         """Evaluate preliminary eligibility for USDA Rural Utilities Service financing."""
         eligible = True
         criteria = []
+        params = self.params
+        total_cost = params.financial.total_project_cost
+        dscr = params.financial.dscr
 
-        if self.params.is_rural:
+        if params.is_rural:
             criteria.append({"criterion": "Rural location", "met": True,
                              "detail": "Project is located in a rural area."})
         else:
@@ -456,26 +657,25 @@ class BankabilityScorer:
                              "detail": "RUS financing requires the project to serve a rural area. "
                                        "Review USDA rural designation maps for eligibility."})
 
-        eligible_entities = ["cooperative", "municipal_utility", "tribal_utility", "state_authority"]
-        if self.params.entity_type in eligible_entities:
+        if params.entity_type in _RUS_ELIGIBLE_ENTITIES:
             criteria.append({"criterion": "Eligible entity type", "met": True,
-                             "detail": f"{self.params.entity_type.replace('_', ' ').title()} is an eligible borrower type."})
+                             "detail": f"{format_label(params.entity_type)} is an eligible borrower type."})
         else:
             eligible = False
             criteria.append({"criterion": "Eligible entity type", "met": False,
                              "detail": "RUS typically finances cooperatives, municipal utilities, and tribal utilities."})
 
-        if self.params.financial.total_project_cost > 0:
+        if total_cost > 0:
             criteria.append({"criterion": "Project cost defined", "met": True,
-                             "detail": f"Total project cost of ${self.params.financial.total_project_cost:,.0f}."})
+                             "detail": f"Total project cost of ${total_cost:,.0f}."})
         else:
             eligible = False
             criteria.append({"criterion": "Project cost defined", "met": False,
                              "detail": "A defined project cost is required for RUS application."})
 
-        if self.params.financial.dscr >= 1.0:
+        if dscr >= 1.0:
             criteria.append({"criterion": "Financial feasibility", "met": True,
-                             "detail": f"DSCR of {self.params.financial.dscr:.2f}x indicates "
+                             "detail": f"DSCR of {dscr:.2f}x indicates "
                                        f"sufficient revenue coverage."})
         else:
             eligible = False
@@ -495,21 +695,20 @@ class BankabilityScorer:
         """Evaluate preliminary eligibility for DOE Loan Programs Office Title XVII guarantee."""
         potentially_eligible = True
         criteria = []
+        technology_type = self.params.technical.technology_type
+        financial = self.params.financial
+        dscr = financial.dscr
 
-        innovative_technologies = [
-            "battery_storage", "offshore_wind", "geothermal", "solar_plus_storage",
-            "microgrids", "grid_modernization",
-        ]
-        if self.params.technical.technology_type in innovative_technologies:
+        if technology_type in _LPO_INNOVATIVE_TECHS:
             criteria.append({"criterion": "Innovative technology", "met": True,
-                             "detail": f"{self.params.technical.technology_type.replace('_', ' ').title()} "
+                             "detail": f"{format_label(technology_type)} "
                                        f"may qualify as an innovative energy technology."})
         else:
             criteria.append({"criterion": "Innovative technology", "met": "Uncertain",
                              "detail": "Technology must employ a new or significantly improved technology "
                                        "compared to commercial technologies in service."})
 
-        if self.params.financial.total_project_cost >= 25_000_000:
+        if financial.total_project_cost >= 25_000_000:
             criteria.append({"criterion": "Minimum project size", "met": True,
                              "detail": "Project size exceeds typical minimum for LPO consideration."})
         else:
@@ -520,9 +719,9 @@ class BankabilityScorer:
         criteria.append({"criterion": "Environmental review", "met": "Required",
                          "detail": "NEPA environmental review will be required as part of the application."})
 
-        if self.params.financial.dscr >= 1.20:
+        if dscr >= 1.20:
             criteria.append({"criterion": "Credit assessment", "met": True,
-                             "detail": f"DSCR of {self.params.financial.dscr:.2f}x supports "
+                             "detail": f"DSCR of {dscr:.2f}x supports "
                                        f"reasonable prospect of repayment."})
         else:
             potentially_eligible = False
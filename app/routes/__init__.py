@@ -1,6 +1,28 @@
-from app.routes.main_routes import main_bp
-from app.routes.project_routes import project_bp
-from app.routes.analysis_routes import analysis_bp
-from app.routes.report_routes import report_bp
+"""
+Route blueprints. Each blueprint module is imported on first access, so
+importing one of them does not load the others.
+"""
 
-__all__ = ["main_bp", "project_bp", "analysis_bp", "report_bp"]
+import importlib
+
+_BLUEPRINT_MODULES = {
+    "main_bp": "app.routes.main_routes",
+    "project_bp": "app.routes.project_routes",
+    "analysis_bp": "app.routes.analysis_routes",
+    "report_bp": "app.routes.report_routes",
+}
+
+__all__ = list(_BLUEPRINT_MODULES)
+
+
+def __getattr__(name):
+    module = _BLUEPRINT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    blueprint = getattr(importlib.import_module(module), name)
+    globals()[name] = blueprint
+    return blueprint
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
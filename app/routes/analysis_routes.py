@@ -1,14 +1,33 @@
+import operator
+
 from flask import Blueprint, render_template, redirect, url_for, flash, jsonify, request
-from app.analysis.bankability_score import run_bankability_assessment
-from app.financing.structures import FinancingStructureBuilder
-from app.models.project import ProjectParameters
-from app.session_store import store_get, store_set
+from app.session_store import store_get, store_get_params, store_set
+from app.utils.cache import REPORT_CACHE, hash_project
+from app.utils.calculations import today_iso
+from app.utils.export import export_results_json_bytes, make_json_response
+from app.utils.frozen import freeze
 
 analysis_bp = Blueprint("analysis", __name__)
 
+# Term-sheet key terms shown on the financing page, in display order
+_KEY_TERM_LABELS = (
+    "Borrower", "Project", "Facility", "Amount", "Tenor", "Amortization", "Pricing", "DSCR Covenant",
+)
+_KEY_TERM_GETTER = operator.itemgetter(
+    "borrower", "project", "facility_type", "amount", "tenor", "amortization", "pricing", "dscr_covenant",
+)
+
+# Structures that make the project eligible for the RUS and LPO form pages
+_RUS_STRUCTURES = frozenset({"rus_direct", "rus_guaranteed"})
+_LPO_STRUCTURES = frozenset({"doe_lpo"})
+
 
 @analysis_bp.route("/results")
 def results():
+    # Imported on first use so the scoring stack loads with the first
+    # assessment rather than with the app.
+    from app.analysis.bankability_score import run_bankability_assessment
+
     project_data = store_get("project_data")
     if not project_data:
         flash("No project data found. Please enter project details first.", "error")
@@ -31,17 +50,36 @@ def financing():
         flash("No project data found. Please enter project details first.", "error")
         return redirect(url_for("project.new_project"))
 
-    params = ProjectParameters.from_dict(project_data)
-    builder = FinancingStructureBuilder(params)
-    raw_structures = builder.recommend_structures()
-
+    params = store_get_params(project_data)
     assessment = store_get("assessment_results", {})
 
-    # Transform structures for the template
+    # Shared, read-only, with other sessions while the project (and date)
+    # are unchanged
+    today = today_iso()
+    payload = REPORT_CACHE.get_or_build(
+        ("financing", hash_project(params, today)),
+        lambda: freeze(_build_financing_payload(params, today)),
+    )
+
+    return render_template(
+        "financing.html",
+        project_name=params.project_name,
+        capacity_mw=params.technical.nameplate_capacity_mw,
+        technology=params.technical.technology_type.replace("_", " ").title(),
+        results=assessment,
+        **payload,
+    )
+
+
+def _build_financing_payload(params, today):
+    """Recommend structures and transform them and their term sheets for the template."""
+    from app.financing.structures import FinancingStructureBuilder
+
+    raw_structures = FinancingStructureBuilder(params).recommend_structures()
+
+    keys = [s["structure_key"] for s in raw_structures]
     structures = []
     term_sheets = []
-    rus_eligible = False
-    lpo_eligible = False
     for s in raw_structures:
         tmpl = s["template"]
         structures.append({
@@ -60,49 +98,33 @@ def financing():
         ts = s["term_sheet"]
         term_sheets.append({
             "title": ts["structure"],
-            "date_generated": __import__("datetime").date.today().isoformat(),
-            "key_terms": {
-                "Borrower": ts["borrower"],
-                "Project": ts["project"],
-                "Facility": ts["facility_type"],
-                "Amount": ts["amount"],
-                "Tenor": ts["tenor"],
-                "Amortization": ts["amortization"],
-                "Pricing": ts["pricing"],
-                "DSCR Covenant": ts["dscr_covenant"],
-            },
-            "security": [ts["security"]] if isinstance(ts["security"], str) else ts["security"],
+            "date_generated": today,
+            "key_terms": dict(zip(_KEY_TERM_LABELS, _KEY_TERM_GETTER(ts))),
+            "security": [ts["security"]],
             "conditions_precedent": ts["conditions_precedent"],
-            "covenants": {c: "" for c in ts["covenants"]} if isinstance(ts["covenants"], list) else ts["covenants"],
-            "reserves": {r: "" for r in ts["reserve_requirements"]} if isinstance(ts["reserve_requirements"], list) else ts["reserve_requirements"],
+            "covenants": dict.fromkeys(ts["covenants"], ""),
+            "reserves": dict.fromkeys(ts["reserve_requirements"], ""),
         })
-        if s["structure_key"] in ("rus_direct", "rus_guaranteed"):
-            rus_eligible = True
-        if s["structure_key"] == "doe_lpo":
-            lpo_eligible = True
 
-    return render_template(
-        "financing.html",
-        project_name=params.project_name,
-        capacity_mw=params.technical.nameplate_capacity_mw,
-        technology=params.technical.technology_type.replace("_", " ").title(),
-        structures=structures,
-        term_sheets=term_sheets,
-        rus_eligible=rus_eligible,
-        lpo_eligible=lpo_eligible,
-        results=assessment,
-    )
+    return {
+        "structures": structures,
+        "term_sheets": term_sheets,
+        "rus_eligible": not _RUS_STRUCTURES.isdisjoint(keys),
+        "lpo_eligible": not _LPO_STRUCTURES.isdisjoint(keys),
+    }
 
 
 @analysis_bp.route("/api/assess", methods=["POST"])
 def api_assess():
     """JSON API endpoint for programmatic access."""
+    from app.analysis.bankability_score import run_bankability_assessment
+
     project_data = request.get_json()
     if not project_data:
         return jsonify({"error": "No project data provided"}), 400
 
     try:
         assessment = run_bankability_assessment(project_data)
-        return jsonify(assessment)
+        return make_json_response(export_results_json_bytes(assessment, sort_keys=True))
     except Exception as e:
         return jsonify({"error": str(e)}), 500
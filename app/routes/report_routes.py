@@ -1,14 +1,193 @@
-from flask import Blueprint, render_template, redirect, url_for, flash, Response
-from app.models.project import ProjectParameters
-from app.financing.rus_form_201 import RUSForm201Generator
-from app.financing.doe_lpo_title_xvii import LPOTitleXVIIGenerator
-from app.models.scoring import BankabilityScorer
-from app.utils.export import export_results_json, build_summary_report
-from app.session_store import store_get
+import hashlib
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from flask import (
+    Blueprint, Response, current_app, flash, redirect, render_template, request, session, url_for,
+)
+from app.utils.export import (
+    export_results_json, export_results_json_bytes, build_summary_report, make_json_response,
+)
+from app.session_store import store_get, store_get_params
+from app.utils.cache import REPORT_CACHE, hash_project
+from app.utils.calculations import today_iso
+from app.utils.frozen import freeze
 
 report_bp = Blueprint("report", __name__)
 
 
+def _report_etag(*parts):
+    """
+    ETag for a report page whose content is fully determined by parts. The
+    APP_REVISION setting is mixed in so a deploy with changed templates or
+    code never revalidates a page rendered by the old release.
+    """
+    seed = "|".join((current_app.config["APP_REVISION"], *parts))
+    return hashlib.blake2b(seed.encode(), digest_size=16).hexdigest()
+
+
+def _conditional(response, etag):
+    """Tag a per-session page so browsers revalidate it before reuse."""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _not_modified(etag):
+    """
+    A 304 response when the client already holds this version of the page,
+    else None. Pending flash messages always force a full render, because
+    the cached page would not show them.
+    """
+    if "_flashes" in session or etag not in request.if_none_match:
+        return None
+    return _conditional(Response(status=304), etag)
+
+
+def _compile_field_map(entries):
+    """
+    Pre-split (dest, source_path, default) entries for _apply_map. dest is
+    "section.key"; a source_path of None always yields the default.
+    """
+    compiled = []
+    for dest, path, default in entries:
+        section, key = dest.split(".", 1)
+        parent, leaf = (path[:-1], path[-1]) if path else (None, None)
+        compiled.append((section, key, parent, leaf, default))
+    return tuple(compiled)
+
+
+def _apply_map(raw, field_map):
+    """
+    Flatten nested generator output into {section: {key: value}} following
+    a compiled field map. Missing keys along a path fall back to {} and then
+    to the entry's default, as chained dict.get calls would.
+    """
+    out = {}
+    parents = {}
+    for section, key, parent, leaf, default in field_map:
+        if parent is None:
+            value = default
+        else:
+            node = parents.get(parent)
+            if node is None:
+                node = raw
+                for step in parent:
+                    node = node.get(step, {})
+                parents[parent] = node
+            value = node.get(leaf, default)
+        out.setdefault(section, {})[key] = value
+    return out
+
+
+_RUS_A = ("section_a_borrower_info", "fields")
+_RUS_B = ("section_b_loan_request", "fields")
+_RUS_C = ("section_c_project_description", "fields")
+
+# Form 201 template fields read straight from the generator output
+_RUS_201_FIELD_MAP = _compile_field_map((
+    ("section_a.applicant_name", _RUS_A + ("borrower_name",), ""),
+    ("section_a.applicant_type", _RUS_A + ("borrower_type",), ""),
+    ("section_a.state", _RUS_A + ("state",), ""),
+    ("section_a.date_incorporated", None, "[Date of Incorporation]"),
+    ("section_a.physical_address", _RUS_A + ("principal_office_address",), ""),
+    ("section_a.mailing_address", _RUS_A + ("principal_office_address",), ""),
+    ("section_a.contact_name", _RUS_A + ("contact_name",), ""),
+    ("section_a.phone", _RUS_A + ("contact_phone",), ""),
+    ("section_a.email", _RUS_A + ("contact_email",), ""),
+    ("section_a.existing_borrower", None, "To Be Determined"),
+    ("section_a.borrower_designation", None, "[RUS Designation]"),
+    ("section_a.duns_number", None, "[DUNS Number]"),
+    ("section_b.loan_type", ("form_metadata", "loan_type"), ""),
+    ("section_b.loan_amount", _RUS_B + ("loan_amount_numeric",), 0),
+    ("section_b.loan_purpose", _RUS_B + ("loan_purpose",), ""),
+    ("section_b.interest_rate_type", _RUS_B + ("interest_rate_preference",), ""),
+    ("section_b.term_years", _RUS_B + ("loan_term_requested_years",), 0),
+    ("section_b.amortization_years", _RUS_B + ("loan_term_requested_years",), 0),
+    ("section_b.first_advance_date", _RUS_B + ("estimated_first_advance_date",), ""),
+    ("section_c.project_name", _RUS_C + ("project_name",), ""),
+    ("section_c.project_type", _RUS_C + ("technology_type",), ""),
+    ("section_c.technology", _RUS_C + ("technology_type",), ""),
+    ("section_c.capacity_mw", _RUS_C + ("nameplate_capacity_mw",), 0),
+    ("section_c.annual_generation_mwh", _RUS_C + ("expected_annual_generation_mwh",), 0),
+    ("section_c.location", _RUS_C + ("location_description",), ""),
+    ("section_c.rural_area", _RUS_C + ("rural_area_served",), ""),
+    ("section_c.consumers_served", None, "[Number of consumers]"),
+    ("section_c.target_cod", _RUS_C + ("target_commercial_operation",), ""),
+    ("section_c.useful_life", _RUS_C + ("expected_useful_life_years",), 0),
+    ("section_c.narrative", _RUS_C + ("project_description",), ""),
+))
+
+_LPO_SUMMARY = ("part_i_pre_application", "sections", "executive_summary")
+_LPO_TECH = ("part_i_pre_application", "sections", "technology_description")
+
+# Part I template fields read straight from the generator output
+_LPO_FIELD_MAP = _compile_field_map((
+    ("part_i.project_name", _LPO_SUMMARY + ("project_name",), ""),
+    ("part_i.applicant", _LPO_SUMMARY + ("applicant_name",), ""),
+    ("part_i.location", _LPO_SUMMARY + ("location",), ""),
+    ("part_i.technology_category", _LPO_TECH + ("technology_type",), ""),
+    ("part_i.technology_type", _LPO_TECH + ("technology_type",), ""),
+    ("part_i.jobs_construction", None, "[Estimate]"),
+    ("part_i.jobs_operations", None, "[Estimate]"),
+    ("part_i.eligible_category", ("application_metadata", "technology_category", "label"), ""),
+    ("part_i.statutory_authority", None,
+     "Energy Policy Act of 2005, Title XVII (42 U.S.C. 16511-16514)"),
+    ("part_i.innovation_narrative", _LPO_TECH + ("innovation_narrative",), ""),
+    ("part_i.equity_sponsors", None, "[To be identified]"),
+))
+
+
+# Table rows in the flattened payloads. Rows are frozen because cached
+# payloads are shared between requests.
+@dataclass(frozen=True, slots=True)
+class _CostLine:
+    category: str
+    amount: float
+
+
+@dataclass(frozen=True, slots=True)
+class _ComplianceItem:
+    requirement: str
+    status: str
+    detail: str
+
+
+@dataclass(frozen=True, slots=True)
+class _EligibilityCheck:
+    criterion: str
+    met: object
+    detail: str
+
+
+def _report_key(kind, params, with_assessment):
+    """Cache key for a report: project content, assessment state and day (generated forms carry dates)."""
+    return (kind, hash_project(params, with_assessment, today_iso()))
+
+
+def _cached_report(key, params, with_assessment, build):
+    """
+    Return build(params, with_assessment), reusing the result for the same
+    key. Payloads are shared across sessions, so they are frozen when built.
+    """
+    return REPORT_CACHE.get_or_build(key, lambda: freeze(build(params, with_assessment)))
+
+
+def _report_score(params):
+    """
+    BankabilityScorer result for a project, shared by the Form 201 and
+    Title XVII builders so opening both reports scores the project once.
+    The result never leaves these builders, which only read its financial
+    summary and credit assessment.
+    """
+    from app.models.scoring import BankabilityScorer
+
+    return REPORT_CACHE.get_or_build(
+        ("score", hash_project(params)), lambda: BankabilityScorer(params).score(),
+    )
+
+
 @report_bp.route("/summary")
 def summary_report():
     assessment = store_get("assessment_results")
@@ -16,8 +195,15 @@ def summary_report():
         flash("No assessment results found. Please run an assessment first.", "error")
         return redirect(url_for("project.new_project"))
 
+    digest = hashlib.blake2b(export_results_json_bytes(assessment)).hexdigest()
+    etag = _report_etag("summary", digest, today_iso())
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
     report = build_summary_report(assessment)
-    return render_template("report.html", report=report, results=assessment)
+    return _conditional(current_app.make_response(
+        render_template("report.html", report=report, results=assessment)), etag)
 
 
 @report_bp.route("/rus-201")
@@ -28,40 +214,51 @@ def rus_201():
         flash("No project data found.", "error")
         return redirect(url_for("project.new_project"))
 
-    params = ProjectParameters.from_dict(project_data)
+    params = store_get_params(project_data)
+    key = _report_key("rus_201", params, bool(assessment))
+    etag = _report_etag(*key)
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
+    form_data = _cached_report(key, params, bool(assessment), _build_rus_201_form_data)
+    return _conditional(current_app.make_response(
+        render_template("rus_201.html", form_data=form_data, project=project_data)), etag)
+
+
+def _build_rus_201_form_data(params, with_assessment):
+    """Generate Form 201 and flatten it for the rus_201.html template."""
+    # Imported on first use so workers that never serve a report skip
+    # loading the form generators.
+    from app.financing.rus_form_201 import RUSForm201Generator
+
     financial_summary = None
-    if assessment:
-        scorer = BankabilityScorer(params)
-        result = scorer.score()
-        financial_summary = result.financial_summary
+    if with_assessment:
+        financial_summary = _report_score(params).financial_summary
 
     generator = RUSForm201Generator(params, financial_summary)
-    raw = generator.generate()
+    raw = generator.sections()
 
     # Transform generator output to flat structure for the template
-    sec_a_fields = raw.get("section_a_borrower_info", {}).get("fields", {})
+    form_data = _apply_map(raw, _RUS_201_FIELD_MAP)
     sec_b_fields = raw.get("section_b_loan_request", {}).get("fields", {})
-    sec_c_fields = raw.get("section_c_project_description", {}).get("fields", {})
     sec_d_fields = raw.get("section_d_cost_estimates", {}).get("fields", {})
-    sec_e_fields = raw.get("section_e_financial_information", {}).get("fields", {})
     sec_f_fields = raw.get("section_f_economic_feasibility", {}).get("fields", {})
     sec_g_fields = raw.get("section_g_environmental", {}).get("fields", {})
     sec_h = raw.get("section_h_certifications", {})
     supporting = raw.get("supporting_documents", {})
 
-    # Parse the loan amount from the formatted string
-    loan_amount_str = sec_b_fields.get("loan_amount_requested", "$0")
-    loan_amount = sec_b_fields.get("loan_amount_numeric", 0)
+    loan_amount = form_data["section_b"]["loan_amount"]
+    form_data["section_b"]["construction_period"] = (
+        f"{sec_b_fields.get('construction_period_months', 0)} months"
+    )
 
     # Build cost breakdown list from nested dict
     cost_bd = sec_d_fields.get("cost_breakdown", {})
-    cost_breakdown = []
-    for key, item in cost_bd.items():
-        if isinstance(item, dict):
-            cost_breakdown.append({
-                "category": item.get("label", key),
-                "amount": item.get("amount_numeric", 0),
-            })
+    cost_breakdown = tuple(
+        _CostLine(item.get("label", key), item.get("amount_numeric", 0))
+        for key, item in cost_bd.items() if isinstance(item, dict)
+    )
 
     # Funding sources
     funding = sec_d_fields.get("funding_sources", {})
@@ -71,69 +268,35 @@ def rus_201():
     total_cost_numeric = sec_d_fields.get("total_project_cost_numeric", 0)
 
     # Financial ratios
-    noi = params.financial.net_operating_income
-    dscr = params.financial.dscr
+    fin = params.financial
+    noi = fin.net_operating_income
+    dscr = fin.dscr
+    equity = fin.equity_amount
+    debt = fin.debt_amount
 
     # Economic feasibility
     cost_benefit = sec_f_fields.get("cost_benefit_summary", {})
     detailed_metrics = sec_f_fields.get("detailed_metrics", {})
 
-    form_data = {
-        "section_a": {
-            "applicant_name": sec_a_fields.get("borrower_name", ""),
-            "applicant_type": sec_a_fields.get("borrower_type", ""),
-            "state": sec_a_fields.get("state", ""),
-            "date_incorporated": "[Date of Incorporation]",
-            "physical_address": sec_a_fields.get("principal_office_address", ""),
-            "mailing_address": sec_a_fields.get("principal_office_address", ""),
-            "contact_name": sec_a_fields.get("contact_name", ""),
-            "phone": sec_a_fields.get("contact_phone", ""),
-            "email": sec_a_fields.get("contact_email", ""),
-            "existing_borrower": "To Be Determined",
-            "borrower_designation": "[RUS Designation]",
-            "duns_number": "[DUNS Number]",
-        },
-        "section_b": {
-            "loan_type": raw.get("form_metadata", {}).get("loan_type", ""),
-            "loan_amount": loan_amount,
-            "loan_purpose": sec_b_fields.get("loan_purpose", ""),
-            "interest_rate_type": sec_b_fields.get("interest_rate_preference", ""),
-            "term_years": sec_b_fields.get("loan_term_requested_years", 0),
-            "amortization_years": sec_b_fields.get("loan_term_requested_years", 0),
-            "first_advance_date": sec_b_fields.get("estimated_first_advance_date", ""),
-            "construction_period": f"{sec_b_fields.get('construction_period_months', 0)} months",
-        },
-        "section_c": {
-            "project_name": sec_c_fields.get("project_name", ""),
-            "project_type": sec_c_fields.get("technology_type", ""),
-            "technology": sec_c_fields.get("technology_type", ""),
-            "capacity_mw": sec_c_fields.get("nameplate_capacity_mw", 0),
-            "annual_generation_mwh": sec_c_fields.get("expected_annual_generation_mwh", 0),
-            "location": sec_c_fields.get("location_description", ""),
-            "rural_area": sec_c_fields.get("rural_area_served", ""),
-            "consumers_served": "[Number of consumers]",
-            "target_cod": sec_c_fields.get("target_commercial_operation", ""),
-            "useful_life": sec_c_fields.get("expected_useful_life_years", 0),
-            "narrative": sec_c_fields.get("project_description", ""),
-        },
+    form_data.update({
         "section_d": {
             "cost_breakdown": cost_breakdown,
             "total_project_cost": total_cost_numeric,
             "sources": {
                 "loan": loan_amount,
-                "equity": params.financial.equity_amount,
+                "equity": equity,
                 "other": 0,
             },
         },
         "section_e": {
-            "equity": params.financial.equity_amount,
-            "total_assets": params.financial.total_project_cost,
-            "total_liabilities": params.financial.debt_amount,
-            "annual_revenue": params.financial.annual_revenue,
+            "equity": equity,
+            "total_assets": fin.total_project_cost,
+            "total_liabilities": debt,
+            "annual_revenue": fin.annual_revenue,
             "net_income": noi,
             "current_ratio": 1.5,
-            "debt_to_equity": f"{params.financial.leverage_ratio:.2f}",
-            "tier": f"{noi / max(params.financial.debt_amount * params.financial.interest_rate, 1):.2f}x",
+            "debt_to_equity": f"{fin.leverage_ratio:.2f}",
+            "tier": f"{noi / max(debt * fin.interest_rate, 1):.2f}x",
             "dsc": f"{dscr:.2f}x",
         },
         "section_f": {
@@ -151,9 +314,9 @@ def rus_201():
         "section_h": sec_h.get("certifications", {}),
         "supporting_documents": supporting.get("checklist", []),
         "eligibility_notes": raw.get("eligibility_notes", []),
-    }
+    })
 
-    return render_template("rus_201.html", form_data=form_data, project=project_data)
+    return form_data
 
 
 @report_bp.route("/lpo-xvii")
@@ -164,12 +327,26 @@ def lpo_xvii():
         flash("No project data found.", "error")
         return redirect(url_for("project.new_project"))
 
-    params = ProjectParameters.from_dict(project_data)
+    params = store_get_params(project_data)
+    key = _report_key("lpo_xvii", params, bool(assessment))
+    etag = _report_etag(*key)
+    not_modified = _not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
+    app_data = _cached_report(key, params, bool(assessment), _build_lpo_xvii_app_data)
+    return _conditional(current_app.make_response(
+        render_template("lpo_xvii.html", app_data=app_data, project=project_data)), etag)
+
+
+def _build_lpo_xvii_app_data(params, with_assessment):
+    """Generate the Title XVII application and flatten it for the lpo_xvii.html template."""
+    from app.financing.doe_lpo_title_xvii import LPOTitleXVIIGenerator
+
     financial_summary = None
     credit_assessment = None
-    if assessment:
-        scorer = BankabilityScorer(params)
-        result = scorer.score()
+    if with_assessment:
+        result = _report_score(params)
         financial_summary = result.financial_summary
         credit_assessment = result.credit_assessment
 
@@ -177,12 +354,12 @@ def lpo_xvii():
     raw = generator.generate()
 
     # Transform generator output to flatten for template
-    part_i_sections = raw.get("part_i_pre_application", {}).get("sections", {})
-    exec_summary = part_i_sections.get("executive_summary", {})
-    tech_desc = part_i_sections.get("technology_description", {})
-    fin_overview = part_i_sections.get("financial_overview", {})
+    app_data = _apply_map(raw, _LPO_FIELD_MAP)
 
-    guarantee_amount = params.financial.total_project_cost * 0.80
+    fin = params.financial
+    total_cost = fin.total_project_cost
+    dscr = fin.dscr
+    guarantee_amount = total_cost * 0.80
 
     # Build credit subsidy if available
     credit_summary_raw = raw.get("credit_assessment_summary", {})
@@ -191,7 +368,7 @@ def lpo_xvii():
     if subsidy_est:
         subsidy_range = subsidy_est.get("estimated_subsidy_range", {})
         credit_subsidy = {
-            "estimated_cost": params.financial.total_project_cost * 0.80 * 0.03,
+            "estimated_cost": guarantee_amount * 0.03,
             "subsidy_rate": 3.0,
             "guarantee_amount": guarantee_amount,
             "note": "Estimate based on typical range of 1-5% of guarantee amount.",
@@ -201,81 +378,68 @@ def lpo_xvii():
     part_ii_raw = raw.get("part_ii_full_application", {}).get("required_elements", {})
     part_ii_project_details = {}
     for key, element in part_ii_raw.items():
-        if isinstance(element, dict):
+        if isinstance(element, Mapping):
             part_ii_project_details[key.replace("_", " ").title()] = element.get("description", "")
 
     # Financial plan from params
     financial_plan = {
-        "Total Project Cost": params.financial.total_project_cost,
-        "Debt Amount": params.financial.debt_amount,
-        "Equity Amount": params.financial.equity_amount,
-        "Leverage": f"{params.financial.leverage_ratio:.0%}",
-        "Interest Rate": f"{params.financial.interest_rate:.2%}",
-        "Debt Tenor": f"{params.financial.debt_tenor_years} years",
-        "DSCR": f"{params.financial.dscr:.2f}x",
+        "Total Project Cost": total_cost,
+        "Debt Amount": fin.debt_amount,
+        "Equity Amount": fin.equity_amount,
+        "Leverage": f"{fin.leverage_ratio:.0%}",
+        "Interest Rate": f"{fin.interest_rate:.2%}",
+        "Debt Tenor": f"{fin.debt_tenor_years} years",
+        "DSCR": f"{dscr:.2f}x",
     }
     if financial_summary:
-        financial_plan["Project IRR"] = f"{financial_summary.irr_project * 100:.1f}%"
+        irr_text = f"{financial_summary.irr_project * 100:.1f}"
+        lcoe_text = f"{financial_summary.lcoe:.2f}"
+        financial_plan["Project IRR"] = f"{irr_text}%"
         financial_plan["Project NPV"] = financial_summary.npv_project
-        financial_plan["LCOE"] = f"${financial_summary.lcoe:.2f}/MWh"
+        financial_plan["LCOE"] = f"${lcoe_text}/MWh"
+    else:
+        irr_text = f"{0:.1f}"
+        lcoe_text = f"{0:.2f}"
 
     # Environmental
     env_raw = raw.get("environmental_requirements", {})
-    environmental = {}
-    for item in env_raw.get("required_environmental_data", []):
-        environmental[item] = "To Be Completed"
+    environmental = dict.fromkeys(env_raw.get("required_environmental_data", []), "To Be Completed")
 
     # Compliance
     compliance_raw = raw.get("compliance_requirements", {}).get("requirements", [])
-    compliance = []
-    for req in compliance_raw:
-        compliance.append({
-            "requirement": req.get("requirement", ""),
-            "status": "To Be Addressed",
-            "detail": req.get("description", ""),
-        })
+    compliance = tuple(
+        _ComplianceItem(req.get("requirement", ""), "To Be Addressed", req.get("description", ""))
+        for req in compliance_raw
+    )
 
     # Fee schedule
     fee_raw = raw.get("application_fees", {}).get("fees", [])
-    fee_schedule = {}
-    for fee in fee_raw:
-        fee_schedule[fee.get("fee", "")] = fee.get("amount", "")
+    fee_schedule = {fee.get("fee", ""): fee.get("amount", "") for fee in fee_raw}
 
     # Eligibility assessment
     elig_raw = raw.get("eligibility_assessment", {}).get("assessments", [])
-    eligibility_assessment = []
-    for e in elig_raw:
-        met = True if e.get("status", "").startswith("Likely") or e.get("status") == "Supported" else "Review"
-        eligibility_assessment.append({
-            "criterion": e.get("criterion", ""),
-            "met": met,
-            "detail": e.get("detail", ""),
-        })
-
-    app_data = {
-        "part_i": {
-            "project_name": exec_summary.get("project_name", ""),
-            "applicant": exec_summary.get("applicant_name", ""),
-            "location": exec_summary.get("location", ""),
-            "technology_category": tech_desc.get("technology_type", ""),
-            "technology_type": tech_desc.get("technology_type", ""),
-            "capacity_mw": params.technical.nameplate_capacity_mw,
-            "total_project_cost": params.financial.total_project_cost,
-            "guarantee_amount_requested": guarantee_amount,
-            "target_cod": params.cod_target or "[Date]",
-            "jobs_construction": "[Estimate]",
-            "jobs_operations": "[Estimate]",
-            "eligible_category": raw.get("application_metadata", {}).get("technology_category", {}).get("label", ""),
-            "statutory_authority": "Energy Policy Act of 2005, Title XVII (42 U.S.C. 16511-16514)",
-            "innovation_narrative": tech_desc.get("innovation_narrative", ""),
-            "debt_equity_split": f"{params.financial.debt_percent:.0%} / {params.financial.equity_percent:.0%}",
-            "project_irr": f"{0:.1f}" if not financial_summary else f"{financial_summary.irr_project * 100:.1f}",
-            "dscr_min": f"{params.financial.dscr:.2f}" if not financial_summary else f"{financial_summary.minimum_dscr:.2f}",
-            "lcoe": f"{0:.2f}" if not financial_summary else f"{financial_summary.lcoe:.2f}",
-            "offtake_summary": params.credit.offtake_type.replace("_", " ").title(),
-            "equity_sponsors": "[To be identified]",
-            "credit_subsidy": credit_subsidy,
-        },
+    eligibility_assessment = tuple(
+        _EligibilityCheck(
+            e.get("criterion", ""),
+            True if e.get("status", "").startswith("Likely") or e.get("status") == "Supported" else "Review",
+            e.get("detail", ""),
+        )
+        for e in elig_raw
+    )
+
+    app_data["part_i"].update({
+        "capacity_mw": params.technical.nameplate_capacity_mw,
+        "total_project_cost": total_cost,
+        "guarantee_amount_requested": guarantee_amount,
+        "target_cod": params.cod_target or "[Date]",
+        "debt_equity_split": f"{fin.debt_percent:.0%} / {fin.equity_percent:.0%}",
+        "project_irr": irr_text,
+        "dscr_min": f"{dscr:.2f}" if not financial_summary else f"{financial_summary.minimum_dscr:.2f}",
+        "lcoe": lcoe_text,
+        "offtake_summary": params.credit.offtake_type.replace("_", " ").title(),
+        "credit_subsidy": credit_subsidy,
+    })
+    app_data.update({
         "part_ii": {
             "project_details": part_ii_project_details,
             "financial_plan": financial_plan,
@@ -284,9 +448,9 @@ def lpo_xvii():
             "fee_schedule": fee_schedule if fee_schedule else None,
         },
         "eligibility_assessment": eligibility_assessment,
-    }
+    })
 
-    return render_template("lpo_xvii.html", app_data=app_data, project=project_data)
+    return app_data
 
 
 @report_bp.route("/export-json")
@@ -296,9 +460,12 @@ def export_json():
         flash("No assessment results to export.", "error")
         return redirect(url_for("project.new_project"))
 
-    json_str = export_results_json(assessment)
-    return Response(
-        json_str,
-        mimetype="application/json",
+    response = make_json_response(
+        export_results_json(assessment).encode("utf-8"),
         headers={"Content-Disposition": "attachment;filename=bankability_assessment.json"},
     )
+    # Tagged from the body: a re-run assessment must never be served stale
+    response.add_etag()
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
@@ -4,12 +4,45 @@ Server-side session store.
 Flask's default cookie-based session has a 4KB browser limit.
 Project data and assessment results exceed this limit, so we store
 them server-side keyed by a session identifier stored in the cookie.
+
+Set REDIS_URL to keep sessions in Redis (requires the optional redis
+package), so every worker process and host sees the same session data.
+Values are stored there as JSON, so only JSON-serializable data may be
+stored. Without REDIS_URL, sessions live in this process's memory.
 """
 
+import copy
+import json
+import os
+import threading
+import time
 import uuid
+from collections import OrderedDict
+
 from flask import session
 
-_store = {}
+from app.models.project import ProjectParameters
+
+# Sessions are spread over independently locked shards so concurrent
+# requests for different sessions rarely wait on each other. Each shard is
+# ordered by last access, oldest first, so expired sessions are swept from
+# the front.
+_SHARD_COUNT = 16
+_SESSION_TTL_SECONDS = 12 * 60 * 60
+
+_shards = tuple(OrderedDict() for _ in range(_SHARD_COUNT))
+_locks = tuple(threading.Lock() for _ in range(_SHARD_COUNT))
+
+
+def _connect_redis(url):
+    if not url:
+        return None
+    import redis  # Only needed when REDIS_URL is configured
+
+    return redis.Redis.from_url(url)
+
+
+_redis = _connect_redis(os.environ.get("REDIS_URL"))
 
 
 def _get_sid():
@@ -20,21 +53,91 @@ def _get_sid():
     return sid
 
 
+def _shard_index(sid):
+    return hash(sid) & (_SHARD_COUNT - 1)
+
+
+def _touch(shard, sid, now):
+    """Mark a session as just used and drop sessions idle past the TTL."""
+    shard.move_to_end(sid)
+    entry = shard[sid]
+    entry[0] = now
+    cutoff = now - _SESSION_TTL_SECONDS
+    while shard:
+        oldest = next(iter(shard.values()))
+        if oldest[0] >= cutoff:
+            break
+        shard.popitem(last=False)
+    return entry[1]
+
+
+def _redis_key(sid):
+    return f"sess:{sid}"
+
+
 def store_set(key, value):
     sid = _get_sid()
-    if sid not in _store:
-        _store[sid] = {}
-    _store[sid][key] = value
+    if _redis is not None:
+        name = _redis_key(sid)
+        pipe = _redis.pipeline()
+        pipe.hset(name, key, json.dumps(value, separators=(",", ":")))
+        pipe.expire(name, _SESSION_TTL_SECONDS)
+        pipe.execute()
+        return
+    index = _shard_index(sid)
+    with _locks[index]:
+        shard = _shards[index]
+        if sid not in shard:
+            shard[sid] = [0.0, {}]
+        _touch(shard, sid, time.monotonic())[key] = value
 
 
 def store_get(key, default=None):
     sid = session.get("_sid")
-    if not sid or sid not in _store:
+    if not sid:
         return default
-    return _store[sid].get(key, default)
+    if _redis is not None:
+        name = _redis_key(sid)
+        pipe = _redis.pipeline()
+        pipe.hget(name, key)
+        pipe.expire(name, _SESSION_TTL_SECONDS)
+        raw, _ = pipe.execute()
+        return default if raw is None else json.loads(raw)
+    index = _shard_index(sid)
+    with _locks[index]:
+        shard = _shards[index]
+        if sid not in shard:
+            return default
+        return _touch(shard, sid, time.monotonic()).get(key, default)
+
+
+def store_get_params(project_data):
+    """
+    ProjectParameters for the session's project data. The instance is kept
+    in the store next to a copy of the data it was built from and reused
+    while the project data is unchanged, so tab-to-tab navigation skips
+    from_dict. Callers must treat the returned instance as read-only.
+
+    With Redis the instance cannot be stored as JSON, and decoding a stored
+    copy would cost about as much as from_dict, so it is rebuilt per call.
+    """
+    if _redis is not None:
+        return ProjectParameters.from_dict(project_data)
+    cached = store_get("_project_params")
+    if cached is not None and cached[0] == project_data:
+        return cached[1]
+    params = ProjectParameters.from_dict(project_data)
+    store_set("_project_params", (copy.deepcopy(project_data), params))
+    return params
 
 
 def store_clear():
     sid = session.get("_sid")
-    if sid and sid in _store:
-        del _store[sid]
+    if not sid:
+        return
+    if _redis is not None:
+        _redis.delete(_redis_key(sid))
+        return
+    index = _shard_index(sid)
+    with _locks[index]:
+        _shards[index].pop(sid, None)
@@ -1,11 +1,14 @@
-from app.utils.calculations import format_currency, format_percent, format_number
+from app.utils.calculations import format_currency, format_currency_list, format_percent, format_number, format_label
 from app.utils.validators import validate_project_input
-from app.utils.export import export_results_json
+from app.utils.export import export_results_json, export_results_json_bytes
 
 __all__ = [
     "format_currency",
+    "format_currency_list",
     "format_percent",
     "format_number",
+    "format_label",
     "validate_project_input",
     "export_results_json",
+    "export_results_json_bytes",
 ]
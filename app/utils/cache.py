@@ -0,0 +1,83 @@
+"""
+Cache locations and content keys for project-derived artifacts.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+
+def cache_dir(namespace):
+    """
+    Directory for a cache namespace. Set BANKABILITY_CACHE_DIR to relocate
+    the cache root, or to an empty string to disable disk caching.
+    """
+    root = os.environ.get("BANKABILITY_CACHE_DIR")
+    if root is None:
+        root = os.path.join(os.path.expanduser("~"), ".cache", "bankability")
+    if not root:
+        return None
+    return os.path.join(root, namespace)
+
+
+def hash_project(params, *extra):
+    """Content hash of a ProjectParameters instance plus any extra key parts."""
+    payload = json.dumps(
+        {"params": params.to_dict(), "extra": extra},
+        sort_keys=True, default=str,
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+
+# Marks a cache miss, so None and other falsy values can be cached
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Thread-safe in-memory cache holding at most maxsize entries; the least
+    recently used entry is evicted first. Cached values are shared between
+    callers, so store immutable values or treat them as read-only.
+    """
+
+    __slots__ = ("maxsize", "_entries", "_lock")
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_build(self, key, build):
+        """
+        Return the value cached under key, calling build() on a miss.
+
+        build() runs outside the lock, so concurrent misses on one key may
+        each build the value; the last one stored wins. Builders are pure
+        functions of the key, so a duplicate build only costs time.
+        """
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                return value
+
+        value = build()
+        with self._lock:
+            self._entries[key] = value
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# Page payloads (report forms, financing structures) and the scorer results
+# they are built from, shared across sessions
+REPORT_CACHE = LRUCache(64)
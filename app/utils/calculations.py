@@ -2,33 +2,89 @@
 Formatting and calculation utilities.
 """
 
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+# (date, ISO string) for the current day, refreshed when the date rolls over
+_TODAY_ISO_CACHE = [None, None]
+
+
+_BILLION = 1_000_000_000
+_MILLION = 1_000_000
+_THOUSAND = 1_000
+
+
+@lru_cache(maxsize=None)
+def _currency_formatter(decimals):
+    """Currency formatter with the format templates for `decimals` built once."""
+    billions = f"${{:,.{decimals}f}}B".format
+    millions = f"${{:,.{decimals}f}}M".format
+    dollars = f"${{:,.{decimals}f}}".format
+    cents = f"${{:,.{min(decimals, 2)}f}}".format
+
+    def fmt(value):
+        magnitude = abs(value)
+        if magnitude >= _BILLION:
+            return billions(value / _BILLION)
+        if magnitude >= _MILLION:
+            return millions(value / _MILLION)
+        if magnitude >= _THOUSAND:
+            return dollars(value)
+        return cents(value)
+    return fmt
+
+
+@lru_cache(maxsize=None)
+def _percent_template(decimals):
+    return f"{{:.{decimals}f}}%".format
+
+
+@lru_cache(maxsize=None)
+def _number_template(decimals):
+    return f"{{:,.{decimals}f}}".format
+
 
 def format_currency(value, decimals=0):
     """Format a number as US currency."""
     if value is None:
         return "$0"
-    if abs(value) >= 1_000_000_000:
-        return f"${value / 1_000_000_000:,.{decimals}f}B"
-    elif abs(value) >= 1_000_000:
-        return f"${value / 1_000_000:,.{decimals}f}M"
-    elif abs(value) >= 1_000:
-        return f"${value:,.{decimals}f}"
-    else:
-        return f"${value:,.{min(decimals, 2)}f}"
+    return _currency_formatter(decimals)(value)
+
+
+def format_currency_list(values, decimals=0):
+    """Format a column of numbers as US currency."""
+    fmt = _currency_formatter(decimals)
+    return ["$0" if value is None else fmt(value) for value in values]
 
 
 def format_percent(value, decimals=1):
     """Format a decimal as a percentage string."""
     if value is None:
         return "0%"
-    return f"{value * 100:.{decimals}f}%"
+    return _percent_template(decimals)(value * 100)
 
 
 def format_number(value, decimals=0):
     """Format a number with commas."""
     if value is None:
         return "0"
-    return f"{value:,.{decimals}f}"
+    return _number_template(decimals)(value)
+
+
+@lru_cache(maxsize=128)
+def format_label(value):
+    """Turn an identifier such as 'solar_plus_storage' into a display label."""
+    return value.replace("_", " ").title()
+
+
+def today_iso():
+    """Today's date as an ISO string, formatted once per day."""
+    today = date.today()
+    if _TODAY_ISO_CACHE[0] != today:
+        _TODAY_ISO_CACHE[:] = [today, today.isoformat()]
+    return _TODAY_ISO_CACHE[1]
 
 
 def safe_divide(numerator, denominator, default=0.0):
@@ -38,11 +94,50 @@ def safe_divide(numerator, denominator, default=0.0):
     return numerator / denominator
 
 
+@lru_cache(maxsize=4096)
+def _compound_growth(rate, periods):
+    """(1 + rate) ** periods, cached since portfolios share a few rate/tenor pairs."""
+    return (1 + rate) ** periods
+
+
+@lru_cache(maxsize=1024, typed=True)
+def compound_factors(rate, periods):
+    """
+    ((1 + rate) ** k for k in range(periods)) as a tuple. Escalation,
+    degradation and discount schedules repeat across the pro forma and
+    across projects, so each schedule is computed once per rate and length.
+    Pass -rate for decay, e.g. compound_factors(-degradation, years).
+    """
+    base = 1 + rate
+    return tuple(base ** k for k in range(periods))
+
+
 def annuity_payment(principal, rate, periods):
     """Calculate the fixed annual payment on an amortizing loan."""
     if rate == 0:
         return principal / periods if periods > 0 else 0
-    return principal * (rate * (1 + rate) ** periods) / ((1 + rate) ** periods - 1)
+    growth = _compound_growth(rate, periods)
+    return principal * (rate * growth) / (growth - 1)
+
+
+def annuity_payment_array(principal, rate, periods):
+    """
+    Vectorized annuity_payment over NumPy arrays (broadcast together).
+    Entries with non-positive principal or periods pay 0.
+    """
+    principal, rate, periods = np.broadcast_arrays(
+        np.asarray(principal, dtype=np.float64),
+        np.asarray(rate, dtype=np.float64),
+        np.asarray(periods, dtype=np.float64),
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        growth = (1 + rate) ** periods
+        payment = np.where(
+            rate == 0,
+            principal / periods,
+            principal * (rate * growth) / (growth - 1),
+        )
+    return np.where((principal > 0) & (periods > 0), payment, 0.0)
 
 
 def present_value(future_value, rate, periods):
@@ -3,13 +3,19 @@ Export utilities for bankability assessment results.
 """
 
 import json
+from collections.abc import Mapping
 from datetime import date, datetime
 
+from flask import Response
+
 
 class DateEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, (date, datetime)):
             return obj.isoformat()
+        if isinstance(obj, Mapping):
+            # Frozen report templates are MappingProxyType views
+            return dict(obj)
         return super().default(obj)
 
 
@@ -18,6 +24,26 @@ def export_results_json(results, indent=2):
     return json.dumps(results, indent=indent, cls=DateEncoder, default=str)
 
 
+# Shared compact encoders; without indent the C encoder does the whole walk
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=str)
+_SORTED_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True, default=str)
+
+
+def export_results_json_bytes(results, sort_keys=False):
+    """
+    Export assessment results as compact UTF-8 JSON bytes with no
+    whitespace between tokens. Unlike export_results_json the output is
+    not indented; use that for human-readable files.
+    """
+    encoder = _SORTED_COMPACT_ENCODER if sort_keys else _COMPACT_ENCODER
+    return encoder.encode(results).encode("utf-8")
+
+
+def make_json_response(data, status=200, headers=None):
+    """Wrap already-encoded JSON bytes in an application/json response."""
+    return Response(data, status=status, mimetype="application/json", headers=headers)
+
+
 def results_to_csv_rows(results):
     """Convert cash flow results to a list of CSV-compatible rows."""
     rows = []
@@ -0,0 +1,15 @@
+"""
+Read-only views of module-level document templates.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+
+def freeze(value):
+    """Recursively convert dicts to MappingProxyType and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
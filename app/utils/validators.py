@@ -3,6 +3,55 @@ Input validation for project parameters.
 """
 
 
+def _error_if(condition, message):
+    """Rule check that reports message when condition(value) holds."""
+    return lambda value: message if condition(value) else None
+
+
+def _capital_split_error(debt_pct, equity_pct):
+    total_pct = debt_pct + equity_pct
+    if abs(total_pct - 1.0) > 0.01:
+        return f"Debt and equity percentages must sum to 100% (currently {total_pct:.0%})."
+    return None
+
+
+# Numeric input rules in reporting order:
+# (section, fields, defaults, check(*values) -> error or None, message if not numeric)
+_NUMERIC_RULES = (
+    ("technical", ("nameplate_capacity_mw",), (0,),
+     _error_if(lambda v: v <= 0, "Nameplate capacity must be greater than zero."),
+     "Nameplate capacity must be a valid number."),
+    ("financial", ("total_project_cost",), (0,),
+     _error_if(lambda v: v <= 0, "Total project cost must be greater than zero."),
+     "Total project cost must be a valid number."),
+    ("financial", ("debt_percent", "equity_percent"), (0.70, 0.30),
+     _capital_split_error,
+     "Debt and equity percentages must be valid numbers."),
+    ("financial", ("interest_rate",), (0.055,),
+     _error_if(lambda v: v < 0 or v > 0.30, "Interest rate should be between 0% and 30%."),
+     "Interest rate must be a valid number."),
+    ("financial", ("annual_revenue",), (0,),
+     _error_if(lambda v: v < 0, "Annual revenue cannot be negative."),
+     "Annual revenue must be a valid number."),
+    ("financial", ("annual_opex",), (0,),
+     _error_if(lambda v: v < 0, "Annual operating expenses cannot be negative."),
+     "Annual operating expenses must be a valid number."),
+    ("technical", ("capacity_factor",), (0,),
+     _error_if(lambda v: v < 0 or v > 1.0, "Capacity factor must be between 0 and 1.0."),
+     "Capacity factor must be a valid number."),
+)
+
+
+def _try_float(value):
+    """float(value), or None if it is not numeric. Numbers skip the exception path."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 def validate_project_input(data):
     """
     Validate project input data and return a list of validation errors.
@@ -13,71 +62,83 @@ def validate_project_input(data):
     if not data.get("project_name"):
         errors.append("Project name is required.")
 
-    tech = data.get("technical", {})
-    if not tech.get("technology_type"):
+    if not data.get("technical", {}).get("technology_type"):
         errors.append("Technology type is required.")
 
-    capacity = tech.get("nameplate_capacity_mw", 0)
-    try:
-        capacity = float(capacity)
-        if capacity <= 0:
-            errors.append("Nameplate capacity must be greater than zero.")
-    except (TypeError, ValueError):
-        errors.append("Nameplate capacity must be a valid number.")
+    for section_name, fields, defaults, check, invalid_message in _NUMERIC_RULES:
+        section = data.get(section_name, {})
+        values = [_try_float(section.get(field, default)) for field, default in zip(fields, defaults)]
+        if None in values:
+            errors.append(invalid_message)
+            continue
+        error = check(*values)
+        if error is not None:
+            errors.append(error)
 
-    fin = data.get("financial", {})
-    total_cost = fin.get("total_project_cost", 0)
-    try:
-        total_cost = float(total_cost)
-        if total_cost <= 0:
-            errors.append("Total project cost must be greater than zero.")
-    except (TypeError, ValueError):
-        errors.append("Total project cost must be a valid number.")
+    return errors
 
-    debt_pct = fin.get("debt_percent", 0.70)
-    equity_pct = fin.get("equity_percent", 0.30)
-    try:
-        debt_pct = float(debt_pct)
-        equity_pct = float(equity_pct)
-        total_pct = debt_pct + equity_pct
-        if abs(total_pct - 1.0) > 0.01:
-            errors.append(f"Debt and equity percentages must sum to 100% (currently {total_pct:.0%}).")
-    except (TypeError, ValueError):
-        errors.append("Debt and equity percentages must be valid numbers.")
 
-    interest_rate = fin.get("interest_rate", 0.055)
-    try:
-        interest_rate = float(interest_rate)
-        if interest_rate < 0 or interest_rate > 0.30:
-            errors.append("Interest rate should be between 0% and 30%.")
-    except (TypeError, ValueError):
-        errors.append("Interest rate must be a valid number.")
+_BOOL_TRUE = frozenset({"true", "1", "yes", "on"})
 
-    revenue = fin.get("annual_revenue", 0)
-    try:
-        revenue = float(revenue)
-        if revenue < 0:
-            errors.append("Annual revenue cannot be negative.")
-    except (TypeError, ValueError):
-        errors.append("Annual revenue must be a valid number.")
 
-    opex = fin.get("annual_opex", 0)
-    try:
-        opex = float(opex)
-        if opex < 0:
-            errors.append("Annual operating expenses cannot be negative.")
-    except (TypeError, ValueError):
-        errors.append("Annual operating expenses must be a valid number.")
+def _parse_int(value):
+    return int(float(value))
 
-    cf = tech.get("capacity_factor", 0)
-    try:
-        cf = float(cf)
-        if cf < 0 or cf > 1.0:
-            errors.append("Capacity factor must be between 0 and 1.0.")
-    except (TypeError, ValueError):
-        errors.append("Capacity factor must be a valid number.")
 
-    return errors
+def _parse_bool(value):
+    """Form checkbox strings become bools; other values are kept as given."""
+    if isinstance(value, str):
+        return value.lower() in _BOOL_TRUE
+    return value
+
+
+def _coercion_schema(**sections):
+    """{section: ((field, parser), ...)} from per-section float/int/bool field lists."""
+    return {
+        name: tuple(
+            (field, parser)
+            for parser, fields in zip((float, _parse_int, _parse_bool), kinds)
+            for field in fields
+        )
+        for name, kinds in sections.items()
+    }
+
+
+# Fields converted by coerce_numeric_fields: section -> (floats, ints, bools)
+_COERCIONS = _coercion_schema(
+    financial=(
+        ("total_project_cost", "total_hard_costs", "total_soft_costs",
+         "contingency_percent", "debt_percent", "equity_percent",
+         "interest_rate", "target_dscr", "annual_revenue", "annual_opex",
+         "annual_opex_escalation", "revenue_escalation", "tax_rate",
+         "itc_percent", "ptc_per_mwh", "discount_rate"),
+        ("construction_period_months", "debt_tenor_years"),
+        (),
+    ),
+    technical=(
+        ("nameplate_capacity_mw", "annual_generation_mwh", "capacity_factor",
+         "degradation_rate_annual", "availability_factor", "interconnection_voltage_kv"),
+        ("technology_readiness_level", "expected_useful_life_years"),
+        ("environmental_permits_secured", "site_control_secured"),
+    ),
+    credit=(
+        ("revenue_concentration_percent", "contract_price_per_mwh"),
+        ("offtake_tenor_years", "counterparty_count"),
+        ("has_credit_support",),
+    ),
+    structure=(
+        ("performance_guarantee_level",),
+        ("epc_warranty_years", "om_contract_tenor_years", "debt_service_reserve_months"),
+        ("performance_guarantee", "completion_guarantee",
+         "reserve_accounts_funded", "major_maintenance_reserve",
+         "step_in_rights", "assignment_provisions", "change_of_control_provisions"),
+    ),
+    market=(
+        ("curtailment_history_percent", "market_price_per_mwh"),
+        ("competing_projects_in_queue", "land_lease_term_years"),
+        ("independent_resource_assessment", "land_lease_secured"),
+    ),
+)
 
 
 def coerce_numeric_fields(data):
@@ -85,72 +146,16 @@ def coerce_numeric_fields(data):
     Convert string values to appropriate numeric types in the input data.
     Handles form submissions where all values arrive as strings.
     """
-    float_fields_financial = [
-        "total_project_cost", "total_hard_costs", "total_soft_costs",
-        "contingency_percent", "debt_percent", "equity_percent",
-        "interest_rate", "target_dscr", "annual_revenue", "annual_opex",
-        "annual_opex_escalation", "revenue_escalation", "tax_rate",
-        "itc_percent", "ptc_per_mwh", "discount_rate",
-    ]
-    int_fields_financial = ["construction_period_months", "debt_tenor_years"]
-
-    float_fields_technical = [
-        "nameplate_capacity_mw", "annual_generation_mwh", "capacity_factor",
-        "degradation_rate_annual", "availability_factor", "interconnection_voltage_kv",
-    ]
-    int_fields_technical = ["technology_readiness_level", "expected_useful_life_years"]
-
-    float_fields_credit = [
-        "revenue_concentration_percent", "contract_price_per_mwh",
-    ]
-    int_fields_credit = ["offtake_tenor_years", "counterparty_count"]
-
-    float_fields_structure = ["performance_guarantee_level"]
-    int_fields_structure = ["epc_warranty_years", "om_contract_tenor_years", "debt_service_reserve_months"]
-
-    float_fields_market = ["curtailment_history_percent", "market_price_per_mwh"]
-    int_fields_market = ["competing_projects_in_queue", "land_lease_term_years"]
-
-    bool_fields_technical = ["environmental_permits_secured", "site_control_secured"]
-    bool_fields_credit = ["has_credit_support"]
-    bool_fields_structure = [
-        "performance_guarantee", "completion_guarantee",
-        "reserve_accounts_funded", "major_maintenance_reserve",
-        "step_in_rights", "assignment_provisions", "change_of_control_provisions",
-    ]
-    bool_fields_market = ["independent_resource_assessment", "land_lease_secured"]
-
-    sections = {
-        "financial": (float_fields_financial, int_fields_financial, []),
-        "technical": (float_fields_technical, int_fields_technical, bool_fields_technical),
-        "credit": (float_fields_credit, int_fields_credit, bool_fields_credit),
-        "structure": (float_fields_structure, int_fields_structure, bool_fields_structure),
-        "market": (float_fields_market, int_fields_market, bool_fields_market),
-    }
-
-    for section_name, (floats, ints, bools) in sections.items():
+    for section_name, fields in _COERCIONS.items():
         section = data.get(section_name, {})
-        for field in floats:
-            if field in section:
-                try:
-                    section[field] = float(section[field])
-                except (TypeError, ValueError):
-                    pass
-        for field in ints:
+        for field, parse in fields:
             if field in section:
                 try:
-                    section[field] = int(float(section[field]))
+                    section[field] = parse(section[field])
                 except (TypeError, ValueError):
                     pass
-        for field in bools:
-            if field in section:
-                val = section[field]
-                if isinstance(val, str):
-                    section[field] = val.lower() in ("true", "1", "yes", "on")
 
     if "is_rural" in data:
-        val = data["is_rural"]
-        if isinstance(val, str):
-            data["is_rural"] = val.lower() in ("true", "1", "yes", "on")
+        data["is_rural"] = _parse_bool(data["is_rural"])
 
     return data
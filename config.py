@@ -1,4 +1,5 @@
 import os
+import time
 
 
 class Config:
@@ -34,9 +35,24 @@ class Config:
 
     DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
 
+    # Output of `flask compile-templates`; when set and present, templates
+    # load from these precompiled modules instead of being parsed
+    COMPILED_TEMPLATES_DIR = os.environ.get("COMPILED_TEMPLATES_DIR")
+
+    # Server-side sessions are kept in process memory unless the REDIS_URL
+    # environment variable is set (read by app.session_store at import;
+    # requires the optional redis package)
+
+    # Mixed into report page ETags so browsers never revalidate a page
+    # rendered by an older release; set it per deploy (e.g. the git commit)
+    APP_REVISION = os.environ.get("APP_REVISION", "1.0.0")
+
 
 class DevelopmentConfig(Config):
     DEBUG = True
+    # Code and templates change without a release; start a new revision
+    # with every server (re)start
+    APP_REVISION = os.environ.get("APP_REVISION", str(time.time_ns()))
 
 
 class ProductionConfig(Config):
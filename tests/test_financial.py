@@ -1,8 +1,11 @@
 """Tests for the financial model."""
+import copy
 import unittest
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.models.project import (
@@ -10,6 +13,9 @@ from app.models.project import (
     ProjectStructureParameters, MarketParameters, ProjectParameters
 )
 from app.models.financial import FinancialModel
+from app.utils.calculations import compound_factors, format_currency, format_currency_list
+from app.analysis.cash_flow import CashFlowAnalysis
+from app.analysis.sensitivity import SensitivityAnalysis
 
 
 def _default_params():
@@ -203,6 +209,159 @@ class TestFinancialEdgeCases(unittest.TestCase):
         self.assertIsNotNone(summary)
         self.assertGreater(summary.lcoe, 0)
 
+    def test_derived_metrics_follow_input_changes(self):
+        fp = _default_params().financial
+        debt, dscr = fp.debt_amount, fp.dscr
+        fp.debt_percent /= 2
+        self.assertEqual(fp.debt_amount, debt)
+        fp.invalidate()
+        self.assertAlmostEqual(fp.debt_amount, debt / 2)
+        self.assertGreater(fp.dscr, dscr)
+        fp.debt_tenor_years = 0
+        fp.invalidate()
+        self.assertEqual(fp.annual_debt_service, 0.0)
+        self.assertEqual(fp.dscr, float("inf"))
+
+    def test_financial_strength_score_batch_matches_scalar(self):
+        params = _default_params()
+        scenarios = []
+        for revenue_scale in (0.3, 0.6, 0.8, 1.0, 1.3, 2.0):
+            for debt_percent in (0.0, 0.45, 0.7, 0.85, 0.95):
+                scenario = copy.deepcopy(params)
+                scenario.financial.annual_revenue *= revenue_scale
+                scenario.financial.debt_percent = debt_percent
+                scenarios.append(scenario)
+
+        models = [FinancialModel(p) for p in scenarios]
+        summaries = [m.build_pro_forma() for m in models]
+        batch = FinancialModel.financial_strength_score_batch(
+            [s.minimum_dscr for s in summaries],
+            [s.irr_project for s in summaries],
+            [s.npv_project for s in summaries],
+            [p.financial.total_project_cost for p in scenarios],
+            [s.payback_years for s in summaries],
+            [p.technical.expected_useful_life_years for p in scenarios],
+            [p.financial.leverage_ratio for p in scenarios],
+            [s.debt_yield for s in summaries],
+        )
+        expected = [m.financial_strength_score(s) for m, s in zip(models, summaries)]
+        self.assertEqual(batch.tolist(), expected)
+
+    def test_dscr_batch_matches_scalar_dscr(self):
+        params = _default_params()
+        fp = params.financial
+        rates = [0.0, 0.03, fp.interest_rate, 0.09]
+        tenors = [0, 10, fp.debt_tenor_years, 30]
+        batch = FinancialParameters.dscr_batch(
+            fp.net_operating_income, fp.debt_amount, [[r] for r in rates], tenors,
+        )
+        self.assertEqual(batch.shape, (len(rates), len(tenors)))
+        for i, rate in enumerate(rates):
+            for j, tenor in enumerate(tenors):
+                scenario = copy.deepcopy(fp)
+                scenario.interest_rate = rate
+                scenario.debt_tenor_years = tenor
+                scenario.invalidate()
+                # Array pow may differ from scalar pow in the last bit
+                self.assertAlmostEqual(batch[i, j], scenario.dscr, places=9)
+
+
+    def test_compound_factors_match_direct_powers(self):
+        for rate in (0.0, 0.025, -0.005, 0):
+            factors = compound_factors(rate, 30)
+            self.assertEqual(factors, tuple((1 + rate) ** k for k in range(30)))
+            self.assertIs(compound_factors(rate, 30), factors)
+        self.assertEqual(compound_factors(0.05, 0), ())
+
+    def test_format_currency_thresholds(self):
+        self.assertEqual(format_currency(2_500_000_000, 1), "$2.5B")
+        self.assertEqual(format_currency(-3_000_000), "$-3M")
+        self.assertEqual(format_currency(12_345.6), "$12,346")
+        self.assertEqual(format_currency(12.345, 4), "$12.35")
+        self.assertEqual(format_currency_list([None, 1_500, 2e6], 1), ["$0", "$1,500.0", "$2.0M"])
+
+
+class TestSensitivityAnalysis(unittest.TestCase):
+
+    def _assert_matches_pro_forma(self, params):
+        results = SensitivityAnalysis(params).run_standard_cases()
+        capex = results["capex"]
+        for case in capex["cases"]:
+            params_copy = copy.deepcopy(params)
+            params_copy.financial.total_project_cost = case["adjusted_value"]
+            summary = FinancialModel(params_copy).build_pro_forma()
+            self.assertAlmostEqual(case["min_dscr"], summary.minimum_dscr, places=2)
+            self.assertAlmostEqual(case["avg_dscr"], summary.average_dscr, places=2)
+            self.assertAlmostEqual(case["irr_project"], summary.irr_project * 100, places=1)
+            self.assertAlmostEqual(case["lcoe"], summary.lcoe, places=1)
+            self.assertAlmostEqual(case["payback_years"], summary.payback_years, places=0)
+
+    def test_standard_cases_cover_all_parameters(self):
+        results = SensitivityAnalysis(_default_params()).run_standard_cases()
+        self.assertEqual(
+            list(results),
+            [p["name"] for p in SensitivityAnalysis.SENSITIVITY_PARAMETERS],
+        )
+        for result in results.values():
+            self.assertEqual(len(result["cases"]), 7)
+
+    def test_vectorized_sweep_matches_pro_forma(self):
+        self._assert_matches_pro_forma(_default_params())
+
+    def test_vectorized_sweep_matches_pro_forma_without_debt(self):
+        params = _default_params()
+        params.financial.debt_percent = 0
+        params.financial.equity_percent = 1.0
+        self._assert_matches_pro_forma(params)
+
+    def test_other_attributes_fall_back_to_pro_forma(self):
+        params = _default_params()
+        config = {
+            "name": "tenor",
+            "label": "Debt Tenor",
+            "attribute_path": ("financial", "debt_tenor_years"),
+            "unit": "absolute_change",
+        }
+        result = SensitivityAnalysis.evaluate_case(params, ("tenor", config, [-5, 0, 5]))
+        for case in result["cases"]:
+            params_copy = copy.deepcopy(params)
+            params_copy.financial.debt_tenor_years = case["adjusted_value"]
+            summary = FinancialModel(params_copy).build_pro_forma()
+            self.assertEqual(case["min_dscr"], round(summary.minimum_dscr, 3))
+        self.assertNotEqual(result["cases"][0]["min_dscr"], result["cases"][1]["min_dscr"])
+
+    def test_sweep_rejects_unsupported_attributes(self):
+        with self.assertRaises(ValueError):
+            SensitivityAnalysis._sweep_metrics(
+                _default_params(), "financial", "debt_tenor_years", np.array([10.0, 20.0]))
+
+    def test_revenue_sensitivity_is_monotonic(self):
+        results = SensitivityAnalysis(_default_params()).run_standard_cases()
+        dscrs = [case["min_dscr"] for case in results["revenue"]["cases"]]
+        self.assertEqual(dscrs, sorted(dscrs))
+
+
+class TestCashFlowAnalysis(unittest.TestCase):
+
+    def test_views_share_one_pro_forma(self):
+        cfa = CashFlowAnalysis(_default_params())
+        calls = []
+        build = cfa.model.build_pro_forma
+        cfa.model.build_pro_forma = lambda: calls.append(1) or build()
+        cfa.generate_waterfall()
+        cfa.debt_schedule()
+        cfa.annual_summary_table()
+        self.assertEqual(len(calls), 1)
+
+    def test_invalidate_picks_up_parameter_changes(self):
+        params = _default_params()
+        cfa = CashFlowAnalysis(params)
+        before = cfa.annual_summary_table()[0]["revenue"]
+        params.financial.annual_revenue *= 2
+        self.assertEqual(cfa.annual_summary_table()[0]["revenue"], before)
+        cfa.invalidate()
+        self.assertGreater(cfa.annual_summary_table()[0]["revenue"], before)
+
 
 if __name__ == "__main__":
     unittest.main()
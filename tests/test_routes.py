@@ -0,0 +1,199 @@
+"""Tests for the Flask routes."""
+import json
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import session
+
+from app import create_app
+from app.models.project import ProjectParameters
+from app import session_store
+from app.routes import analysis_routes, report_routes
+from app.routes.project_routes import SAMPLE_PROJECTS
+from app.utils.cache import LRUCache, REPORT_CACHE
+from app.utils.export import export_results_json, export_results_json_bytes
+
+
+class _FakeRedis:
+    """The subset of redis.Redis used by app.session_store, held in a dict."""
+
+    def __init__(self):
+        self.hashes = {}
+        self._queued = None
+
+    def pipeline(self):
+        self._queued = []
+        return self
+
+    def hset(self, name, key, value):
+        self.hashes.setdefault(name, {})[key] = value.encode() if isinstance(value, str) else value
+        self._queued.append(1)
+
+    def hget(self, name, key):
+        self._queued.append(self.hashes.get(name, {}).get(key))
+
+    def expire(self, name, seconds):
+        self._queued.append(name in self.hashes)
+
+    def execute(self):
+        results, self._queued = self._queued, None
+        return results
+
+    def delete(self, name):
+        self.hashes.pop(name, None)
+
+
+class RouteTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app("testing")
+        self.client = self.app.test_client()
+        REPORT_CACHE.clear()
+        self.addCleanup(REPORT_CACHE.clear)
+
+    def load_sample(self, key="solar_100mw"):
+        self.client.get(f"/project/load-sample/{key}")
+        self.client.get("/analysis/results")
+
+
+class TestJSONExport(RouteTestCase):
+
+    def test_compact_bytes(self):
+        data = {"b": 1, "a": [1.5, None, "x"]}
+        self.assertEqual(export_results_json_bytes(data), b'{"b":1,"a":[1.5,null,"x"]}')
+        self.assertEqual(export_results_json_bytes(data, sort_keys=True), b'{"a":[1.5,null,"x"],"b":1}')
+
+    def test_api_assess_sorts_keys(self):
+        response = self.client.post("/analysis/api/assess", json=SAMPLE_PROJECTS["solar_100mw"])
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.data)
+        self.assertEqual(response.data, export_results_json_bytes(body, sort_keys=True))
+        self.assertEqual(list(body), sorted(body))
+
+    def test_export_download_is_indented(self):
+        self.load_sample()
+        response = self.client.get("/report/export-json")
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.data)
+        self.assertEqual(response.data, export_results_json(body).encode("utf-8"))
+        self.assertTrue(response.data.startswith(b'{\n  "'))
+
+
+class TestReportCache(RouteTestCase):
+
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.get_or_build("a", lambda: 1)
+        cache.get_or_build("b", lambda: 2)
+        cache.get_or_build("a", lambda: None)
+        cache.get_or_build("c", lambda: 3)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get_or_build("a", lambda: "rebuilt"), 1)
+        self.assertEqual(cache.get_or_build("b", lambda: "rebuilt"), "rebuilt")
+
+    def test_lru_cache_keeps_falsy_values(self):
+        cache = LRUCache(2)
+        build = mock.Mock(return_value=None)
+        cache.get_or_build("a", build)
+        self.assertIsNone(cache.get_or_build("a", build))
+        build.assert_called_once()
+
+    def test_report_is_built_once_across_sessions(self):
+        build = mock.Mock(wraps=report_routes._build_rus_201_form_data)
+        with mock.patch.object(report_routes, "_build_rus_201_form_data", build):
+            for _ in range(2):
+                self.client = self.app.test_client()
+                self.load_sample()
+                self.assertEqual(self.client.get("/report/rus-201").status_code, 200)
+        self.assertEqual(build.call_count, 1)
+
+    def test_cached_report_payload_is_read_only(self):
+        params = ProjectParameters.from_dict(SAMPLE_PROJECTS["solar_100mw"])
+        key = report_routes._report_key("rus_201", params, False)
+        payload = report_routes._cached_report(
+            key, params, False, report_routes._build_rus_201_form_data)
+        with self.assertRaises(TypeError):
+            payload["section_b"]["loan_amount"] = 0
+
+    def test_report_key_includes_the_date(self):
+        params = ProjectParameters.from_dict(SAMPLE_PROJECTS["solar_100mw"])
+        with mock.patch.object(report_routes, "today_iso", return_value="2026-01-01"):
+            first = report_routes._report_key("rus_201", params, True)
+        with mock.patch.object(report_routes, "today_iso", return_value="2026-01-02"):
+            second = report_routes._report_key("rus_201", params, True)
+        self.assertNotEqual(first, second)
+
+    def test_financing_payload_is_shared_across_sessions(self):
+        build = mock.Mock(wraps=analysis_routes._build_financing_payload)
+        with mock.patch.object(analysis_routes, "_build_financing_payload", build):
+            for _ in range(2):
+                self.client = self.app.test_client()
+                self.load_sample()
+                self.assertEqual(self.client.get("/analysis/financing").status_code, 200)
+        self.assertEqual(build.call_count, 1)
+
+
+class TestReportETags(RouteTestCase):
+
+    def test_unchanged_report_returns_304(self):
+        self.load_sample()
+        first = self.client.get("/report/rus-201")
+        self.assertEqual(first.status_code, 200)
+        etag = first.headers["ETag"]
+        second = self.client.get("/report/rus-201", headers={"If-None-Match": etag})
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["ETag"], etag)
+
+    def test_changed_parameters_return_200(self):
+        self.load_sample("solar_100mw")
+        etag = self.client.get("/report/lpo-xvii").headers["ETag"]
+        self.load_sample("wind_150mw")
+        response = self.client.get("/report/lpo-xvii", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_new_revision_returns_200(self):
+        self.load_sample()
+        etag = self.client.get("/report/rus-201").headers["ETag"]
+        self.app.config["APP_REVISION"] = "next-release"
+        response = self.client.get("/report/rus-201", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+
+
+class TestRedisSessionStore(RouteTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.redis = _FakeRedis()
+        patcher = mock.patch.object(session_store, "_redis", self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_session_values_are_stored_as_json(self):
+        self.load_sample()
+        (stored,) = self.redis.hashes.values()
+        self.assertEqual(json.loads(stored["project_data"]), SAMPLE_PROJECTS["solar_100mw"])
+        self.assertIn("assessment_results", stored)
+        self.assertNotIn("_project_params", stored)
+
+    def test_report_pages_render_from_redis(self):
+        self.load_sample()
+        for path in ("/analysis/financing", "/report/summary", "/report/rus-201", "/report/lpo-xvii"):
+            self.assertEqual(self.client.get(path).status_code, 200, path)
+
+    def test_clear_removes_the_session(self):
+        self.load_sample()
+        with self.app.test_request_context():
+            session["_sid"] = next(iter(self.redis.hashes)).split(":", 1)[1]
+            self.assertIsNotNone(session_store.store_get("project_data"))
+            session_store.store_clear()
+            self.assertIsNone(session_store.store_get("project_data"))
+        self.assertEqual(self.redis.hashes, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
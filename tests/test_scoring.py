@@ -2,14 +2,29 @@
 import unittest
 import sys
 import os
+import io
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.models.project import (
     TechnicalParameters, FinancialParameters, CreditParameters,
-    ProjectStructureParameters, MarketParameters, ProjectParameters
+    ProjectStructureParameters, MarketParameters, ProjectParameters,
+    TECHNOLOGY_CODES, PROJECT_STAGE_CODES,
+)
+from app.models.scoring import BankabilityScorer, SCORE_THRESHOLDS, _grade_info
+from app.models.portfolio import (
+    ProjectBatch, projects_from_columns, serialize_portfolio, encode_portfolio, score_all,
+    efficiency_score_batch, credit_quality_score_batch, structure_score_batch, market_score_batch,
 )
-from app.models.scoring import BankabilityScorer
+from app.analysis.bankability_score import run_bankability_assessment_from_params, score_portfolio
+from app.financing.doe_lpo_title_xvii import ELIGIBLE_CATEGORIES, LPOTitleXVIIGenerator
+from app.financing.rus_form_201 import RUSForm201Generator
 
 
 def _default_params():
@@ -137,6 +152,78 @@ class TestBankabilityScorer(unittest.TestCase):
             "Sub-Investment Grade", "Speculative", "Pre-Bankable"
         ])
 
+    def test_to_dict_is_reused_until_a_field_changes(self):
+        result = self.scorer.score()
+        first = result.to_dict()
+        first["extra"] = True
+        first["sub_scores"][0]["score"] = -1
+        second = result.to_dict()
+        self.assertNotIn("extra", second)
+        self.assertIsNot(second["sub_scores"], first["sub_scores"])
+        self.assertNotEqual(second["sub_scores"][0]["score"], -1)
+        result.overall_score = 12.34
+        self.assertEqual(result.to_dict()["overall_score"], 12.3)
+
+    def test_score_batch_matches_individual_scores(self):
+        rng = random.Random(17)
+        projects = [_default_params()] + [_random_params(rng) for _ in range(20)]
+        batch = BankabilityScorer.score_batch(projects)
+        self.assertEqual(len(batch), len(projects))
+        for params, result in zip(projects, batch):
+            expected = BankabilityScorer(params).score()
+            self.assertEqual(result.overall_score, expected.overall_score)
+            self.assertEqual(result.to_dict(), expected.to_dict())
+        self.assertEqual(BankabilityScorer.score_batch([]), [])
+
+    def test_score_portfolio_matches_serial_scores(self):
+        rng = random.Random(29)
+        projects = [_default_params()] + [_random_params(rng) for _ in range(5)]
+        expected = [BankabilityScorer(params).score().to_dict() for params in projects]
+        self.assertEqual(score_portfolio(projects, n_jobs=1), expected)
+        self.assertEqual(score_portfolio(projects, n_jobs=2), expected)
+        self.assertEqual(score_portfolio([]), [])
+
+    def test_assessment_reuses_caller_executor(self):
+        expected = run_bankability_assessment_from_params(self.params)
+        # A single worker must not deadlock while stages wait on the cases
+        for workers in (1, 2):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in range(2):
+                    pooled = run_bankability_assessment_from_params(self.params, executor=executor)
+                    self.assertEqual(pooled, expected)
+                    self.assertEqual(list(pooled), list(expected))
+                    self.assertEqual(list(pooled["sensitivity"]), list(expected["sensitivity"]))
+
+    def test_to_dict_summary_detail(self):
+        result = self.scorer.score()
+        summary = result.to_dict(detail="summary")
+        self.assertEqual(
+            list(summary),
+            ["overall_score", "grade", "grade_label", "grade_color", "sub_scores"],
+        )
+        full = result.to_dict()
+        self.assertEqual(summary, {key: full[key] for key in summary})
+        self.assertEqual(score_portfolio([self.params], detail="summary"), [summary])
+        with self.assertRaises(ValueError):
+            result.to_dict(detail="brief")
+
+    def test_grade_thresholds_are_inclusive(self):
+        for grade, info in SCORE_THRESHOLDS.items():
+            with self.subTest(grade=grade):
+                self.assertEqual(_grade_info(info["min"]), (grade, info["label"], info["color"]))
+        self.assertEqual(_grade_info(79.99)[0], "Near Investment Grade")
+        self.assertEqual(_grade_info(100.0)[0], "Investment Grade")
+        self.assertEqual(_grade_info(-1.0), ("", "", ""))
+
+    def test_commentary_cutoffs_are_inclusive(self):
+        cutoffs, texts = BankabilityScorer._STRUCTURE_COMMENTARY
+        for band, cutoff in enumerate(cutoffs, start=1):
+            with self.subTest(cutoff=cutoff):
+                self.assertEqual(self.scorer._structure_commentary(cutoff), texts[band])
+                self.assertEqual(self.scorer._structure_commentary(cutoff - 0.01), texts[band - 1])
+        self.assertEqual(self.scorer._technology_commentary(float("nan")),
+                         BankabilityScorer._TECHNOLOGY_COMMENTARY[1][0])
+
     def test_weights_sum_to_one(self):
         result = self.scorer.score()
         total_weight = sum(ss.weight for ss in result.sub_scores)
@@ -172,6 +259,7 @@ class TestBankabilityScorer(unittest.TestCase):
         self.params.structure.epc_contract_type = "cost_plus"
         self.params.structure.completion_guarantee = False
         self.params.structure.reserve_accounts_funded = False
+        self.params.invalidate()
         poor_scorer = BankabilityScorer(self.params)
         poor_result = poor_scorer.score()
         self.assertLess(poor_result.overall_score, good_result.overall_score)
@@ -205,6 +293,25 @@ class TestProjectParameters(unittest.TestCase):
             params.financial.total_project_cost,
         )
 
+    def test_from_dict_coerces_to_declared_field_types(self):
+        restored = ProjectParameters.from_dict({
+            "financial": {"total_project_cost": "1000", "debt_tenor_years": "15",
+                          "debt_amount": 5, "not_a_field": 1},
+        })
+        self.assertEqual(restored.financial.total_project_cost, 1000.0)
+        self.assertEqual(restored.financial.debt_tenor_years, 15)
+        self.assertIsInstance(restored.financial.debt_tenor_years, int)
+        self.assertEqual(restored.financial.debt_amount, 700.0)
+
+    def test_categorical_values_are_interned(self):
+        tech = "".join(["solar", "_pv"])
+        stage = "".join(["operational", ""])
+        restored = ProjectParameters.from_dict({
+            "project_stage": stage, "technical": {"technology_type": tech},
+        })
+        self.assertIs(restored.technical.technology_type, sys.intern("solar_pv"))
+        self.assertIs(restored.project_stage, sys.intern("operational"))
+
     def test_tech_score_range(self):
         params = _default_params()
         score = params.technical.efficiency_score()
@@ -217,6 +324,209 @@ class TestProjectParameters(unittest.TestCase):
         self.assertGreaterEqual(score, 0)
         self.assertLessEqual(score, 100)
 
+    def test_cached_score_is_kept_until_invalidated(self):
+        params = _default_params()
+        before = params.technical.efficiency_score()
+        params.technical.site_control_secured = False
+        self.assertEqual(params.technical.efficiency_score(), before)
+        params.technical.invalidate()
+        self.assertLess(params.technical.efficiency_score(), before)
+
+
+def _random_params(rng):
+    """Perturb the baseline project across every scorer input, including unknown enum values."""
+    params = _default_params()
+    t, c, s, m = params.technical, params.credit, params.structure, params.market
+    t.technology_type = rng.choice(["solar_pv", "geothermal", "microgrids", "unknown_tech"])
+    t.capacity_factor = rng.choice([0.0, rng.uniform(0.05, 0.95)])
+    t.technology_readiness_level = rng.randint(1, 9)
+    t.availability_factor = rng.uniform(0.8, 1.0)
+    t.environmental_permits_secured = rng.random() < 0.5
+    t.site_control_secured = rng.random() < 0.5
+    c.offtaker_credit_rating = rng.choice(["AAA", "BBB-", "CCC", "unrated", "Z"])
+    c.offtake_tenor_years = rng.randint(0, 35)
+    c.offtake_type = rng.choice(["ppa_fixed", "merchant", "other"])
+    c.revenue_concentration_percent = rng.uniform(0, 1.5)
+    c.counterparty_count = rng.randint(1, 12)
+    c.regulatory_stability_rating = rng.choice(["stable", "negative", "volatile"])
+    c.has_credit_support = rng.random() < 0.5
+    s.epc_contract_type = rng.choice(["fixed_price_turnkey", "cost_plus", "design_build"])
+    s.epc_contractor_experience = rng.choice(["established", "limited", "new"])
+    s.performance_guarantee = rng.random() < 0.5
+    s.performance_guarantee_level = rng.uniform(0.5, 1.2)
+    s.completion_guarantee = rng.random() < 0.5
+    s.reserve_accounts_funded = rng.random() < 0.5
+    s.debt_service_reserve_months = rng.randint(0, 12)
+    s.major_maintenance_reserve = rng.random() < 0.5
+    s.insurance_coverage = rng.choice(["comprehensive", "none", "partial"])
+    s.step_in_rights = rng.random() < 0.5
+    s.assignment_provisions = rng.random() < 0.5
+    s.change_of_control_provisions = rng.random() < 0.5
+    m.resource_quality = rng.choice(["excellent", "poor", "unknown"])
+    m.resource_assessment_confidence = rng.choice(["p50", "p99", "p10"])
+    m.independent_resource_assessment = rng.random() < 0.5
+    m.curtailment_history_percent = rng.uniform(0, 0.12)
+    m.interconnection_certainty = rng.choice(["secured", "speculative", "maybe"])
+    m.grid_congestion_risk = rng.choice(["none", "severe", "extreme"])
+    m.land_lease_secured = rng.random() < 0.5
+    return params
+
+
+class TestProjectBatch(unittest.TestCase):
+
+    def test_batch_scores_match_per_project_scores(self):
+        rng = random.Random(7)
+        projects = [_default_params()] + [_random_params(rng) for _ in range(200)]
+        batch = ProjectBatch.from_projects(projects, precision="fp64")
+        self.assertEqual(len(batch), len(projects))
+
+        cases = [
+            (efficiency_score_batch, lambda p: p.technical.efficiency_score()),
+            (credit_quality_score_batch, lambda p: p.credit.credit_quality_score()),
+            (structure_score_batch, lambda p: p.structure.structure_score()),
+            (market_score_batch, lambda p: p.market.market_score()),
+        ]
+        for batch_fn, scalar_fn in cases:
+            with self.subTest(scorer=batch_fn.__name__):
+                expected = [scalar_fn(p) for p in projects]
+                self.assertEqual(batch_fn(batch).tolist(), expected)
+
+    def test_score_all_stacks_section_scores(self):
+        rng = random.Random(11)
+        projects = [_random_params(rng) for _ in range(50)]
+        batch = encode_portfolio(projects, precision="fp64")
+        scores = score_all(batch)
+        self.assertEqual(scores.shape, (50, 4))
+        self.assertEqual(scores[:, 1].tolist(), credit_quality_score_batch(batch).tolist())
+        self.assertEqual(scores[:, 3].tolist(), [p.market.market_score() for p in projects])
+        self.assertIs(score_all(batch, out=scores), scores)
+        self.assertEqual(ProjectParameters.score_portfolio(projects, precision="fp64").tolist(),
+                         scores.tolist())
+
+    def test_default_precision_is_float32_and_close_to_fp64(self):
+        rng = random.Random(13)
+        projects = [_random_params(rng) for _ in range(100)]
+        scores = ProjectParameters.score_portfolio(projects)
+        self.assertEqual(scores.dtype, np.float32)
+        exact = ProjectParameters.score_portfolio(projects, precision="fp64")
+        np.testing.assert_allclose(scores, exact, atol=1e-3)
+        with self.assertRaises(ValueError):
+            encode_portfolio(projects, precision="fp16")
+
+    def test_from_columns_matches_from_projects(self):
+        rng = random.Random(5)
+        projects = [_random_params(rng) for _ in range(40)]
+        rows = [p.to_dict() for p in projects]
+        columns = {"project_stage": [r["project_stage"] for r in rows]}
+        for section in ("technical", "credit", "structure", "market"):
+            for name in rows[0][section]:
+                columns[f"{section}.{name}"] = [r[section][name] for r in rows]
+
+        expected = score_all(ProjectBatch.from_projects(projects))
+        self.assertEqual(score_all(ProjectBatch.from_columns(columns)).tolist(), expected.tolist())
+        expected = score_all(ProjectBatch.from_projects(projects, precision="fp64"))
+        self.assertEqual(
+            ProjectParameters.score_portfolio(projects_from_columns(columns), precision="fp64").tolist(),
+            expected.tolist(),
+        )
+
+    def test_from_columns_fills_missing_columns_with_defaults(self):
+        batch = ProjectBatch.from_columns({"technical.capacity_factor": [0.2, 0.3]})
+        expected = ProjectBatch.from_projects([ProjectParameters(), ProjectParameters()])
+        np.testing.assert_allclose(batch.capacity_factor, [0.2, 0.3])
+        self.assertEqual(market_score_batch(batch).tolist(), market_score_batch(expected).tolist())
+        with self.assertRaises(ValueError):
+            ProjectBatch.from_columns({"unrelated": [1]})
+
+    def test_serialize_portfolio_round_trips(self):
+        rng = random.Random(3)
+        projects = [_random_params(rng) for _ in range(5)]
+        payload = json.loads(serialize_portfolio(projects))
+        self.assertEqual(payload, [p.to_dict() for p in projects])
+        restored = [ProjectParameters.from_dict(d) for d in payload]
+        self.assertEqual(restored, projects)
+
+    def test_categorical_fields_use_vocabulary_codes(self):
+        params = _default_params()
+        other = _default_params()
+        other.project_stage = "not_a_stage"
+        batch = ProjectBatch.from_projects([params, other])
+        self.assertEqual(batch.technology_code[0], TECHNOLOGY_CODES[params.technical.technology_type])
+        self.assertEqual(batch.project_stage_code.tolist(),
+                         [PROJECT_STAGE_CODES[params.project_stage], len(PROJECT_STAGE_CODES)])
+
+
+class TestLPOTitleXVII(unittest.TestCase):
+
+    def test_generate_is_memoized_without_instance_dict(self):
+        generator = LPOTitleXVIIGenerator(_default_params())
+        self.assertFalse(hasattr(generator, "__dict__"))
+        self.assertIs(generator.generate(), generator.generate())
+
+    def test_static_sections_are_read_only(self):
+        first = LPOTitleXVIIGenerator(_default_params()).generate()
+        with self.assertRaises(TypeError):
+            first["part_ii_full_application"]["section_title"] = "edited"
+        with self.assertRaises(TypeError):
+            first["application_fees"]["fees"][0]["amount"] = "edited"
+        self.assertIsInstance(first["application_metadata"]["technology_category"]["examples"], tuple)
+
+        second = LPOTitleXVIIGenerator(_default_params()).generate()
+        self.assertIs(second["part_ii_full_application"], first["part_ii_full_application"])
+        self.assertEqual(second["application_fees"]["fees"][0]["amount"], "$75,000")
+
+    def test_eligible_categories_keep_their_public_shape(self):
+        category = ELIGIBLE_CATEGORIES["renewable_energy"]
+        self.assertIsInstance(category, dict)
+        self.assertIsInstance(category["examples"], list)
+        reported = LPOTitleXVIIGenerator(_default_params()).generate()
+        self.assertEqual(reported["application_metadata"]["technology_category"]["label"], category["label"])
+
+
+class TestRUSForm201(unittest.TestCase):
+
+    def test_sections_build_on_first_access(self):
+        generator = RUSForm201Generator(_default_params())
+        with mock.patch.object(RUSForm201Generator, "_section_d") as section_d:
+            form = generator.sections()
+            fields = form["section_b_loan_request"]["fields"]
+            section_d.assert_not_called()
+        self.assertEqual(fields["loan_amount_numeric"], generator.fp.debt_amount)
+        self.assertIs(form["section_b_loan_request"], form["section_b_loan_request"])
+
+    def test_generate_returns_every_section_as_a_dict(self):
+        generator = RUSForm201Generator(_default_params())
+        full = generator.generate()
+        self.assertIsInstance(full, dict)
+        self.assertEqual(list(full), list(generator.sections()))
+        self.assertEqual(len(full), 11)
+        with self.assertRaises(KeyError):
+            generator.sections()["section_z"]
+
+    def test_reports_do_not_share_static_sections(self):
+        first = RUSForm201Generator(_default_params()).generate()
+        first["section_a_borrower_info"]["fields"]["contact_name"] = "edited"
+        first["section_g_environmental"]["fields"]["nepa_classification"] = "edited"
+        with self.assertRaises(TypeError):
+            first["supporting_documents"]["checklist"][0]["status"] = "edited"
+        with self.assertRaises(TypeError):
+            first["section_h_certifications"]["required_signatures"][0]["name"] = "edited"
+
+        second = RUSForm201Generator(_default_params()).generate()
+        self.assertEqual(second["section_a_borrower_info"]["fields"]["contact_name"], "[Contact Name]")
+        self.assertEqual(second["section_g_environmental"]["fields"]["nepa_classification"],
+                         "[To be determined by RUS]")
+        self.assertIs(second["supporting_documents"], first["supporting_documents"])
+        self.assertIs(second["section_h_certifications"], first["section_h_certifications"])
+
+    def test_streamed_json_matches_bytes(self):
+        generator = RUSForm201Generator(_default_params())
+        buf = io.StringIO()
+        generator.write_json(buf)
+        self.assertEqual(buf.getvalue().encode("utf-8"), generator.to_json_bytes())
+        fields = json.loads(buf.getvalue())["section_b_loan_request"]["fields"]
+        self.assertEqual(fields["loan_term_requested_years"], 20)
+
 
 if __name__ == "__main__":
     unittest.main()